@@ -0,0 +1,95 @@
+"""
+Benchmark multiworld progress aggregation across 10 to 1000 slots.
+
+Compares the per-player loop over merged location sets with ProgressTable aggregation
+(pure-Python backend, and NumPy backend when NumPy is installed).
+
+Usage (from the repository root):
+    python benchmarks/bench_progress_aggregation.py
+"""
+
+import os
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.progress_display import (
+    get_player_progress_data, calculate_total_game_progress, merge_real_time_tracking_data
+)
+from helpers.progress_table import ProgressTable, NUMPY_AVAILABLE
+from helpers.formatting_helpers import create_progress_bar
+
+SLOT_COUNTS = [10, 100, 1000]
+LOCATIONS_PER_SLOT = 500
+REPEATS = 5
+
+
+def build_world(slot_count: int):
+    """Random multiworld: players, save location checks, live checks, totals and activity."""
+    rng = random.Random(slot_count)
+    all_players = {slot: {"name": f"Player{slot}", "game": "Benchmark"} for slot in range(1, slot_count + 1)}
+    totals = {slot: LOCATIONS_PER_SLOT for slot in all_players}
+    save_checks = {
+        (0, slot): set(rng.sample(range(LOCATIONS_PER_SLOT), rng.randint(0, LOCATIONS_PER_SLOT)))
+        for slot in all_players
+    }
+    live_checks = {slot: set(rng.sample(range(LOCATIONS_PER_SLOT), 20)) for slot in all_players}
+    now = time.time()
+    activity = {(0, slot): now - rng.randint(0, 7 * 24 * 3600) for slot in all_players}
+    return all_players, totals, save_checks, live_checks, activity
+
+
+def build_table(use_numpy: bool, totals, save_checks, live_checks, activity) -> ProgressTable:
+    table = ProgressTable(use_numpy=use_numpy)
+    for (_, slot), locations in save_checks.items():
+        table.set_checked(slot, len(locations | live_checks[slot]))
+        table.set_total(slot, totals[slot])
+        table.set_activity(slot, activity[(0, slot)])
+    return table
+
+
+def run_loop(all_players, totals, save_checks, live_checks, activity, cutoff):
+    """The per-player path: merge sets, then loop for lines, totals and inactivity."""
+    location_checks = merge_real_time_tracking_data(save_checks, live_checks)
+    get_player_progress_data(all_players, location_checks, activity, None, False, totals.get, create_progress_bar)
+    calculate_total_game_progress(all_players, location_checks, totals.get)
+    [slot for slot in all_players
+     if len(location_checks[(0, slot)]) < totals[slot] and activity[(0, slot)] < cutoff]
+
+
+def run_table(table, all_players, totals, activity, cutoff):
+    """The columnar path: one pass per aggregate over the table."""
+    get_player_progress_data(all_players, {}, activity, None, False, totals.get, create_progress_bar,
+                             progress_table=table)
+    calculate_total_game_progress(all_players, {}, totals.get, progress_table=table)
+    table.inactive(all_players, cutoff)
+    table.ranked(all_players)
+
+
+def main():
+    cutoff = time.time() - 72 * 3600
+    backends = [("python", False)] + ([("numpy", True)] if NUMPY_AVAILABLE else [])
+    if not NUMPY_AVAILABLE:
+        print("NumPy not installed, benchmarking the pure-Python table only")
+
+    print(f"{'slots':>6} {'loop (ms)':>12} " + " ".join(f"{name + ' (ms)':>14}" for name, _ in backends))
+    for slot_count in SLOT_COUNTS:
+        world = build_world(slot_count)
+        all_players, totals, save_checks, live_checks, activity = world
+
+        loop_ms = min(timeit.repeat(lambda: run_loop(*world, cutoff), number=1, repeat=REPEATS)) * 1000
+        table_results = []
+        for _, use_numpy in backends:
+            table = build_table(use_numpy, totals, save_checks, live_checks, activity)
+            table_ms = min(timeit.repeat(lambda: run_table(table, all_players, totals, activity, cutoff),
+                                         number=1, repeat=REPEATS)) * 1000
+            table_results.append(table_ms)
+
+        print(f"{slot_count:>6} {loop_ms:>12.2f} " + " ".join(f"{ms:>14.2f}" for ms in table_results))
+
+
+if __name__ == "__main__":
+    main()
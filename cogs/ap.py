@@ -8,13 +8,14 @@ import asyncio
 from asyncio import sleep
 import json
 import zipfile
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from ruyaml import YAML
 import shutil
 from datetime import datetime
 import re
 import time
 import psutil
+from functools import partial
 
 # Import all helper functions
 from helpers.data_helpers import *
@@ -25,6 +26,16 @@ from helpers.progress_helpers import *
 from helpers.message_processors import *
 from helpers.progress_display import *
 from helpers.websocket_managers import *
+from helpers.event_journal import *
+from helpers.burst_summarizer import *
+from helpers.progress_state import *
+from helpers.location_bitset import *
+from helpers.hint_index import *
+from helpers.render_cache import *
+from helpers.report_pages import *
+from helpers.progress_dashboard import *
+from helpers.check_history import *
+from helpers.ap_sessions import *
 
 donkeyServer = discord.Object(id=591625815528177690)
 
@@ -35,6 +46,13 @@ class ApCog(commands.GroupCog, group_name="ap"):
     AP_DIR = "./Archipelago/"
     SYSTEM_EXTENSIONS = [".archipelago", ".txt", ".apsave"]
     STATUS_FILE = "./game_status.txt"
+    JOURNAL_DIR = "./journals/"
+    TRACKING_STATE_FILE = "./tracked_servers.json"
+    RESUME_STAGGER = 2.0  # Seconds between resumed tracker starts after a restart
+    DASHBOARD_INTERVAL = 30.0  # Minimum seconds between progress dashboard edits
+    CHECK_HISTORY_FILE = "./journals/check_history"  # .raw and .hourly sample files, suffixed with the seed once known
+    SLOT_SESSION_IDLE = 300.0  # Seconds a /ap gethint player connection is kept open unused
+    HINT_RESPONSE_TIMEOUT = 15.0
     DEFAULT_SERVER_URL = "ws://ap.rhelys.com:38281"
     
     def __init__(self, bot: commands.Bot) -> None:
@@ -44,8 +62,18 @@ class ApCog(commands.GroupCog, group_name="ap"):
         # Tracking variables - use bot instance for active_connections to persist across reloads
         # self.active_connections is kept as a property that references bot.active_ap_connections
         self.game_data: Dict[str, Dict] = {}
+        self.warm_game_data: Dict[str, Dict[str, Dict]] = {}  # server_url -> cached games awaiting a checksum check
         self.connection_data: Dict[str, Dict] = {}
-        self.player_progress: Dict[int, set] = {}
+        self.progress_state = ProgressState(self.location_index_for_slot)
+        self.hint_index = HintIndex()
+        self.render_cache = RenderCache()
+        self.dashboards: Dict[str, ProgressDashboard] = {}
+        self.progress_state.on_change = self.notify_dashboards
+        self.check_history = CheckHistory(self.CHECK_HISTORY_FILE)
+        self.check_history.load()
+        self.progress_state.history = self.check_history
+        self.burst_summarizers: Dict[str, ReleaseBurstSummarizer] = {}
+        self.slot_pool = SlotConnectionPool(self.SLOT_SESSION_IDLE)
         self.server_process = None
         self.player = ""
         self.game = ""
@@ -61,6 +89,32 @@ class ApCog(commands.GroupCog, group_name="ap"):
         """Reference to bot's persistent connection storage"""
         return self.bot.active_ap_connections
 
+    @property
+    def player_progress(self) -> Dict[int, set]:
+        """Live checked locations per player, maintained by the progress state"""
+        return self.progress_state.locations
+
+    def location_index_for_slot(self, player_id: int) -> Optional[LocationIndex]:
+        """Location index for a player's game, once both the slot info and DataPackage are known"""
+        for conn_data in self.connection_data.values():
+            player_info = conn_data.get("slot_info", {}).get(str(player_id))
+            if player_info:
+                game = player_info.get("game")
+                if game in self.game_data:
+                    return get_location_index(game, self.game_data[game])
+                return None
+        return None
+
+    def refresh_progress_state(self):
+        """Fold in the latest save snapshot if it changed. Returns the snapshot (or None)."""
+        snapshot = load_save_snapshot(self.output_directory, self.ap_directory)
+        self.progress_state.apply_save_snapshot(snapshot, get_player_total_locations)
+        return snapshot
+
+    def render_version(self, snapshot) -> Tuple:
+        """Data version for cached renders: save snapshot plus the live progress and hint versions"""
+        return (snapshot.version, self.progress_state.version, self.hint_index.version)
+
     async def cog_load(self):
         """Called when the cog is loaded - restore any existing connections"""
         print("ApCog loaded - checking for existing connections...")
@@ -76,6 +130,11 @@ class ApCog(commands.GroupCog, group_name="ap"):
                         print(f"Task for {server_url} has stopped, removing connection")
                         del self.active_connections[server_url]
                     else:
+                        # Tracking state lives on the cog, so rebuild it from the journal after a reload;
+                        # the listener is still appending, so only read it
+                        await self.restore_from_journal(server_url, read_only=True)
+                        if connection.get("dashboard_message_id"):
+                            self.attach_dashboard(server_url)
                         print(f"Restored connection to {server_url} in channel {channel.name}")
                 else:
                     print(f"Channel {connection['channel_id']} not found, removing connection {server_url}")
@@ -93,6 +152,12 @@ class ApCog(commands.GroupCog, group_name="ap"):
     async def cog_unload(self):
         """Called when the cog is unloaded - keep tasks running but log the state"""
         print(f"ApCog unloading - {len(self.active_connections)} connection(s) will persist")
+        for summarizer in self.burst_summarizers.values():
+            summarizer.cancel()
+        for dashboard in self.dashboards.values():
+            dashboard.stop()
+        self.check_history.close()
+        await self.slot_pool.close()
         for server_url in self.active_connections:
             print(f"  - {server_url} (task still running)")
 
@@ -112,76 +177,29 @@ class ApCog(commands.GroupCog, group_name="ap"):
         """
         # Handle "me" case
         if player_input.lower() == "me":
-            status_file = "game_status.json"
-            if not path.exists(status_file):
-                return None
-                
-            try:
-                with open(status_file, 'r') as f:
-                    game_status = json.load(f)
-                
-                # Get the list of player names for this Discord user
-                player_names = game_status.get("discord_users", {}).get(str(discord_user_id), [])
-                
-                if not player_names:
-                    return None
-                elif len(player_names) == 1:
-                    # If there's only one player, return it directly
-                    return player_names[0]
-                else:
-                    # If there are multiple players, return the list of names
-                    return player_names
-            except (json.JSONDecodeError, IOError):
-                return None
+            return self._single_or_list(get_player_index().players_for(discord_user_id))
         
         # Handle Discord mention case (e.g., <@123456789>)
         mention_match = re.match(r'<@!?(\d+)>', player_input)
         if mention_match:
-            mentioned_user_id = mention_match.group(1)
-            
-            status_file = "game_status.json"
-            if not path.exists(status_file):
-                return None
-                
-            try:
-                with open(status_file, 'r') as f:
-                    game_status = json.load(f)
-                
-                # Get the list of player names for the mentioned Discord user
-                player_names = game_status.get("discord_users", {}).get(mentioned_user_id, [])
-                
-                if not player_names:
-                    return None
-                elif len(player_names) == 1:
-                    # If there's only one player, return it directly
-                    return player_names[0]
-                else:
-                    # If there are multiple players, return the list of names
-                    return player_names
-            except (json.JSONDecodeError, IOError):
-                return None
+            return self._single_or_list(get_player_index().players_for(mention_match.group(1)))
         
-        # If it's a plain username with @ prefix, try to find a matching Discord user
+        # A plain username with @ prefix can't be matched: the status file doesn't store Discord usernames
         if player_input.startswith('@'):
-            username = player_input[1:]  # Remove the @ symbol
-            
-            status_file = "game_status.json"
-            if not path.exists(status_file):
-                return player_input  # Return original if we can't check
-                
-            try:
-                with open(status_file, 'r') as f:
-                    game_status = json.load(f)
-                
-                # We don't have direct access to Discord usernames in the status file,
-                # so we'll have to assume the original input for now
-                return player_input
-            except (json.JSONDecodeError, IOError):
-                return player_input
+            return player_input
         
         # Return original input if it's not a special case
         return player_input
 
+    @staticmethod
+    def _single_or_list(player_names: List[str]):
+        """A single player name as-is, several as a list, none as None"""
+        if not player_names:
+            return None
+        elif len(player_names) == 1:
+            return player_names[0]
+        return list(player_names)
+
     async def upload_success(self, filepath: str, interaction: discord.Interaction):
         with open(filepath, "rb") as submitted_file:
             await interaction.channel.send(
@@ -211,6 +229,264 @@ class ApCog(commands.GroupCog, group_name="ap"):
             
         return current_players
 
+    def start_tracking(self, server_url: str, channel_id: int, password: Optional[str], password_ref: str,
+                       resumed: bool = False, dashboard_message_id: Optional[int] = None) -> dict:
+        """
+        Register a tracked server and start its listener task, which first rebuilds its state from the journal.
+
+        resumed marks a server picked back up after a restart, so its first connection is
+        treated like a reconnect and doesn't repeat the connection and room announcements.
+        dashboard_message_id re-attaches a progress dashboard posted before the restart.
+        """
+        # Track the connection (stored in bot instance to persist across cog reloads)
+        connection = {
+            "task": None,
+            "channel_id": channel_id,
+            "password": password,  # Store password for automatic reconnection
+            "password_ref": password_ref,  # "host_yaml", "none" or "inline"
+            "websocket": None,
+            "journal": EventJournal(journal_path_for_server(server_url, self.JOURNAL_DIR)),
+            "announced": AnnouncementDedupe(),  # (sender, location) checks already handled
+            "resumed": resumed,
+            "connect_count": 0,
+            "dashboard_message_id": dashboard_message_id
+        }
+        self.active_connections[server_url] = connection
+
+        # Start the websocket listener task
+        connection["task"] = asyncio.create_task(self.websocket_listener(server_url, channel_id, password))
+        if dashboard_message_id:
+            self.attach_dashboard(server_url)
+        self.prewarm_admin_session(server_url)
+        self.persist_tracked_servers()
+        return connection
+
+    def prewarm_admin_session(self, server_url: str):
+        """Have the admin cog (if loaded) log in to a server in the background, ready for /apadmin commands.
+        The admin cog ignores servers the bot doesn't host."""
+        admin_cog = self.bot.get_cog("ApAdminCog")
+        if admin_cog:
+            admin_cog.prewarm(server_url)
+
+    async def release_admin_session(self, server_url: str):
+        """Stop keeping an admin session for a server that is shutting down."""
+        admin_cog = self.bot.get_cog("ApAdminCog")
+        if admin_cog:
+            await admin_cog.stop_keeping(server_url)
+
+    def persist_tracked_servers(self):
+        """
+        Write the current tracked-server definitions to the state file so a restart can resume them.
+        Servers tracked with a password given in the command are left out, so no password is written to disk.
+        """
+        servers = []
+        for server_url, connection in self.active_connections.items():
+            entry = {
+                "server_url": server_url,
+                "channel_id": connection["channel_id"],
+                "password_ref": connection.get("password_ref", "inline" if connection.get("password") else "none")
+            }
+            if entry["password_ref"] == "inline":
+                continue
+            if connection.get("dashboard_message_id"):
+                entry["dashboard_message_id"] = connection["dashboard_message_id"]
+            servers.append(entry)
+        save_tracked_servers(servers, self.TRACKING_STATE_FILE)
+
+    async def resume_tracked_servers(self):
+        """
+        Resume every server that was being tracked when the bot last stopped.
+
+        Servers are started concurrently with staggered starts, and the datapackage cache
+        is warmed before each listener starts so the first commands don't pay a cold start.
+        """
+        servers = load_tracked_servers(self.TRACKING_STATE_FILE)
+        if not servers:
+            return
+
+        await self.bot.wait_until_ready()
+        print(f"Resuming {len(servers)} tracked server(s) from {self.TRACKING_STATE_FILE}")
+
+        async def resume_server(index: int, entry: dict):
+            server_url = entry.get("server_url")
+            await asyncio.sleep(index * self.RESUME_STAGGER)
+            if not server_url or server_url in self.active_connections:
+                return
+
+            channel_id = entry.get("channel_id")
+            if not self.bot.get_channel(channel_id):
+                print(f"Channel {channel_id} not found, not resuming {server_url}")
+                return
+
+            password_ref = entry.get("password_ref", "none")
+            if password_ref == "inline":
+                # Written by older versions; the password isn't kept on disk any more
+                print(f"Not resuming {server_url}: it was tracked with an inline password, track it again")
+                return
+            try:
+                if password_ref == "host_yaml":
+                    password = get_server_password()
+                else:
+                    password = None
+            except Exception as e:
+                print(f"Server password error, not resuming {server_url}: {e}")
+                return
+
+            await self.warm_datapackage_cache(server_url, password)
+            self.start_tracking(server_url, channel_id, password, password_ref, resumed=True,
+                                dashboard_message_id=entry.get("dashboard_message_id"))
+            print(f"Resumed tracking {server_url} in channel {channel_id}")
+
+        results = await asyncio.gather(
+            *(resume_server(index, entry) for index, entry in enumerate(servers)), return_exceptions=True
+        )
+        for entry, result in zip(servers, results):
+            if isinstance(result, Exception):
+                print(f"Error resuming {entry.get('server_url')}: {result}")
+
+        # Drop definitions that couldn't be resumed
+        self.persist_tracked_servers()
+
+    async def warm_datapackage_cache(self, server_url: str, password: Optional[str]):
+        """
+        Load the cached datapackage for a server, fetching it from the server if there isn't one.
+        Its games are only used once the server's RoomInfo confirms their checksums (see adopt_warm_game_data).
+        """
+        if not is_datapackage_available():
+            if not await fetch_and_save_datapackage(server_url, password):
+                print(f"Failed to cache datapackage for {server_url}")
+                return
+
+        self.warm_game_data[server_url] = get_from_datapackage("game_data") or {}
+        for server_key, conn_data in (get_from_datapackage("connection_data") or {}).items():
+            self.connection_data.setdefault(server_key, conn_data)
+
+    def adopt_warm_game_data(self, server_url: str, checksums: Dict[str, str]):
+        """Move cached games whose checksum matches the server's into game_data; the rest are left to a fresh DataPackage"""
+        warm = self.warm_game_data.pop(server_url, None)
+        if not warm:
+            return
+        adopted = []
+        for game, data in warm.items():
+            checksum = checksums.get(game)
+            if checksum and data.get("checksum") == checksum and self.game_data.get(game, {}).get("checksum") != checksum:
+                self.game_data[game] = data
+                adopted.append(game)
+        print(f"Using cached DataPackage for {len(adopted)}/{len(warm)} game(s) on {server_url}")
+
+    def get_journal(self, server_url: str) -> EventJournal:
+        """Get the event journal for a tracked server, creating it if needed"""
+        connection = self.active_connections.get(server_url)
+        if connection is not None and connection.get("journal"):
+            return connection["journal"]
+
+        journal = EventJournal(journal_path_for_server(server_url, self.JOURNAL_DIR))
+        if connection is not None:
+            connection["journal"] = journal
+        return journal
+
+    async def restore_from_journal(self, server_url: str, read_only: bool = False) -> EventJournal:
+        """Replay a server's journal (off the event loop) and merge the rebuilt state into live tracking data"""
+        journal = self.get_journal(server_url)
+        try:
+            state = rebuild_tracking_state(await journal.load(read_only))
+        except Exception as e:
+            print(f"Error replaying journal for {server_url}: {e}")
+            return journal
+
+        if state["seed_name"]:
+            self.use_check_history(state["seed_name"])
+        for player_id, locations in state["player_progress"].items():
+            self.progress_state.merge(player_id, locations)
+
+        # Checks in the journal were already handled (and journaled) before the restart
+        announced = self.active_connections.get(server_url, {}).get("announced")
+        if announced is not None:
+            announced.update(state["announced"])
+
+        print(f"Restored {sum(len(locations) for locations in state['player_progress'].values())} "
+              f"location checks for {server_url} from journal (seed: {state['seed_name']})")
+        return journal
+
+    def use_check_history(self, seed_name: str):
+        """Point the check history at the seed's own files; other seeds' history stays on disk"""
+        file_path = check_history_path_for_seed(seed_name, self.CHECK_HISTORY_FILE)
+        if self.check_history.file_path != file_path:
+            self.check_history.switch(file_path)
+
+    async def record_tracked_event(self, server_url: str, msg: dict) -> bool:
+        """
+        Append a tracked message to the server's journal, resetting it if the seed changed.
+
+        Returns:
+            bool: False if the message is a check that was already handled and should be skipped
+        """
+        event = journal_event_from_message(msg)
+        if not event:
+            return True
+
+        connection = self.active_connections.get(server_url, {})
+        journal = self.get_journal(server_url)
+
+        if event["k"] == "item":
+            announced = connection.get("announced")
+            if announced is not None and not announced.add((event["s"], event["l"])):
+                print(f"Skipping duplicate ItemSend: player {event['s']} location {event['l']}")
+                return False
+
+        elif event["k"] == "room":
+            if event["seed"] == journal.seed_name:
+                return True  # Same game as before, nothing new to record
+            if journal.seed_name:
+                print(f"Seed changed for {server_url} ({journal.seed_name} -> {event['seed']}), resetting tracking state")
+                await journal.reset()
+                self.progress_state.reset()
+                self.hint_index.reset()
+                connection["announced"] = AnnouncementDedupe()
+            self.use_check_history(event["seed"])
+
+        journal.append(event)
+        return True
+
+    async def reconcile_after_reconnect(self, server_url: str, connected_msg: dict) -> bool:
+        """
+        Reconcile tracking state when a tracked server connection is resumed.
+
+        Checks that completed while disconnected are pulled in from the save snapshot and
+        marked as handled, so nothing is announced or counted twice.
+
+        Returns:
+            bool: True if the cached DataPackage still matches the server's checksums
+        """
+        connection = self.active_connections.get(server_url, {})
+        announced = connection.get("announced")
+
+        snapshot = load_save_snapshot(self.output_directory, self.ap_directory)
+        if snapshot:
+            merged = 0
+            for (team, slot), locations in snapshot.data.get("location_checks", {}).items():
+                if team != 0:  # Assuming team 0
+                    continue
+                player_locations = self.progress_state.slot_locations(slot)
+                new_locations = [location_id for location_id in locations if location_id not in player_locations]
+                self.progress_state.merge(slot, new_locations)
+                if announced is not None:
+                    announced.update((slot, location_id) for location_id in new_locations)
+                merged += len(new_locations)
+            print(f"Reconciled {merged} location checks for {server_url} from save snapshot {snapshot.version}")
+
+        # Only re-download the DataPackage if a game's checksum changed
+        checksums = connection.get("room_info", {}).get("datapackage_checksums", {})
+        games_in_use = {info.get("game") for info in connected_msg.get("slot_info", {}).values()}
+        games_in_use.discard("")
+        games_in_use.discard(None)
+        if not checksums or not games_in_use:
+            return False
+        return all(
+            game in checksums and self.game_data.get(game, {}).get("checksum") == checksums[game]
+            for game in games_in_use
+        )
+
     async def websocket_listener(self, server_url: str, channel_id: int, password: str = None):
         """Background task to listen to Archipelago websocket and forward messages to Discord channel"""
         channel = self.bot.get_channel(channel_id)
@@ -218,11 +494,117 @@ class ApCog(commands.GroupCog, group_name="ap"):
             print(f"Could not find channel with ID {channel_id}")
             return
 
-        # Delegate to the main websocket listener loop
-        await websocket_listener_main_loop(
-            server_url, channel, password, self.active_connections,
-            self.connection_data, self.process_ap_message
+        # Rebuild any state recorded for this server before the bot last stopped, before any new messages
+        journal = await self.restore_from_journal(server_url)
+        try:
+            # Delegate to the main websocket listener loop
+            await websocket_listener_main_loop(
+                server_url, channel, password, self.active_connections,
+                self.connection_data, partial(self.process_ap_message, server_url=server_url),
+                partial(self.reconcile_after_reconnect, server_url)
+            )
+        finally:
+            await journal.close()
+            self.check_history.flush()
+            summarizer = self.burst_summarizers.pop(server_url, None)
+            if summarizer:
+                summarizer.cancel()
+            # A listener that gave up or saw the game complete has removed itself from tracking
+            if server_url not in self.active_connections:
+                self.detach_dashboard(server_url)
+                self.persist_tracked_servers()
+
+    def attach_dashboard(self, server_url: str) -> Optional[ProgressDashboard]:
+        """Create (or return) the live progress dashboard for a tracked server"""
+        dashboard = self.dashboards.get(server_url)
+        if dashboard is not None:
+            return dashboard
+
+        connection = self.active_connections.get(server_url)
+        channel = self.bot.get_channel(connection["channel_id"]) if connection else None
+        if not channel:
+            return None
+
+        def remember_message(message_id: int):
+            connection["dashboard_message_id"] = message_id
+            self.persist_tracked_servers()
+
+        dashboard = ProgressDashboard(
+            channel, self.render_dashboard, self.DASHBOARD_INTERVAL,
+            message_id=connection.get("dashboard_message_id"), on_new_message=remember_message
         )
+        self.dashboards[server_url] = dashboard
+        return dashboard
+
+    def detach_dashboard(self, server_url: str):
+        """Stop updating a tracked server's dashboard (the last posted message is left as-is)"""
+        dashboard = self.dashboards.pop(server_url, None)
+        if dashboard:
+            dashboard.stop()
+
+    def notify_dashboards(self):
+        """Called by the progress state on every change; dashboards throttle and diff the edits themselves"""
+        for dashboard in self.dashboards.values():
+            dashboard.notify()
+
+    def tracked_players(self) -> Dict[int, Dict[str, str]]:
+        """Players from the live connection data as {player_id: {"name": ..., "game": ...}}"""
+        players = {}
+        for conn_data in self.connection_data.values():
+            for slot_id, player_info in conn_data.get("slot_info", {}).items():
+                players[int(slot_id)] = {
+                    "name": player_info.get("name", f"Player {slot_id}"),
+                    "game": player_info.get("game", "Unknown")
+                }
+        return players
+
+    def render_dashboard(self) -> str:
+        """Render the live progress dashboard from the progress counters"""
+        players = self.tracked_players()
+
+        # Totals are only computed once per slot; pick up any slot that joined since the last snapshot
+        missing_totals = [slot for slot in players if slot not in self.progress_state.totals]
+        if missing_totals:
+            snapshot = self.refresh_progress_state()
+            if snapshot:
+                self.progress_state.ensure_totals(missing_totals, snapshot.data, get_player_total_locations)
+
+        return format_dashboard(players, self.progress_state.table, self.create_progress_bar)
+
+    def get_burst_summarizer(self, server_url: str, channel) -> ReleaseBurstSummarizer:
+        """Get the release/collect burst summarizer for a tracked server, creating it if needed"""
+        summarizer = self.burst_summarizers.get(server_url)
+        if summarizer is None:
+            summarizer = ReleaseBurstSummarizer(partial(self.send_burst_summary, channel),
+                                                partial(self.announce_item_sends, channel))
+            self.burst_summarizers[server_url] = summarizer
+        return summarizer
+
+    async def announce_item_sends(self, channel, item_sends: List[list]):
+        """Announce ItemSends the burst summarizer held back without a burst following"""
+        for data in item_sends:
+            await process_item_send_message(
+                data, channel, self.progress_state.record_check,
+                self.lookup_player_name, self.lookup_player_game,
+                self.lookup_item_name, self.lookup_location_name, self.is_player_completed
+            )
+
+    async def send_burst_summary(self, channel, burst: ItemBurst):
+        """Post a single summary message for a finished release/collect burst"""
+        player_ids = {burst.slot}
+        for sender_id, recipient_id, _, _, _ in burst.items:
+            player_ids.add(sender_id)
+            player_ids.add(recipient_id)
+        players = lookup_players_batch(player_ids, self.connection_data)
+
+        async def resolve_item_names(item_requests):
+            # Item names are looked up in the recipient's game, all in one pass; the datapackage
+            # may be read from disk for this, so it runs off the event loop
+            item_names, _ = await asyncio.to_thread(lookup_names_batch, item_requests, (), self.game_data)
+            return item_names
+
+        # Sections go out as they fill, while later lines are still being formatted
+        await send_progress_sections(channel.send, stream_burst_summary(burst, players, resolve_item_names))
 
     def lookup_item_name(self, game: str, item_id: int) -> str:
         """
@@ -256,7 +638,7 @@ class ApCog(commands.GroupCog, group_name="ap"):
         """
         return lookup_player_game(player_id, self.connection_data)
 
-    async def process_ap_message(self, msg: dict, channel):
+    async def process_ap_message(self, msg: dict, channel, server_url: Optional[str] = None):
         """Process and format Archipelago messages for Discord
 
         Returns:
@@ -267,6 +649,14 @@ class ApCog(commands.GroupCog, group_name="ap"):
         # Debug: Print all received messages to console for troubleshooting
         print(f"AP Message received: {cmd} - {msg}")
 
+        # Persist tracked events before acting on them so a restart can replay them
+        connection = self.active_connections.get(server_url, {}) if server_url else {}
+        if server_url and not await self.record_tracked_event(server_url, msg):
+            return False
+
+        # Room and DataPackage details were already posted before a reconnect
+        resumed = connection.get("resumed", False)
+
         if cmd == "Connected":
             await process_connected_message(msg, channel, self.connection_data)
 
@@ -284,14 +674,31 @@ class ApCog(commands.GroupCog, group_name="ap"):
             msg_type = msg.get("type", "")
             data = msg.get("data", [])
 
+            # Keep the hint index current between save snapshots
+            if msg_type == "Hint":
+                self.hint_index.add_from_message(msg)
+
             # Skip chat messages from players
             if msg_type == "Chat":
                 print(f"Skipping chat message: {data}")
                 return False
 
             elif msg_type == "ItemSend":
+                # Items from a release/collect are tracked here and summarized once the burst ends
+                sender_id, recipient_id, item_id, item_flags, location_id = parse_item_send_data(data)
+                if recipient_id is None:
+                    recipient_id = sender_id  # Items a player finds for themselves name only the sender
+                if server_url and sender_id and location_id:
+                    summarizer = self.get_burst_summarizer(server_url, channel)
+                    # Key items are held briefly in case they're the start of a release
+                    payload = data if int(item_flags or 0) & 1 else None
+                    if summarizer.absorb(int(sender_id), int(recipient_id), int(item_id or 0),
+                                         int(item_flags or 0), int(location_id), payload):
+                        self.progress_state.record_check(int(sender_id), int(location_id))
+                        return False
+
                 await process_item_send_message(
-                    data, channel, self.player_progress, self.output_directory, self.AP_DIR,
+                    data, channel, self.progress_state.record_check,
                     self.lookup_player_name, self.lookup_player_game,
                     self.lookup_item_name, self.lookup_location_name, self.is_player_completed
                 )
@@ -303,6 +710,9 @@ class ApCog(commands.GroupCog, group_name="ap"):
 
             elif msg_type in ["Goal", "Release", "Collect", "Countdown"]:
                 await process_game_event_message(msg_type, data, channel)
+                # The server sends the release/collect notice before the items themselves
+                if msg_type in ["Release", "Collect"] and server_url and msg.get("slot") is not None:
+                    self.get_burst_summarizer(server_url, channel).start_burst(msg_type, msg["slot"])
 
             elif msg_type in ["Tutorial", "ServerChat"]:
                 # Check if this is a game completion message
@@ -318,10 +728,13 @@ class ApCog(commands.GroupCog, group_name="ap"):
             await process_room_update_message(msg, channel)
 
         elif cmd == "RoomInfo":
-            await process_room_info_message(msg, channel)
+            connection["room_info"] = msg
+            self.adopt_warm_game_data(server_url, msg.get("datapackage_checksums", {}))
+            if not resumed:
+                await process_room_info_message(msg, channel)
 
         elif cmd == "DataPackage":
-            await process_data_package_message(msg, channel, self.game_data)
+            await process_data_package_message(msg, channel if not resumed else None, self.game_data)
 
         # Handle any other message types by showing the command type
         else:
@@ -347,10 +760,14 @@ class ApCog(commands.GroupCog, group_name="ap"):
     ):
         await interaction.response.defer()
         
+        # Where the password came from, so a restart can resume without storing host.yaml secrets
+        password_ref = "inline" if password and password != "null" else "none"
+
         if not server_url:
             server_url = "ws://ap.rhelys.com:38281"  # Default server URL
             try:
                 password = get_server_password()  # Read password from file
+                password_ref = "host_yaml"
             except Exception as e:
                 await interaction.followup.send(f"❌ Server password error: {str(e)}")
                 return
@@ -398,21 +815,15 @@ class ApCog(commands.GroupCog, group_name="ap"):
             except Exception as dp_error:
                 logger.error(f"Error caching datapackage for tracking: {dp_error}")
         
-        # Start the websocket listener task
-        task = asyncio.create_task(self.websocket_listener(server_url, channel_id_int, password))
-
-        # Track the connection (stored in bot instance to persist across cog reloads)
-        self.active_connections[server_url] = {
-            "task": task,
-            "channel_id": channel_id_int,
-            "password": password,  # Store password for automatic reconnection
-            "websocket": None
-        }
+        self.start_tracking(server_url, channel_id_int, password, password_ref)
         
-        await interaction.followup.send(
+        message = (
             f"✅ Started tracking Archipelago server: {server_url}\n"
             f"Messages will be sent to: {target_channel.mention}"
         )
+        if password_ref == "inline":
+            message += "\n-# The password isn't saved, so run /ap track again for this server after a bot restart."
+        await interaction.followup.send(message)
 
     @app_commands.command(
         name="untrack",
@@ -444,9 +855,48 @@ class ApCog(commands.GroupCog, group_name="ap"):
         
         # Remove from tracking
         del self.active_connections[server_url]
+        self.detach_dashboard(server_url)
+        self.persist_tracked_servers()
         
         await interaction.followup.send(f"✅ Stopped tracking server: {server_url}")
 
+    @app_commands.command(
+        name="dashboard",
+        description="Post a live progress dashboard in this channel that updates itself as players check locations",
+    )
+    @app_commands.describe(enabled="Turn the dashboard on (default) or off")
+    async def ap_dashboard(self, interaction: discord.Interaction, enabled: bool = True):
+        await interaction.response.defer(ephemeral=True)
+
+        server_url = next(
+            (url for url, connection in self.active_connections.items()
+             if connection["channel_id"] == interaction.channel_id), None
+        )
+        if server_url is None:
+            await interaction.followup.send("❌ No server is being tracked in this channel. Use `/ap track` first.")
+            return
+        connection = self.active_connections[server_url]
+
+        if not enabled:
+            self.detach_dashboard(server_url)
+            connection["dashboard_message_id"] = None
+            self.persist_tracked_servers()
+            await interaction.followup.send(f"✅ Stopped the progress dashboard for {server_url}")
+            return
+
+        dashboard = self.attach_dashboard(server_url)
+        if dashboard is None:
+            await interaction.followup.send("❌ Could not find the tracking channel for this server.")
+            return
+
+        # Post (or refresh) right away; later updates are throttled to one edit per DASHBOARD_INTERVAL
+        self.refresh_progress_state()
+        dashboard.notify()
+        await interaction.followup.send(
+            f"✅ Progress dashboard enabled for {server_url}. "
+            f"It updates at most every {self.DASHBOARD_INTERVAL:.0f} seconds when progress changes."
+        )
+
     @app_commands.command(
         name="tracked",
         description="List all currently tracked Archipelago servers",
@@ -464,6 +914,18 @@ class ApCog(commands.GroupCog, group_name="ap"):
             channel_name = channel.mention if channel else f"Unknown Channel ({connection['channel_id']})"
             status = "🟢 Connected" if connection["websocket"] else "🟡 Connecting"
             tracked_list.append(f"• {server_url} → {channel_name} {status}")
+
+            # Connection health from the heartbeat
+            reconnects = max(connection.get("connect_count", 0) - 1, 0)
+            heartbeat = connection.get("heartbeat")
+            stats = heartbeat.stats() if heartbeat else {}
+            if stats.get("rtt_ms") is not None:
+                tracked_list.append(
+                    f"  └ RTT {stats['rtt_ms']:.0f} ms (p50 {stats['p50_ms']:.0f} / p95 {stats['p95_ms']:.0f} / "
+                    f"p99 {stats['p99_ms']:.0f}) · {stats['missed_pongs']} missed pong(s) · {reconnects} reconnect(s)"
+                )
+            else:
+                tracked_list.append(f"  └ RTT not measured yet · {reconnects} reconnect(s)")
         
         embed = discord.Embed(
             title="📡 Tracked Archipelago Servers",
@@ -585,12 +1047,8 @@ class ApCog(commands.GroupCog, group_name="ap"):
 
             # Check if player already exists
             if player_name in game_status["players"]:
-                existing_discord_user = None
                 # Find which Discord user owns this player
-                for discord_id, mapped_player in game_status["discord_users"].items():
-                    if mapped_player == player_name:
-                        existing_discord_user = discord_id
-                        break
+                existing_discord_user = get_player_index().owner_of(player_name)
                 
                 # If the same Discord user is updating their file, allow it
                 if existing_discord_user == str(interaction.user.id):
@@ -602,8 +1060,7 @@ class ApCog(commands.GroupCog, group_name="ap"):
                     }
                     
                     # Save updated game status
-                    with open(status_file, 'w') as f:
-                        json.dump(game_status, f, indent=2)
+                    save_game_status(game_status, status_file)
                     
                     # Set the player and game class variables before calling upload_success
                     self.player = player_name
@@ -634,9 +1091,8 @@ class ApCog(commands.GroupCog, group_name="ap"):
                 if player_name not in game_status["discord_users"][user_id_str]:
                     game_status["discord_users"][user_id_str].append(player_name)
                 
-                # Save updated game status
-                with open(status_file, 'w') as f:
-                    json.dump(game_status, f, indent=2)
+                # Save updated game status (this also updates the player index)
+                save_game_status(game_status, status_file)
                 
                 # Set the player and game class variables before calling upload_success
                 self.player = player_name
@@ -851,6 +1307,8 @@ class ApCog(commands.GroupCog, group_name="ap"):
         self.server_process = subprocess.Popen([r"serverstart.bat"])
         print(f"Started server process with PID: {self.server_process.pid}")
         await sleep(8)
+        clear_server_data_cache(self.DEFAULT_SERVER_URL)
+        self.prewarm_admin_session(self.DEFAULT_SERVER_URL)
 
         # Keep the server started message simple to avoid character limit issues
         try:
@@ -1107,9 +1565,7 @@ class ApCog(commands.GroupCog, group_name="ap"):
 
             # Clear the game status
             game_status = {"players": {}, "discord_users": {}}
-            
-            with open(status_file, 'w') as f:
-                json.dump(game_status, f, indent=2)
+            save_game_status(game_status, status_file)
 
             await interaction.followup.send("All player files have been deleted")
             return
@@ -1127,21 +1583,19 @@ class ApCog(commands.GroupCog, group_name="ap"):
             del players[resolved_name]
             
             # Remove from discord_users mapping
-            for user_id, player_list in discord_users.items():
-                if isinstance(player_list, list) and resolved_name in player_list:
-                    player_list.remove(resolved_name)
-                    # If the user has no more players, remove their entry entirely
-                    if not player_list:
-                        del discord_users[user_id]
-                    break
-                elif not isinstance(player_list, list) and player_list == resolved_name:
-                    # Handle legacy single-player format (backwards compatibility)
+            user_id = get_player_index().owner_of(resolved_name)
+            player_list = discord_users.get(user_id) if user_id else None
+            if isinstance(player_list, list) and resolved_name in player_list:
+                player_list.remove(resolved_name)
+                # If the user has no more players, remove their entry entirely
+                if not player_list:
                     del discord_users[user_id]
-                    break
+            elif player_list is not None and not isinstance(player_list, list) and player_list == resolved_name:
+                # Handle legacy single-player format (backwards compatibility)
+                del discord_users[user_id]
             
-            # Save updated game status
-            with open(status_file, 'w') as f:
-                json.dump(game_status, f, indent=2)
+            # Save updated game status (this also updates the player index)
+            save_game_status(game_status, status_file)
             
             display_name = "You have" if player.lower() == "me" else f"Player '{resolved_name}' has"
             await interaction.followup.send(f"{display_name} left the game.")
@@ -1177,6 +1631,9 @@ class ApCog(commands.GroupCog, group_name="ap"):
                     del self.active_connections[server_url]
                     untracked_servers.append(server_url)
 
+            # The server is going away, so stop keeping an admin login for it
+            await self.release_admin_session(self.DEFAULT_SERVER_URL)
+
             untrack_message = f"\nUntracked servers: {', '.join(untracked_servers)}" if untracked_servers else ""
 
             # Find and kill the MultiServer.py process
@@ -1308,6 +1765,8 @@ class ApCog(commands.GroupCog, group_name="ap"):
             self.server_process = subprocess.Popen([r"serverstart.bat"])
             print(f"Restarted server process with PID: {self.server_process.pid}")
             await sleep(8)  # Give server time to start
+            clear_server_data_cache(self.DEFAULT_SERVER_URL)
+            self.prewarm_admin_session(self.DEFAULT_SERVER_URL)
             
             try:
                 server_password = get_server_password()
@@ -1375,9 +1834,9 @@ class ApCog(commands.GroupCog, group_name="ap"):
         # Check if we have active connection data
         has_active_connection = bool(self.connection_data and self.game_data and self.player_progress)
 
-        # Load save data
-        save_data = load_apsave_data(self.output_directory, self.ap_directory)
-        if not save_data:
+        # Bring the progress counters up to date (the save is only decoded again if it changed)
+        snapshot = self.refresh_progress_state()
+        if not snapshot:
             await interaction.followup.send("❌ Could not load save data. Make sure the Archipelago server has a save file.")
             return
 
@@ -1387,83 +1846,130 @@ class ApCog(commands.GroupCog, group_name="ap"):
                 content="⚠️ **Warning**: Save file data may be from a previous game session.\n\n"
             )
 
-        # Load and validate game data
+        # Load and validate game data (status updates go to this interaction, so it isn't part of the shared render)
         all_players, game_data = await load_and_validate_game_data(
-            interaction, self.connection_data, self.game_data, save_data,
+            interaction, self.connection_data, self.game_data, snapshot.data,
             self.fetch_server_data, self.extract_player_data_from_save
         )
-
         if not all_players:
             await interaction.followup.send("❌ No players found in the current game.")
             return
 
+        # Check for save file mismatch; live and save checks are already merged in the progress state
+        await check_save_file_mismatch(interaction, has_active_connection, all_players, snapshot.data.get("location_checks", {}))
+
+        # Identical requests against the same data share one render; player names fall back to
+        # placeholders when no game data could be fetched, so that is part of the key
+        render_args = (tuple(sorted(target_players)) if target_players else None, has_active_connection, bool(game_data))
+        report = await self.render_cache.get_or_render(
+            "progress", render_args, self.render_version(snapshot),
+            lambda: self.render_progress(snapshot, all_players, target_players, original_player, has_active_connection)
+        )
+        await send_report(interaction, report)
+
+    async def render_progress(self, snapshot, all_players: Dict, target_players: Optional[List[str]],
+                              original_player: Optional[str], has_active_connection: bool) -> Tuple[ReportModel, bool]:
+        """
+        Render the /ap progress report. Shared between concurrent requests, so it doesn't touch any interaction.
+
+        Returns:
+            Tuple[ReportModel, bool]: (paginated report, whether it can be cached for other requests)
+        """
+        save_data = snapshot.data
+
         # Set up progress tracking
         show_specific_players = (target_players is not None)
-        location_checks = save_data.get("location_checks", {})
-
-        # Check for save file mismatch and merge real-time data
-        await check_save_file_mismatch(interaction, has_active_connection, all_players, location_checks)
-        location_checks = merge_real_time_tracking_data(location_checks, self.player_progress)
+        progress_state = self.progress_state
+        progress_state.ensure_totals(all_players, save_data, get_player_total_locations)
 
-        # Parse activity timers
-        activity_timer_dict = parse_activity_timers(save_data.get("client_activity_timers", ()))
+        location_checks = progress_state.location_checks_view()
 
         # Generate player progress data
         player_progress_data = get_player_progress_data(
-            all_players, location_checks, activity_timer_dict, target_players,
-            show_specific_players, lambda pid: get_player_total_locations(pid, save_data),
-            self.create_progress_bar
+            all_players, location_checks, progress_state.activity, target_players,
+            show_specific_players, progress_state.total, self.create_progress_bar,
+            progress_table=progress_state.table
         )
 
         # Handle case where specific players not found
         if show_specific_players and not player_progress_data:
-            error_message = format_progress_error_message(original_player, target_players, all_players)
-            await interaction.followup.send(error_message)
-            return
+            # Wording depends on how the player was referenced, so don't share it
+            return ReportModel.text(format_progress_error_message(original_player, target_players, all_players)), False
 
         # Sort and format progress data
         player_progress_data.sort(key=lambda x: x[0])
-        progress_lines = []
-
-        # Add header
         if has_active_connection:
-            progress_lines.append("📊 **Player Progress Report** (Live Tracking)\n")
+            report = ReportBuilder("📊 **Player Progress Report** (Live Tracking)\n")
         else:
-            progress_lines.append("📊 **Player Progress Report** (Save File Data)\n")
+            report = ReportBuilder("📊 **Player Progress Report** (Save File Data)\n")
 
-        # Add player progress lines
-        for _, player_line in player_progress_data:
-            progress_lines.append(player_line)
+        # One entry per player, so the jump menu can go straight to a player's page
+        for player_name, player_line in player_progress_data:
+            report.section(player_name)
+            report.add(player_line)
 
         # Calculate and add total progress if not showing specific players
         if not target_players:
             total_checked, total_locations, overall_percentage = calculate_total_game_progress(
-                all_players, location_checks, lambda pid: get_player_total_locations(pid, save_data)
+                all_players, location_checks, progress_state.total, progress_table=progress_state.table
             )
 
             if total_locations > 0:
                 total_progress_bar = self.create_progress_bar(overall_percentage)
-                progress_lines.extend([
+                report.footer_lines.extend([
                     "─" * 40,
                     "\n📈 **Total Game Progress**",
                     f"\n└ {total_checked}/{total_locations} locations ({overall_percentage:.1f}%)",
                     f"└ {total_progress_bar}"
                 ])
 
-        # Send progress report in chunks if needed
-        progress_message = "\n".join(progress_lines)
-        if len(progress_message) > 2000:
-            chunks = create_progress_sections(progress_lines[1:])  # Skip header
-            for i, chunk in enumerate(chunks):
-                content = "📊 **Player Progress Report**\n\n" + chunk if i == 0 else chunk
-                if i == 0:
-                    await interaction.followup.send(content)
-                else:
-                    await interaction.channel.send(content)
-        else:
-            await interaction.followup.send(progress_message)
+        return report.build(), True
     
     
+    @app_commands.command(
+        name="pace",
+        description="Shows how fast each player is checking locations, from the live check history",
+    )
+    @app_commands.describe(hours="Window to measure the check rate over, in hours (default: 1, max: 168)")
+    async def ap_pace(self, interaction: discord.Interaction, hours: int = 1):
+        await interaction.response.defer()
+
+        players = self.tracked_players()
+        if not players:
+            await interaction.followup.send("❌ No live player data. Use `/ap track` to start tracking a server first.")
+            return
+
+        # Each lookup is a binary search over the slot's history, no saves are read
+        hours = min(max(hours, 1), 168)
+        history = self.check_history
+        now = time.time()
+        rows = []
+        for player_id, player_info in players.items():
+            if player_info["name"].lower() == "rhelbot":
+                continue
+            recent = history.checks_since(player_id, now - hours * 3600, now)
+            daily = history.checks_since(player_id, now - 86400, now)
+            rows.append((recent, daily, player_id, player_info))
+        rows.sort(key=lambda row: (-row[0], -row[1], row[3]["name"].lower()))
+
+        report = ReportBuilder(f"⏱️ **Check Pace** (last {hours}h)\n")
+        for recent, daily, player_id, player_info in rows:
+            line = f"**{player_info['name']}** ({player_info['game']})\n└ {recent / hours:.1f} checks/h · {daily} in the last 24h"
+            last_check = history.last_check_time(player_id)
+            if last_check:
+                line += f" · last check <t:{int(last_check)}:R>"
+
+            # Rough time to finish at the last day's pace
+            remaining = self.progress_state.total(player_id) - self.progress_state.checked_count(player_id)
+            if self.progress_state.is_complete(player_id):
+                line += " · ✅ done"
+            elif daily > 0 and remaining > 0:
+                line += f" · ~{remaining / (daily / 24):.0f}h to go"
+            report.section(player_info["name"])
+            report.add(line + "\n")
+
+        await send_report(interaction, report.build())
+
     def parse_apsave_alternative(self, apsave_file):
         """
         Alternative method to parse .apsave file without full Archipelago dependencies
@@ -1541,7 +2047,32 @@ class ApCog(commands.GroupCog, group_name="ap"):
         Returns:
             Dictionary containing players and game_data, or None on failure
         """
-        return await fetch_server_data(server_url, password, save_datapackage)
+        # A tracked server already has an authenticated connection; only missing DataPackage games are requested over it
+        broker = get_connection_broker(server_url)
+        if broker.attached:
+            try:
+                players = broker.players()
+                game_data = await broker.datapackage((info["game"] for info in players.values()), self.game_data)
+                if save_datapackage:
+                    save_datapackage_locally(game_data, {server_url: {"slot_info": {str(k): v for k, v in players.items()}}})
+                server_data = {"players": players, "game_data": game_data}
+                self.adopt_server_data(server_data)
+                return server_data
+            except (asyncio.TimeoutError, ConnectionError) as e:
+                print(f"Tracker connection couldn't serve server data, connecting separately: {e}")
+        # Shared with any other command fetching the same server right now, and cached briefly
+        server_data = await fetch_server_data(server_url, password, save_datapackage)
+        if server_data:
+            self.adopt_server_data(server_data)
+        return server_data
+
+    def adopt_server_data(self, server_data: Dict):
+        """Keep fetched game and slot data in memory so later lookups don't need another fetch"""
+        # Fetched entries are current, so they replace what was there (e.g. after a new seed or apworld update)
+        self.game_data.update(server_data["game_data"])
+        # Slot info from a tracked connection is kept up to date by the tracker; only fill in when untracked
+        if not any(key != "temp_fetch" for key in self.connection_data):
+            self.connection_data["temp_fetch"] = {"slot_info": {str(k): v for k, v in server_data["players"].items()}}
     
     
     
@@ -1567,26 +2098,16 @@ class ApCog(commands.GroupCog, group_name="ap"):
         """
         return get_hint_cost(player_id, save_data, get_player_total_locations)
         
-    def is_player_completed(self, player_id: int, save_data: dict) -> bool:
+    def is_player_completed(self, player_id: int, save_data: Optional[dict] = None) -> bool:
         """Check if a player has completed 100% of their locations"""
-        # Get checked locations for this player from save data
-        # location_checks format: {(team, slot): set of location_ids}
-        save_locations = save_data.get("location_checks", {}).get((0, player_id), set())  # Assuming team 0
+        # The completed set is rebuilt once per save snapshot and kept current from live checks,
+        # so the save only needs loading here if nothing has applied one yet
+        if self.progress_state.save_version is None:
+            self.refresh_progress_state()
+        if save_data is not None and player_id not in self.progress_state.totals:
+            self.progress_state.ensure_totals([player_id], save_data, get_player_total_locations)
 
-        # Merge with real-time tracking data for most up-to-date information
-        real_time_locations = self.player_progress.get(player_id, set())
-        checked_locations = save_locations.union(real_time_locations)
-        checked_count = len(checked_locations)
-        
-        # Get total locations for this player
-        total_locations = get_player_total_locations(player_id, save_data)
-        
-        # Calculate completion percentage
-        if total_locations > 0:
-            percentage = (checked_count / total_locations) * 100
-            return percentage >= 100.0
-        
-        return False  # If we can't determine locations, assume not complete
+        return self.progress_state.is_complete(player_id)
 
     @app_commands.command(
         name="hints",
@@ -1622,35 +2143,21 @@ class ApCog(commands.GroupCog, group_name="ap"):
             else:
                 target_players = [resolved_player]
         
-        # Load save data to get hints
-        save_data = load_apsave_data()
-        if not save_data:
+        # Load save data to get hints (the snapshot is only decoded again if the save changed);
+        # this also brings the completed-player set up to date for the filters below
+        snapshot = self.refresh_progress_state()
+        if not snapshot:
             await interaction.followup.send("❌ Could not load save data. Make sure the Archipelago server has a save file.")
             return
         
-        # Get hints from save data
-        hints_data = save_data.get("hints", {})
-        if not hints_data:
+        # Fold any new or changed hints into the index
+        hint_index = self.hint_index
+        hint_index.apply_snapshot(snapshot)
+        if not len(hint_index):
             await interaction.followup.send("📝 No hints found in the current game.")
             return
         
-        # Extract all hints from the dictionary of sets and deduplicate
-        all_hints_set = set()
-        for hint_set in hints_data.values():
-            if isinstance(hint_set, set):
-                all_hints_set.update(hint_set)
-            elif isinstance(hint_set, (list, tuple)):
-                all_hints_set.update(hint_set)
-            elif hint_set:  # Single hint object
-                all_hints_set.add(hint_set)
-        
-        all_hints = list(all_hints_set)
-        
-        if not all_hints:
-            await interaction.followup.send("📝 No hints found in the current game.")
-            return
-        
-        # Get player and game data from save file or connection data
+        # Get player and game data from connection data or the server (status updates go to this interaction)
         all_players = {}
         game_data = {}
         
@@ -1673,74 +2180,39 @@ class ApCog(commands.GroupCog, group_name="ap"):
             if server_data:
                 all_players = server_data["players"]
                 game_data = server_data["game_data"]
-                
-                # Store the fetched data temporarily for lookups
-                self.game_data = game_data
-                self.connection_data["temp_fetch"] = {"slot_info": {str(k): v for k, v in all_players.items()}}
             else:
                 # Fallback: try to extract basic data from save file
-                all_players, game_data = extract_player_data_from_save(save_data)
+                all_players, game_data = extract_player_data_from_save(snapshot.data)
+        
+        # Identical requests against the same data share one render; without game data item and
+        # location names are placeholders, so that is part of the key
+        render_args = (tuple(sorted(target_players)) if target_players else None, exclude_found, bool(game_data))
+        report = await self.render_cache.get_or_render(
+            "hints", render_args, self.render_version(snapshot),
+            lambda: self.render_hints(snapshot, all_players, game_data, target_players, original_player, exclude_found)
+        )
+        await send_report(interaction, report)
+
+    async def render_hints(self, snapshot, all_players: Dict, game_data: Dict, target_players: Optional[List[str]],
+                           original_player: Optional[str], exclude_found: bool) -> Tuple[ReportModel, bool]:
+        """
+        Render the /ap hints report from the hint index. Hint entries are formatted lazily, so item
+        and location names are only looked up for pages someone actually views. Shared between
+        concurrent requests, so it doesn't touch any interaction.
+
+        Returns:
+            Tuple[ReportModel, bool]: (paginated report, whether it can be cached for other requests)
+        """
+        save_data = snapshot.data
+        hint_index = self.hint_index
         
-        # Filter hints for key items (item_flags = 1) and acceptable statuses
-        # Status filtering: Include "Found" and "Priority", exclude "No Priority" and "Avoid"
+        # Key item hints (item_flags = 1), read from the index
         # Note: For now, including all key item hints since status parsing isn't working correctly
-        key_item_hints = []
-        for hint in all_hints:
-            # Check if this is a Hint object with item_flags = 1 (progression items)
-            if hasattr(hint, 'item_flags') and hint.item_flags == 1:
-                # Apply exclude_found filter if requested
-                if exclude_found and hasattr(hint, 'found') and hint.found:
-                    continue  # Skip found hints when exclude_found is True
-                # For now, include all key item hints since status filtering isn't working properly
-                # TODO: Fix status parsing to properly filter by priority/found status
-                key_item_hints.append(hint)
-                    
-            elif isinstance(hint, (list, tuple)) and len(hint) >= 7:
-                # Handle tuple/list representation
-                item_flags = hint[6] if len(hint) > 6 else 0
-                if item_flags == 1:
-                    # Convert to a simple object for easier handling
-                    class SimpleHint:
-                        def __init__(self, data):
-                            self.receiving_player = data[0]
-                            self.finding_player = data[1]
-                            self.location = data[2]
-                            self.item = data[3]
-                            self.found = data[4]
-                            self.entrance = data[5] if len(data) > 5 else ""
-                            self.item_flags = data[6] if len(data) > 6 else 0
-                            self.status = data[7] if len(data) > 7 else 0
-                    
-                    simple_hint = SimpleHint(hint)
-                    # Apply exclude_found filter if requested
-                    if exclude_found and simple_hint.found:
-                        continue  # Skip found hints when exclude_found is True
-                    # Include all key item hints for now
-                    key_item_hints.append(simple_hint)
-                        
-            elif isinstance(hint, dict) and hint.get('item_flags', 0) == 1:
-                # Handle dictionary representation
-                class SimpleHint:
-                    def __init__(self, data):
-                        self.receiving_player = data.get('receiving_player', 0)
-                        self.finding_player = data.get('finding_player', 0)
-                        self.location = data.get('location', 0)
-                        self.item = data.get('item', 0)
-                        self.found = data.get('found', False)
-                        self.entrance = data.get('entrance', "")
-                        self.item_flags = data.get('item_flags', 0)
-                        self.status = data.get('status', 0)
-                
-                simple_hint = SimpleHint(hint)
-                # Apply exclude_found filter if requested
-                if exclude_found and simple_hint.found:
-                    continue  # Skip found hints when exclude_found is True
-                # Include all key item hints for now
-                key_item_hints.append(simple_hint)
+        # TODO: Fix status parsing to properly filter by priority/found status
+        key_item_hints = hint_index.query(exclude_found=exclude_found)
         
         if not key_item_hints:
-            await interaction.followup.send("📝 No hints found for key items in the current game.")
-            return
+            return ReportModel.text("📝 No hints found for key items in the current game."), True
         
         # If specific players are requested, filter hints and show hint points/cost for each
         if target_players:
@@ -1761,25 +2233,22 @@ class ApCog(commands.GroupCog, group_name="ap"):
                 available_players = [info["name"] for info in all_players.values() if info["name"].lower() != "rhelbot"]
                 
                 # Check if the original player input was "me" or a Discord mention for better error message
+                # (the wording depends on who asked, so these aren't cached)
                 if original_player and original_player.lower() == "me":
-                    await interaction.followup.send(
+                    return ReportModel.text(
                         f"❌ You don't have any players in this game.\n"
                         f"Available players: {', '.join(available_players)}"
-                    )
+                    ), False
                 elif original_player and (original_player.startswith('@') or original_player.startswith('<@')):
-                    await interaction.followup.send(
+                    return ReportModel.text(
                         f"❌ The mentioned Discord user doesn't have any players in this game.\n"
                         f"Available players: {', '.join(available_players)}"
-                    )
+                    ), False
                 else:
-                    await interaction.followup.send(
+                    return ReportModel.text(
                         f"❌ Player(s) '{', '.join(target_players)}' not found.\n"
                         f"Available players: {', '.join(available_players)}"
-                    )
-                return
-            
-            # Build the message for specific players
-            hint_lines = []
+                    ), False
             
             # Sort target players alphabetically by name
             sorted_target_players = sorted(target_player_data.items(), key=lambda x: x[1]["name"].lower())
@@ -1789,202 +2258,49 @@ class ApCog(commands.GroupCog, group_name="ap"):
                 target_player_id, target_player_info = list(target_player_data.items())[0]
                 target_player_name = target_player_info["name"]
                 
-                # Filter hints for this specific player (as the finding player)
-                player_hints = [hint for hint in key_item_hints if hint.finding_player == target_player_id]
-                
-                # Filter hints requested by this player (as the receiving player)
-                requested_hints = [hint for hint in key_item_hints if hint.receiving_player == target_player_id]
-                
                 # Get hint points and cost information (always show these)
                 hint_points = self.get_player_hint_points(target_player_id, save_data)
                 hint_cost = self.get_hint_cost(target_player_id, save_data)
                 
-                hint_lines.append(f"🔑 **Key Item Hints for {target_player_name}**")
-                hint_lines.append(f"💰 **Hint Points**: {hint_points}")
-                hint_lines.append(f"💸 **Next Hint Cost**: {hint_cost}")
-                hint_lines.append("")
-                
-                # Section 1: Hints this player has found for others
-                hint_lines.append("## 🔍 **Hint Locations for Others**")
-                if not player_hints:
-                    hint_lines.append("📝 No hints found by this player.")
-                else:
-                    # Sort hints by receiving player name
-                    sorted_hints = []
-                    for hint in player_hints:
-                        receiving_player_name = all_players.get(hint.receiving_player, {}).get("name", f"Player {hint.receiving_player}")
-                        sorted_hints.append((receiving_player_name.lower(), hint, receiving_player_name))
-                    
-                    sorted_hints.sort(key=lambda x: x[0])
-                    
-                    for _, hint, receiving_player_name in sorted_hints:
-                        # Look up item and location names
-                        receiving_game = all_players.get(hint.receiving_player, {}).get("game", "Unknown")
-                        finder_game = all_players.get(hint.finding_player, {}).get("game", "Unknown")
-                        
-                        # Get item name (from receiving player's game)
-                        item_name = self.lookup_item_name(receiving_game, hint.item) if game_data else f"Item {hint.item}"
-                        
-                        # Get location name (from finding player's game)
-                        location_name = self.lookup_location_name(finder_game, hint.location) if game_data else f"Location {hint.location}"
-                        
-                        # Status indicator
-                        status_indicator = " ✅" if hint.found else ""
-                        
-                        hint_lines.append(f"└ **{item_name}** → {receiving_player_name}")
-                        hint_lines.append(f"  📍 *{location_name}* {status_indicator}")
-                
-                hint_lines.append("")  # Empty line between sections
+                report = ReportBuilder(f"🔑 **Key Item Hints for {target_player_name}**")
+                report.summary_lines.append(f"💰 **Hint Points**: {hint_points}")
+                report.summary_lines.append(f"💸 **Next Hint Cost**: {hint_cost}")
+                report.summary_lines.append("")
                 
-                # Section 2: Hints this player has requested from others
-                hint_lines.append("## 🎯 **Hints Requested from Others**")
-                if not requested_hints:
-                    hint_lines.append("📝 No hints requested by this player.")
-                else:
-                    # Sort hints by finding player name
-                    sorted_requested_hints = []
-                    for hint in requested_hints:
-                        finding_player_id = hint.finding_player
-                        finding_player_name = all_players.get(finding_player_id, {}).get("name", f"Player {finding_player_id}")
-                        
-                        # Skip hints from players who have completed 100% of their locations
-                        if save_data and self.is_player_completed(finding_player_id, save_data):
-                            print(f"Skipping hint from player {finding_player_name} who has completed 100% of locations")
-                            continue
-                            
-                        sorted_requested_hints.append((finding_player_name.lower(), hint, finding_player_name))
-                    
-                    if not sorted_requested_hints:
-                        hint_lines.append("📝 No hints from players who have not completed their locations.")
-                    else:
-                        sorted_requested_hints.sort(key=lambda x: x[0])
-                        
-                        for _, hint, finding_player_name in sorted_requested_hints:
-                            # Look up item and location names
-                            receiving_game = all_players.get(hint.receiving_player, {}).get("game", "Unknown")
-                            finder_game = all_players.get(hint.finding_player, {}).get("game", "Unknown")
-                            
-                            # Get item name (from receiving player's game)
-                            item_name = self.lookup_item_name(receiving_game, hint.item) if game_data else f"Item {hint.item}"
-                            
-                            # Get location name (from finding player's game)
-                            location_name = self.lookup_location_name(finder_game, hint.location) if game_data else f"Location {hint.location}"
-                            
-                            # Status indicator
-                            status_indicator = " ✅" if hint.found else ""
-                            
-                            hint_lines.append(f"└ **{item_name}** ← {finding_player_name}")
-                            hint_lines.append(f"  📍 *{location_name}* {status_indicator}")
+                self.add_player_hint_sections(report, target_player_id, "##", all_players, save_data, exclude_found, bool(game_data))
             
             else:
                 # Multiple players - show them grouped by player
-                hint_lines.append("🔑 **Key Item Hints**\n")
+                report = ReportBuilder("🔑 **Key Item Hints**\n")
                 
                 for target_player_id, target_player_info in sorted_target_players:
                     target_player_name = target_player_info["name"]
                     target_player_game = target_player_info["game"]
                     
-                    # Filter hints for this specific player (as the finding player)
-                    player_hints = [hint for hint in key_item_hints if hint.finding_player == target_player_id]
-                    
-                    # Filter hints requested by this player (as the receiving player)  
-                    requested_hints = [hint for hint in key_item_hints if hint.receiving_player == target_player_id]
-                    
                     # Get hint points and cost information
                     hint_points = self.get_player_hint_points(target_player_id, save_data)
                     hint_cost = self.get_hint_cost(target_player_id, save_data)
                     
-                    hint_lines.append(f"## {target_player_name} ({target_player_game})")
-                    hint_lines.append(f"💰 **Hint Points**: {hint_points} | 💸 **Next Hint Cost**: {hint_cost}")
-                    hint_lines.append("")
-                    
-                    # Section 1: Hints this player has found for others
-                    hint_lines.append("### 🔍 **Hint Locations for Others**")
-                    if not player_hints:
-                        hint_lines.append("📝 No hints found by this player.")
-                    else:
-                        # Sort hints by receiving player name
-                        sorted_hints = []
-                        for hint in player_hints:
-                            receiving_player_name = all_players.get(hint.receiving_player, {}).get("name", f"Player {hint.receiving_player}")
-                            sorted_hints.append((receiving_player_name.lower(), hint, receiving_player_name))
-                        
-                        sorted_hints.sort(key=lambda x: x[0])
-                        
-                        for _, hint, receiving_player_name in sorted_hints:
-                            # Look up item and location names
-                            receiving_game = all_players.get(hint.receiving_player, {}).get("game", "Unknown")
-                            finder_game = all_players.get(hint.finding_player, {}).get("game", "Unknown")
-                            
-                            # Get item name (from receiving player's game)
-                            item_name = self.lookup_item_name(receiving_game, hint.item) if game_data else f"Item {hint.item}"
-                            
-                            # Get location name (from finding player's game)
-                            location_name = self.lookup_location_name(finder_game, hint.location) if game_data else f"Location {hint.location}"
-                            
-                            # Status indicator
-                            status_indicator = " ✅" if hint.found else ""
-                            
-                            hint_lines.append(f"└ **{item_name}** → {receiving_player_name}")
-                            hint_lines.append(f"  📍 *{location_name}* {status_indicator}")
-                    
-                    hint_lines.append("")  # Empty line between subsections
+                    report.section(target_player_name, f"## {target_player_name} ({target_player_game})")
+                    report.add(f"💰 **Hint Points**: {hint_points} | 💸 **Next Hint Cost**: {hint_cost}")
+                    report.add("")
                     
-                    # Section 2: Hints this player has requested from others
-                    hint_lines.append("### 🎯 **Hints Requested from Others**")
-                    if not requested_hints:
-                        hint_lines.append("📝 No hints requested by this player.")
-                    else:
-                        # Sort hints by finding player name
-                        sorted_requested_hints = []
-                        for hint in requested_hints:
-                            finding_player_id = hint.finding_player
-                            finding_player_name = all_players.get(finding_player_id, {}).get("name", f"Player {finding_player_id}")
-                            
-                            # Skip hints from players who have completed 100% of their locations
-                            if save_data and self.is_player_completed(finding_player_id, save_data):
-                                print(f"Skipping hint from player {finding_player_name} who has completed 100% of locations")
-                                continue
-                                
-                            sorted_requested_hints.append((finding_player_name.lower(), hint, finding_player_name))
-                        
-                        if not sorted_requested_hints:
-                            hint_lines.append("📝 No hints from players who have not completed their locations.")
-                        else:
-                            sorted_requested_hints.sort(key=lambda x: x[0])
-                            
-                            for _, hint, finding_player_name in sorted_requested_hints:
-                                # Look up item and location names
-                                receiving_game = all_players.get(hint.receiving_player, {}).get("game", "Unknown")
-                                finder_game = all_players.get(hint.finding_player, {}).get("game", "Unknown")
-                                
-                                # Get item name (from receiving player's game)
-                                item_name = self.lookup_item_name(receiving_game, hint.item) if game_data else f"Item {hint.item}"
-                                
-                                # Get location name (from finding player's game)
-                                location_name = self.lookup_location_name(finder_game, hint.location) if game_data else f"Location {hint.location}"
-                                
-                                # Status indicator
-                                status_indicator = " ✅" if hint.found else ""
-                                
-                                hint_lines.append(f"└ **{item_name}** ← {finding_player_name}")
-                                hint_lines.append(f"  📍 *{location_name}* {status_indicator}")
+                    self.add_player_hint_sections(report, target_player_id, "###", all_players, save_data, exclude_found,
+                                                  bool(game_data), section=target_player_name)
                     
-                    hint_lines.append("")  # Empty line between players
+                    report.add("")  # Empty line between players
         
         else:
             # Show all players' hints (original behavior)
-            # Group hints by finding player
+            # Hints grouped by finding player come straight from the index
             hints_by_finder = {}
-            for hint in key_item_hints:
-                finding_player = hint.finding_player
-                if finding_player not in hints_by_finder:
-                    hints_by_finder[finding_player] = []
-                hints_by_finder[finding_player].append(hint)
+            for finding_player in hint_index.finders():
+                finder_hints = hint_index.query(finder=finding_player, exclude_found=exclude_found)
+                if finder_hints:
+                    hints_by_finder[finding_player] = finder_hints
             
-            # Build the hints message
-            hint_lines = []
-            hint_lines.append("🔑 **Key Item Hints**\n")
+            # Build the hints report
+            report = ReportBuilder("🔑 **Key Item Hints**\n")
             
             # Sort finding players alphabetically
             sorted_finders = []
@@ -1998,7 +2314,7 @@ class ApCog(commands.GroupCog, group_name="ap"):
             
             for _, finding_player, finder_name in sorted_finders:
                 finder_game = all_players.get(finding_player, {}).get("game", "Unknown")
-                hint_lines.append(f"## {finder_name} ({finder_game})")
+                report.section(finder_name, f"## {finder_name} ({finder_game})")
                 
                 # Sort hints for this player by receiving player name
                 player_hints = hints_by_finder[finding_player]
@@ -2015,55 +2331,92 @@ class ApCog(commands.GroupCog, group_name="ap"):
                     sorted_hints.append((receiving_player_name.lower(), hint, receiving_player_name))
                 
                 if not sorted_hints:
-                    hint_lines.append("📝 No hints for players who have not completed their locations.")
+                    report.add("📝 No hints for players who have not completed their locations.")
                 else:
                     sorted_hints.sort(key=lambda x: x[0])
                     
                     for _, hint, receiving_player_name in sorted_hints:
-                        # Look up item and location names
-                        receiving_game = all_players.get(hint.receiving_player, {}).get("game", "Unknown")
-                        finder_game = all_players.get(hint.finding_player, {}).get("game", "Unknown")
-                        
-                        # Get item name (from receiving player's game)
-                        item_name = self.lookup_item_name(receiving_game, hint.item) if game_data else f"Item {hint.item}"
-                        
-                        # Get location name (from finding player's game)
-                        location_name = self.lookup_location_name(finder_game, hint.location) if game_data else f"Location {hint.location}"
-                        
-                        # Status indicator
-                        status_indicator = " ✅" if hint.found else ""
-                        
-                        hint_lines.append(f"└ **{item_name}** → {receiving_player_name}")
-                        hint_lines.append(f"  📍 *{location_name}* {status_indicator}")
+                        report.add_lazy(partial(self.format_hint_entry, hint, "→", receiving_player_name, all_players, bool(game_data)))
                 
-                hint_lines.append("")  # Empty line between players
+                report.add("")  # Empty line between players
+        
+        return report.build(), True
+
+    def add_player_hint_sections(self, report: ReportBuilder, player_id: int, heading: str, all_players: dict,
+                                 save_data: dict, exclude_found: bool, has_game_data: bool, section: Optional[str] = None):
+        """
+        Add a player's "Hint Locations for Others" and "Hints Requested from Others" sections to a hint report.
+        Without a section name, each of the two becomes its own jump target.
+        """
+        hint_index = self.hint_index
         
-        # Send the hints message
-        hints_message = "\n".join(hint_lines)
+        # Hints for this specific player (as the finding player)
+        player_hints = hint_index.query(finder=player_id, exclude_found=exclude_found)
         
-        # Split message if it's too long for Discord
-        if len(hints_message) > 2000:
-            # Send in chunks
-            chunks = []
-            current_chunk = "## 🔑 **Key Item Hints**\n\n"
+        # Hints requested by this player (as the receiving player)
+        requested_hints = hint_index.query(receiver=player_id, exclude_found=exclude_found)
+        
+        # Section 1: Hints this player has found for others
+        report.section(section or "Hint Locations for Others", f"{heading} 🔍 **Hint Locations for Others**")
+        if not player_hints:
+            report.add("📝 No hints found by this player.")
+        else:
+            # Sort hints by receiving player name
+            sorted_hints = []
+            for hint in player_hints:
+                receiving_player_name = all_players.get(hint.receiving_player, {}).get("name", f"Player {hint.receiving_player}")
+                sorted_hints.append((receiving_player_name.lower(), hint, receiving_player_name))
             
-            for line in hint_lines[1:]:  # Skip the header since we added it to current_chunk
-                if len(current_chunk + line + "\n") > 1900:  # Leave some buffer
-                    chunks.append(current_chunk)
-                    current_chunk = line + "\n"
-                else:
-                    current_chunk += line + "\n"
+            sorted_hints.sort(key=lambda x: x[0])
             
-            if current_chunk.strip():
-                chunks.append(current_chunk)
+            for _, hint, receiving_player_name in sorted_hints:
+                report.add_lazy(partial(self.format_hint_entry, hint, "→", receiving_player_name, all_players, has_game_data))
+        
+        report.add("")  # Empty line between sections
+        
+        # Section 2: Hints this player has requested from others
+        report.section(section or "Hints Requested from Others", f"{heading} 🎯 **Hints Requested from Others**")
+        if not requested_hints:
+            report.add("📝 No hints requested by this player.")
+            return
+        
+        # Sort hints by finding player name
+        sorted_requested_hints = []
+        for hint in requested_hints:
+            finding_player_id = hint.finding_player
+            finding_player_name = all_players.get(finding_player_id, {}).get("name", f"Player {finding_player_id}")
             
-            for i, chunk in enumerate(chunks):
-                if i == 0:
-                    await interaction.followup.send(chunk)
-                else:
-                    await interaction.channel.send(chunk)
+            # Skip hints from players who have completed 100% of their locations
+            if save_data and self.is_player_completed(finding_player_id, save_data):
+                print(f"Skipping hint from player {finding_player_name} who has completed 100% of locations")
+                continue
+                
+            sorted_requested_hints.append((finding_player_name.lower(), hint, finding_player_name))
+        
+        if not sorted_requested_hints:
+            report.add("📝 No hints from players who have not completed their locations.")
         else:
-            await interaction.followup.send(hints_message)
+            sorted_requested_hints.sort(key=lambda x: x[0])
+            
+            for _, hint, finding_player_name in sorted_requested_hints:
+                report.add_lazy(partial(self.format_hint_entry, hint, "←", finding_player_name, all_players, has_game_data))
+
+    def format_hint_entry(self, hint: Hint, arrow: str, other_player_name: str, all_players: dict, has_game_data: bool) -> str:
+        """Format one hint for a hint report; only called when the page it's on is viewed."""
+        # Look up item and location names
+        receiving_game = all_players.get(hint.receiving_player, {}).get("game", "Unknown")
+        finder_game = all_players.get(hint.finding_player, {}).get("game", "Unknown")
+        
+        # Get item name (from receiving player's game)
+        item_name = self.lookup_item_name(receiving_game, hint.item) if has_game_data else f"Item {hint.item}"
+        
+        # Get location name (from finding player's game)
+        location_name = self.lookup_location_name(finder_game, hint.location) if has_game_data else f"Location {hint.location}"
+        
+        # Status indicator
+        status_indicator = " ✅" if hint.found else ""
+        
+        return f"└ **{item_name}** {arrow} {other_player_name}\n  📍 *{location_name}* {status_indicator}"
 
     @app_commands.command(
         name="gethint",
@@ -2096,223 +2449,107 @@ class ApCog(commands.GroupCog, group_name="ap"):
             await interaction.followup.send("❌ Archipelago server is not running. Use `/ap start` to start the server first.")
             return
         
-        server_url = "ws://ap.rhelys.com:38281"
+        server_url = self.DEFAULT_SERVER_URL
+        
+        # The tracker's slot info gives the player's slot and game without a separate tracker handshake
+        player_slot, player_game = self.find_player_slot(resolved_name, server_url)
+        if player_slot is None:
+            server_data = await self.fetch_server_data(server_url, password)
+            if not server_data:
+                await interaction.followup.send("❌ Failed to connect to the Archipelago server to get player information.")
+                return
+            for slot_id, slot_data in server_data["players"].items():
+                if slot_data.get("name", "").lower() == resolved_name.lower():
+                    player_slot, player_game = int(slot_id), slot_data.get("game", "")
+                    break
+        if player_slot is None:
+            await interaction.followup.send(f"❌ Player '{resolved_name}' not found in the current game.")
+            return
         
         try:
-            # Connect to the Archipelago websocket server
-            websocket = await self._connect_to_server(server_url)
-            
-            # Variables to track the hint process
-            tracker_connection_established = False
-            player_connection_established = False
-            hint_response_received = False
-            player_game = None
-            player_slot = None
-            
+            # Reuses the player's connection from a recent /ap gethint if it's still open
             try:
-                # First connect as tracker to get player's game information
-                tracker_connect_msg = {
-                    "cmd": "Connect",
-                    "game": "",
-                    "password": password,
-                    "name": "Rhelbot",
-                    "version": {"major": 0, "minor": 6, "build": 0, "class": "Version"},
-                    "tags": ["Tracker"],
-                    "items_handling": 0b000,  # No items handling for tracker
-                    "uuid": __import__('uuid').getnode()
-                }
-                await websocket.send(json.dumps([tracker_connect_msg]))
-                
-                # Process messages with timeout
-                timeout_counter = 0
-                max_timeout = 30  # 30 seconds total timeout
-                
-                while timeout_counter < max_timeout and not hint_response_received:
-                    try:
-                        message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                        data = json.loads(message)
-                        
-                        for msg in data:
-                            cmd = msg.get("cmd", "")
-                            
-                            if cmd == "Connected" and not tracker_connection_established:
-                                tracker_connection_established = True
-                                
-                                # Extract player information
-                                slot_info = msg.get("slot_info", {})
-                                
-                                # Find the player's slot and game
-                                for slot_id, slot_data in slot_info.items():
-                                    if slot_data.get("name", "").lower() == resolved_name.lower():
-                                        player_slot = int(slot_id)
-                                        player_game = slot_data.get("game", "")
-                                        break
-                                
-                                if player_slot is None:
-                                    await interaction.followup.send(f"❌ Player '{resolved_name}' not found in the current game.")
-                                    return
-                                
-                                # Close tracker connection and reconnect as player
-                                await websocket.close()
-                                
-                                # Reconnect as the specific player
-                                websocket = await self._connect_to_server(server_url)
-                                
-                                player_connect_msg = {
-                                    "cmd": "Connect",
-                                    "game": player_game,  # Use the player's actual game
-                                    "password": password,
-                                    "name": resolved_name,
-                                    "version": {"major": 0, "minor": 6, "build": 0, "class": "Version"},
-                                    "tags": [],
-                                    "items_handling": 0b111,  # Full items handling for player connection
-                                    "uuid": __import__('uuid').getnode()
-                                }
-                                await websocket.send(json.dumps([player_connect_msg]))
-                                
-                            elif cmd == "Connected" and tracker_connection_established and not player_connection_established:
-                                player_connection_established = True
-                                
-                                # Send initial status to confirm connection
-                                await interaction.followup.send(f"🔍 Connected as **{resolved_name}** ({player_game}). Requesting hint for **{item_name}**...")
-                                
-                                # Send the hint command
-                                await websocket.send(json.dumps([{"cmd": "Say", "text": f"!hint {item_name}"}]))
-                                
-                            elif cmd == "ConnectionRefused":
-                                errors = msg.get("errors", ["Unknown error"])
-                                await interaction.followup.send(f"❌ Connection refused: {', '.join(errors)}")
-                                return
-                                
-                            elif cmd == "PrintJSON" and player_connection_established:
-                                # Look for hint response in the print messages
-                                msg_type = msg.get("type", "")
-                                data_parts = msg.get("data", [])
-                                
-                                # Build the text from data parts
-                                text_parts = []
-                                for part in data_parts:
-                                    if isinstance(part, dict) and "text" in part:
-                                        text_parts.append(part["text"])
-                                    elif isinstance(part, str):
-                                        text_parts.append(part)
-                                
-                                full_text = "".join(text_parts)
-                                
-                                # Skip our own hint command message
-                                if full_text.strip() == f"!hint {item_name}":
-                                    print(f"Skipping our own hint command: {full_text}")
-                                    continue
-                                
-                                # Skip messages that are just the player's own command
-                                if full_text.strip().startswith(f"{resolved_name}:") and "!hint" in full_text:
-                                    print(f"Skipping player's own command echo: {full_text}")
-                                    continue
-                                
-                                # Check if this is a hint response (look for various hint indicators)
-                                hint_indicators = [
-                                    "found at",
-                                    "is at",
-                                    "you already know",
-                                    "not enough points", 
-                                    "no such item",
-                                    "cannot afford",
-                                    "item does not exist",
-                                    "already hinted"
-                                ]
-                                
-                                # Also check if the message contains the item name and typical hint response patterns
-                                contains_item = item_name.lower() in full_text.lower()
-                                has_hint_pattern = any(indicator in full_text.lower() for indicator in hint_indicators)
-                                
-                                # Look for location/hint information patterns
-                                location_patterns = [
-                                    " in ",
-                                    " at ",
-                                    " from ",
-                                    " (world ",
-                                    " - "
-                                ]
-                                has_location_info = any(pattern in full_text.lower() for pattern in location_patterns)
-                                
-                                # Check if this looks like a server response (not just our command)
-                                is_server_response = (
-                                    (contains_item and (has_hint_pattern or has_location_info)) or
-                                    has_hint_pattern
-                                ) and full_text.strip() and not full_text.startswith("!")
-                                
-                                if is_server_response:
-                                    print(f"Detected hint response: {full_text}")
-                                    hint_result = full_text
-                                    hint_response_received = True
-                                    
-                                    # Try to resolve names from IDs in the response
-                                    processed_hint_result = await self.process_hint_response(full_text, player_game)
-                                    
-                                    # Determine response type for appropriate color
-                                    if "not enough points" in full_text.lower() or "cannot afford" in full_text.lower():
-                                        color = 0xff0000  # Red for insufficient points
-                                        title = f"❌ Insufficient Points for {item_name}"
-                                    elif "no such item" in full_text.lower() or "item does not exist" in full_text.lower():
-                                        color = 0xffa500  # Orange for item not found
-                                        title = f"⚠️ Item Not Found: {item_name}"
-                                    elif "you already know" in full_text.lower() or "already hinted" in full_text.lower():
-                                        color = 0x0099ff  # Blue for already known
-                                        title = f"ℹ️ Already Known: {item_name}"
-                                    else:
-                                        color = 0x00ff00  # Green for successful hint
-                                        title = f"🔍 Hint for {item_name}"
-                                    
-                                    # Create response embed
-                                    embed = discord.Embed(
-                                        title=title,
-                                        description=f"**Player:** {resolved_name} ({player_game})",
-                                        color=color
-                                    )
-                                    
-                                    # Add only the processed hint response from server
-                                    embed.add_field(name="Server Response", value=processed_hint_result, inline=False)
-                                    
-                                    await interaction.followup.send(embed=embed)
-                                    break
-                                else:
-                                    print(f"Skipping non-hint message: {full_text}")
-                        
-                    except asyncio.TimeoutError:
-                        timeout_counter += 1
-                        continue
-                
-                # Check if we got a response
-                if not hint_response_received and player_connection_established:
+                session = await self.slot_pool.get(server_url, resolved_name, player_game, password)
+            except ConnectionRefusedError as e:
+                await interaction.followup.send(f"❌ Connection refused: {e}")
+                return
+            except Exception as e:
+                print(f"Error connecting as {resolved_name}: {e}")
+                await interaction.followup.send(f"❌ Failed to connect to the Archipelago server as **{resolved_name}**. Make sure the player name is correct and exists in the current game.")
+                return
+            
+            # One hint at a time per slot, so each reply goes to the command that asked for it
+            async with session.lock:
+                try:
+                    msg = await session.request(
+                        [{"cmd": "Say", "text": f"!hint {item_name}"}],
+                        partial(is_hint_response, item_name=item_name, player_name=resolved_name),
+                        timeout=self.HINT_RESPONSE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
                     await interaction.followup.send(
                         f"❌ No hint response received for **{item_name}**. "
                         f"The item may not exist, may already be found, or the server may be unresponsive."
                     )
-                elif not tracker_connection_established:
-                    await interaction.followup.send("❌ Failed to connect to the Archipelago server to get player information.")
-                elif not player_connection_established:
-                    await interaction.followup.send(f"❌ Failed to connect to the Archipelago server as **{resolved_name}**. Make sure the player name is correct and exists in the current game.")
-                    
-            finally:
-                await websocket.close()
+                    return
+            
+            full_text = printjson_text(msg)
+            print(f"Detected hint response: {full_text}")
+            
+            # Resolve names from the IDs in the response
+            # Slot IDs only mean something on this server; its Connected message has them if it isn't tracked
+            slot_info = (self.connection_data.get(server_url, {}).get("slot_info")
+                         or (session.connected_msg or {}).get("slot_info", {}))
+            processed_hint_result = await self.process_hint_response(msg, player_game, slot_info)
+            
+            # Determine response type for appropriate color
+            if "not enough points" in full_text.lower() or "cannot afford" in full_text.lower():
+                color = 0xff0000  # Red for insufficient points
+                title = f"❌ Insufficient Points for {item_name}"
+            elif "no such item" in full_text.lower() or "item does not exist" in full_text.lower():
+                color = 0xffa500  # Orange for item not found
+                title = f"⚠️ Item Not Found: {item_name}"
+            elif "you already know" in full_text.lower() or "already hinted" in full_text.lower():
+                color = 0x0099ff  # Blue for already known
+                title = f"ℹ️ Already Known: {item_name}"
+            else:
+                color = 0x00ff00  # Green for successful hint
+                title = f"🔍 Hint for {item_name}"
+            
+            # Create response embed
+            embed = discord.Embed(
+                title=title,
+                description=f"**Player:** {resolved_name} ({player_game})",
+                color=color
+            )
+            
+            # Add only the processed hint response from server
+            embed.add_field(name="Server Response", value=processed_hint_result, inline=False)
+            
+            await interaction.followup.send(embed=embed)
                 
         except Exception as e:
             await interaction.followup.send(f"❌ Error getting hint: {str(e)}")
 
-    async def process_hint_response(self, hint_text: str, player_game: str) -> str:
-        """Process hint response to resolve item and location names from IDs"""
+    def find_player_slot(self, player_name: str, server_url: str) -> Tuple[Optional[int], Optional[str]]:
+        """Find a player's (slot, game) by name in a tracked server's slot info, or (None, None)."""
+        conn_data = self.connection_data.get(server_url, {})
+        for slot_id, slot_data in conn_data.get("slot_info", {}).items():
+            if slot_data.get("name", "").lower() == player_name.lower():
+                return int(slot_id), slot_data.get("game", "")
+        return None, None
+
+    async def process_hint_response(self, msg: Dict, player_game: str, slot_info: Dict) -> str:
+        """Render a hint response with item, location and player names resolved from its IDs, using one server's slot info"""
         # Get game data if needed
         if not self.game_data:
-            server_data = await self.fetch_server_data()
-            if server_data and server_data.get("game_data"):
-                self.game_data = server_data["game_data"]
+            await self.fetch_server_data()
         
         return await process_hint_response(
-            hint_text, 
+            msg, 
             player_game, 
             self.game_data, 
-            self.lookup_item_name, 
-            self.lookup_location_name, 
+            slot_info, 
             self.fetch_server_data
         )
 
@@ -2330,15 +2567,15 @@ class ApCog(commands.GroupCog, group_name="ap"):
             await interaction.followup.send("❌ Archipelago server is not running. Use `/ap start` to start the server first.")
             return
             
-        # Load save data
-        save_data = load_apsave_data(self.output_directory, self.ap_directory)
-        if not save_data:
+        # Bring the progress counters up to date (the save is only decoded again if it changed)
+        snapshot = self.refresh_progress_state()
+        if not snapshot:
             await interaction.followup.send("❌ Could not load save data. Make sure the Archipelago server has a save file.")
             return
+        save_data = snapshot.data
         
-        # Load game status to map players to Discord users
-        game_status = load_game_status()
-        discord_users = game_status.get("discord_users", {})
+        # Players are mapped to Discord users through the player index
+        player_index = get_player_index()
         
         # Get player and game data
         all_players = {}
@@ -2366,70 +2603,37 @@ class ApCog(commands.GroupCog, group_name="ap"):
             await interaction.followup.send("❌ No players found in the current game.")
             return
         
-        # Get activity timers and location checks
-        client_activity_timers = save_data.get("client_activity_timers", ())
-        location_checks = save_data.get("location_checks", {})
-
-        # Merge with real-time tracking data for most up-to-date information
-        for player_id, real_time_locations in self.player_progress.items():
-            save_locations = location_checks.get((0, player_id), set())
-            merged_locations = save_locations.union(real_time_locations)
-            location_checks[(0, player_id)] = merged_locations
-        
-        # Convert activity timers to dictionary
-        activity_timer_dict = {}
-        if isinstance(client_activity_timers, (list, tuple)):
-            for entry in client_activity_timers:
-                if isinstance(entry, (list, tuple)) and len(entry) >= 2:
-                    player_key, timestamp = entry[0], entry[1]
-                    if isinstance(player_key, (list, tuple)) and len(player_key) >= 2:
-                        team, slot = player_key[0], player_key[1]
-                        activity_timer_dict[(team, slot)] = timestamp
+        # Activity timers and merged location checks come from the progress state
+        progress_state = self.progress_state
+        progress_state.ensure_totals(all_players, save_data, get_player_total_locations)
+        activity_timer_dict = progress_state.activity
         
         # Calculate 72 hours ago timestamp
         seventy_two_hours_ago = time.time() - (72 * 60 * 60)
         
-        # Find offending players
+        # Find offending players: unfinished and inactive, filtered over the whole table in one pass
         offending_players = []
+        candidate_ids = [player_id for player_id, player_info in all_players.items()
+                         if player_info["name"].lower() != "rhelbot"]  # Skip the Rhelbot tracker
         
-        for player_id, player_info in all_players.items():
-            player_name = player_info["name"]
-            player_game = player_info["game"]
-            
-            # Skip the Rhelbot tracker
-            if player_name.lower() == "rhelbot":
-                continue
-            
-            # Check if player has finished their game
-            checked_locations = location_checks.get((0, player_id), set())
-            total_locations = get_player_total_locations(player_id, save_data)
-            
-            if total_locations > 0:
-                percentage = (len(checked_locations) / total_locations) * 100
-                is_complete = percentage >= 100.0
-                
-                # Skip completed players
-                if is_complete:
-                    continue
-            
-            # Check last activity time
+        # The save's activity timers can lag behind; players with a live check since the cutoff aren't inactive
+        inactive_ids = [player_id for player_id in progress_state.table.inactive(candidate_ids, seventy_two_hours_ago)
+                        if (self.check_history.last_check_time(player_id) or 0) < seventy_two_hours_ago]
+
+        for player_id in inactive_ids:
+            player_name = all_players[player_id]["name"]
+            player_game = all_players[player_id]["game"]
             last_activity_timestamp = activity_timer_dict.get((0, player_id))
             
-            # If no activity timestamp, consider them inactive
-            if not last_activity_timestamp or last_activity_timestamp < seventy_two_hours_ago:
-                # Find Discord user for this player
-                discord_user_id = None
-                for user_id, user_players in discord_users.items():
-                    if player_name in user_players:
-                        discord_user_id = user_id
-                        break
-                
-                offending_players.append({
-                    "player_name": player_name,
-                    "player_game": player_game,
-                    "discord_user_id": discord_user_id,
-                    "last_activity": last_activity_timestamp
-                })
+            # Find Discord user for this player
+            discord_user_id = player_index.owner_of(player_name)
+            
+            offending_players.append({
+                "player_name": player_name,
+                "player_game": player_game,
+                "discord_user_id": discord_user_id,
+                "last_activity": last_activity_timestamp
+            })
         
         # Build shame message
         if not offending_players:
@@ -2,18 +2,15 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
-import websockets
-from websockets.protocol import State
-import json
-import logging
-from typing import Optional, Dict, Any
+import time
 from datetime import datetime
-import uuid
+from typing import Optional, Dict, Callable
 from ruyaml import YAML
 
 # Import helper functions from the ap.py cog
-from helpers.server_helpers import get_server_password, is_server_running, connect_to_server, get_server_port
-from helpers.lookup_helpers import lookup_item_name, lookup_player_name
+from helpers.server_helpers import get_server_password, is_server_running, get_server_port
+from helpers.websocket_managers import WebSocketConnectionManager
+from helpers.ap_sessions import AdminSession
 
 donkeyServer = discord.Object(id=591625815528177690)
 
@@ -24,16 +21,82 @@ class ApAdminCog(commands.GroupCog, group_name="apadmin"):
     # Class constants
     DEFAULT_SERVER_URL = "ws://ap.rhelys.com:38281"
     AUTHORIZED_USER_ID = 187800991675056129  # Only this Discord user can use admin commands
+    MIN_SESSION_UPTIME = 60.0  # seconds a background admin session must last before its backoff resets
     
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         super().__init__()
         
         # Admin session tracking
-        self.admin_sessions: Dict[str, Dict] = {}  # server_url -> session_info
+        self.admin_sessions: Dict[str, AdminSession] = {}  # server_url -> logged-in session
+        self.session_locks: Dict[str, asyncio.Lock] = {}
+        self.session_keepers: Dict[str, asyncio.Task] = {}  # server_url -> background login task
+        self.connection_manager = WebSocketConnectionManager()  # backoff for background logins
         self.game_data: Dict[str, Dict] = {}  # Shared game data
-        
-        logger = logging.getLogger(__name__)
+    
+    async def cog_load(self):
+        """Log in to tracked servers the bot hosts, so the first admin command doesn't wait for it."""
+        for server_url in getattr(self.bot, "active_ap_connections", {}):
+            self.prewarm(server_url)
+    
+    async def cog_unload(self):
+        for server_url in list(self.session_keepers):
+            await self.stop_keeping(server_url)
+    
+    def hosted_server_urls(self) -> set:
+        """URLs of the servers this bot hosts, the only ones the local admin password belongs to."""
+        urls = {self.DEFAULT_SERVER_URL}
+        for game_number in range(1, 4):
+            try:
+                urls.add(f"ws://ap.rhelys.com:{get_server_port(game_number=game_number)}")
+            except Exception as e:
+                print(f"Could not get the server port for Game {game_number}: {e}")
+        return urls
+    
+    def prewarm(self, server_url: str = None):
+        """Open an admin session for one of the bot's own servers in the background and keep it logged in."""
+        if server_url is None:
+            server_url = self.DEFAULT_SERVER_URL
+        if server_url not in self.hosted_server_urls():
+            # Tracked rooms hosted elsewhere never get the local admin password
+            return
+        keeper = self.session_keepers.get(server_url)
+        if keeper and not keeper.done():
+            return
+        self.session_keepers[server_url] = asyncio.create_task(self.keep_admin_session(server_url))
+    
+    async def keep_admin_session(self, server_url: str):
+        """
+        Keep a logged-in admin session open for a server, logging back in whenever it drops.
+        A session that drops within MIN_SESSION_UPTIME counts as a failed attempt, so a server
+        that accepts the login and then closes the connection is retried with backoff.
+        """
+        attempts = 0
+        while True:
+            session = await self.get_admin_session(server_url)
+            if session is not None:
+                await session.wait_closed()
+                uptime = (datetime.now() - session.logged_in_at).total_seconds() if session.logged_in_at else 0.0
+                if uptime >= self.MIN_SESSION_UPTIME:
+                    attempts = 0
+                    print(f"Admin session for {server_url} dropped, logging back in")
+                    continue
+                print(f"Admin session for {server_url} dropped right after login")
+            
+            attempts += 1
+            if attempts >= self.connection_manager.max_reconnect_attempts or not is_server_running():
+                print(f"Giving up on a background admin session for {server_url} after {attempts} attempt(s)")
+                return
+            await asyncio.sleep(self.connection_manager.calculate_backoff_delay(attempts))
+    
+    async def stop_keeping(self, server_url: str):
+        """Stop the background login for a server and close its admin session."""
+        keeper = self.session_keepers.pop(server_url, None)
+        if keeper and not keeper.done():
+            keeper.cancel()
+        session = self.admin_sessions.pop(server_url, None)
+        if session:
+            await session.close()
     
     def is_authorized_user(self, user_id: int) -> bool:
         """Check if the user is authorized to use admin commands."""
@@ -59,457 +122,171 @@ class ApAdminCog(commands.GroupCog, group_name="apadmin"):
         except Exception as e:
             raise Exception(f"Error reading {host_file}: {e}")
     
-    async def connect_to_server(self, server_url: str, timeout: float = 15.0):
-        """Create a websocket connection to the Archipelago server"""
-        try:
-            websocket = await asyncio.wait_for(
-                websockets.connect(
-                    server_url,
-                    ping_interval=20,
-                    ping_timeout=10,
-                    close_timeout=10,
-                    max_size=None,
-                    compression="deflate"
-                ),
-                timeout=timeout
-            )
-            return websocket
-        except Exception as e:
-            raise Exception(f"Failed to connect to server: {e}")
-    
-    async def check_admin_response(self, response_text: str) -> bool:
+    async def get_admin_session(self, server_url: str = None) -> Optional[AdminSession]:
         """
-        Check if a server response indicates successful admin login.
+        Get or create a logged-in admin session for the specified server.
+        Returns None if the connection or admin login failed.
         """
-        try:
-            response = json.loads(response_text)
-            
-            # Handle response as list (common Archipelago format)
-            if isinstance(response, list):
-                for msg in response:
-                    if isinstance(msg, dict) and msg.get("cmd") == "Print":
-                        print_data = msg.get("data", [])
-                        for item in print_data:
-                            if isinstance(item, dict) and "text" in item:
-                                text = item["text"].lower()
-                                if ("admin" in text and ("logged in" in text or "authenticated" in text or "login successful" in text)) or \
-                                   ("login successful" in text and ("server" in text or "command" in text)) or \
-                                   ("administrator" in text) or ("admin mode" in text) or \
-                                   ("admin privileges" in text) or ("admin session" in text) or \
-                                   ("welcome admin" in text) or ("admin authenticated" in text):
-                                    print(f"Admin login success detected: {item['text']}")
-                                    return True
-                            elif isinstance(item, str) and "admin" in item.lower():
-                                if "logged in" in item.lower() or "authenticated" in item.lower() or \
-                                   "administrator" in item.lower() or "admin mode" in item.lower():
-                                    print(f"Admin login success detected: {item}")
-                                    return True
-                    elif isinstance(msg, dict) and msg.get("cmd") == "PrintJSON":
-                        # Handle PrintJSON format
-                        print_data = msg.get("data", [])
-                        for item in print_data:
-                            if isinstance(item, dict) and "text" in item:
-                                text = item["text"].lower()
-                                if ("admin" in text and ("logged in" in text or "authenticated" in text or "login successful" in text)) or \
-                                   ("login successful" in text and ("server" in text or "command" in text)) or \
-                                   ("administrator" in text) or ("admin mode" in text) or \
-                                   ("admin privileges" in text) or ("welcome admin" in text):
-                                    print(f"Admin login success detected: {item['text']}")
-                                    return True
-                            elif isinstance(item, str) and "admin" in item.lower():
-                                if "logged in" in item.lower() or "authenticated" in item.lower() or \
-                                   "administrator" in item.lower() or "admin mode" in item.lower():
-                                    print(f"Admin login success detected: {item}")
-                                    return True
-            
-            # Handle response as single object
-            elif isinstance(response, dict):
-                if response.get("cmd") == "Print":
-                    print_data = response.get("data", [])
-                    for item in print_data:
-                        if isinstance(item, dict) and "text" in item:
-                            text = item["text"].lower()
-                            if ("admin" in text and ("logged in" in text or "authenticated" in text)) or \
-                               ("login successful" in text and ("server" in text or "command" in text)) or \
-                               ("administrator" in text) or ("admin mode" in text):
-                                print(f"Admin login success detected: {item['text']}")
-                                return True
-                        elif isinstance(item, str) and "admin" in item.lower():
-                            if "logged in" in item.lower() or "authenticated" in item.lower():
-                                print(f"Admin login success detected: {item}")
-                                return True
-            
-            return False
-            
-        except json.JSONDecodeError:
-            # Check if it's a plain text success message
-            text_lower = response_text.lower()
-            if ("admin" in text_lower and ("logged in" in text_lower or "authenticated" in text_lower)) or \
-               ("login successful" in text_lower and ("server" in text_lower or "command" in text_lower)):
-                print(f"Admin login success detected in plain text: {response_text}")
-                return True
-            return False
-    
-    async def admin_login(self, websocket, admin_password: str) -> bool:
-        """
-        Perform admin login to the Archipelago server.
-        Returns True if login successful, False otherwise.
-        """
-        try:
-            # Send admin login command as JSON message (in array format like ap.py)
-            login_message = {
-                "cmd": "Say",
-                "text": f"!admin login {admin_password}"
-            }
-            print(f"Sending admin login command: {json.dumps([login_message])}")
-            await websocket.send(json.dumps([login_message]))
-            
-            # Wait for multiple responses as admin login might come after join message
-            print("Waiting for admin login response...")
-            admin_confirmed = False
-            attempts = 0
-            max_attempts = 5
-            
-            while attempts < max_attempts and not admin_confirmed:
-                try:
-                    response_text = await asyncio.wait_for(websocket.recv(), timeout=2.0)
-                    print(f"Admin login response {attempts + 1}: {response_text}")
-                    
-                    # Check this response for admin confirmation
-                    if await self.check_admin_response(response_text):
-                        admin_confirmed = True
-                        break
-                        
-                    attempts += 1
-                    
-                except asyncio.TimeoutError:
-                    attempts += 1
-                    print(f"No response on attempt {attempts}")
-                    continue
+        if server_url is None:
+            server_url = self.DEFAULT_SERVER_URL
+        
+        # Concurrent commands for a server wait for one login instead of each opening a session
+        async with self.session_locks.setdefault(server_url, asyncio.Lock()):
+            session = self.admin_sessions.get(server_url)
+            if session and session.is_open:
+                return session
             
-            # If no explicit admin confirmation, try a test admin command
-            if not admin_confirmed:
-                print("No explicit admin confirmation, testing with basic admin command...")
-                try:
-                    test_message = {"cmd": "Say", "text": "!admin"}
-                    await websocket.send(json.dumps([test_message]))
-                    
-                    test_response = await asyncio.wait_for(websocket.recv(), timeout=3.0)
-                    print(f"Admin test response: {test_response}")
-                    
-                    # If we get any admin-related response, consider it successful
-                    if await self.check_admin_response(test_response):
-                        admin_confirmed = True
-                        print("Admin login confirmed via test command")
-                    else:
-                        # Check for admin command help or any admin-related text
-                        if "admin" in test_response.lower() and ("command" in test_response.lower() or "help" in test_response.lower()):
-                            admin_confirmed = True
-                            print("Admin login confirmed - received admin help response")
-                        
-                except asyncio.TimeoutError:
-                    print("No response to admin test command")
+            # Clean up any closed session
+            if session:
+                print("Cleaning up closed admin session")
+                await session.close()
+                del self.admin_sessions[server_url]
             
-            return admin_confirmed
+            try:
+                # Server password for the connection, admin password for the login
+                admin_password = self.get_admin_password()
+                server_password = get_server_password()
                 
-        except asyncio.TimeoutError:
-            print("Admin login timeout")
-            return False
-        except Exception as e:
-            print(f"Admin login error: {e}")
-            return False
+                session = AdminSession(server_url, server_password, admin_password)
+                await session.open()
+                print("Admin connection confirmed via Connected message")
+                
+                print(f"Attempting admin login on {server_url}")
+                if not await session.login():
+                    await session.close()
+                    return None
+                
+                self.admin_sessions[server_url] = session
+                return session
+                
+            except ConnectionRefusedError as e:
+                print(f"Admin connection refused: {e}")
+                return None
+            except Exception as e:
+                print(f"Failed to create admin session: {e}")
+                return None
     
-    async def get_admin_session(self, server_url: str = None) -> Optional[Dict]:
+    async def send_admin_command(self, command: str, server_url: str = None,
+                                 matcher: Optional[Callable[[dict], bool]] = None) -> Optional[str]:
         """
-        Get or create an admin session for the specified server.
-        Returns session info with websocket connection if successful.
+        Send an admin command to the server and return the response.
+        
+        Commands from several admins can share a session; each reply is matched to its own
+        command, and matcher picks which messages count as the reply (default: results sent
+        only to the admin client).
         """
         if server_url is None:
             server_url = self.DEFAULT_SERVER_URL
         
-        # Check if we have an active admin session
-        session = self.admin_sessions.get(server_url)
-        if session and session.get('websocket'):
-            # Check if websocket is still open
-            ws = session['websocket']
-            try:
-                # For websockets library, check if connection is open
-                if hasattr(ws, 'closed'):
-                    is_closed = ws.closed
-                elif hasattr(ws, 'state'):
-                    is_closed = ws.state != State.OPEN
-                else:
-                    # Fallback: assume closed if we can't check
-                    is_closed = True
-
-                if not is_closed:
-                    print(f"Reusing existing admin session from {session.get('logged_in_at')}")
-                    return session
-            except:
-                pass  # Session is invalid, will be cleaned up below
-        
-        # Clean up any invalid sessions
-        if session:
-            print("Cleaning up invalid admin session")
-            if session.get('websocket'):
-                try:
-                    await session['websocket'].close()
-                except:
-                    pass
-            del self.admin_sessions[server_url]
+        session = await self.get_admin_session(server_url)
+        if not session:
+            print("No admin session available")
+            return None
         
         try:
-            # Get both passwords
-            admin_password = self.get_admin_password()
-            server_password = get_server_password()  # Use server password for initial connection
-            
-            # Connect to server
-            websocket = await self.connect_to_server(server_url)
-            
-            # First establish a basic connection with server password (matching ap.py format exactly)
-            connect_msg = {
-                "cmd": "Connect",
-                "game": "",
-                "password": server_password,  # Use server password for initial connection
-                "name": "Rhelbot",
-                "version": {"major": 0, "minor": 6, "build": 0, "class": "Version"},
-                "tags": ["Tracker"],
-                "items_handling": 0b000,  # No items handling for tracker
-                "uuid": uuid.getnode()
-            }
-            await websocket.send(json.dumps([connect_msg]))
-            print("Sent connection message")
-            
-            # Wait for connection confirmation with message loop (like ap.py)
-            connection_confirmed = False
-            timeout_counter = 0
-            max_timeout = 15  # 15 seconds total timeout (reduced from 30)
-            
-            while timeout_counter < max_timeout and not connection_confirmed:
-                try:
-                    # Wait for message with timeout
-                    message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                    
-                    try:
-                        data = json.loads(message)
-                        print(f"Admin connection received message: {data}")
-                        
-                        # Handle list of messages
-                        if isinstance(data, list):
-                            for msg in data:
-                                if isinstance(msg, dict):
-                                    msg_cmd = msg.get("cmd", "")
-                                    
-                                    if msg_cmd == "Connected":
-                                        connection_confirmed = True
-                                        print("Admin connection confirmed via Connected message")
-                                        break
-                                    elif msg_cmd == "ConnectionRefused":
-                                        errors = msg.get("errors", ["Unknown error"])
-                                        print(f"Admin connection refused: {', '.join(errors)}")
-                                        await websocket.close()
-                                        return None
-                                    elif msg_cmd == "PrintJSON":
-                                        # Sometimes the connection is working but we get other messages first
-                                        msg_type = msg.get("type", "")
-                                        if msg_type == "Join":
-                                            print("Detected Join message - connection appears successful")
-                                            connection_confirmed = True
-                                            break
-                        
-                        # Handle single message
-                        elif isinstance(data, dict):
-                            msg_cmd = data.get("cmd", "")
-                            if msg_cmd == "Connected":
-                                connection_confirmed = True
-                                print("Admin connection confirmed via Connected message")
-                            elif msg_cmd == "ConnectionRefused":
-                                errors = data.get("errors", ["Unknown error"])
-                                print(f"Admin connection refused: {', '.join(errors)}")
-                                await websocket.close()
-                                return None
-                            elif msg_cmd == "PrintJSON":
-                                msg_type = data.get("type", "")
-                                if msg_type == "Join":
-                                    print("Detected Join message - connection appears successful")
-                                    connection_confirmed = True
-                        
-                        if connection_confirmed:
-                            break
-                            
-                    except json.JSONDecodeError:
-                        print(f"Non-JSON message received: {message}")
-                        # Continue listening for proper messages
-                        
-                except asyncio.TimeoutError:
-                    timeout_counter += 1
-                    print(f"Waiting for connection confirmation... ({timeout_counter}s)")
-                    continue
-            
-            if not connection_confirmed:
-                print("Connection confirmation timeout - attempting admin login anyway")
-                # Don't close the websocket, try to proceed - it might still work
-            
-            # Wait a moment for connection to stabilize
-            await asyncio.sleep(1.0)
-            
-            # Now perform admin login with admin password
-            print(f"Attempting admin login with password: {admin_password[:3]}...")
-            login_success = await self.admin_login(websocket, admin_password)
-            
-            if login_success:
-                # Store admin session
-                session_info = {
-                    'websocket': websocket,
-                    'server_url': server_url,
-                    'logged_in_at': datetime.now(),
-                    'last_used': datetime.now()
-                }
-                self.admin_sessions[server_url] = session_info
-                return session_info
-            else:
-                await websocket.close()
-                return None
-                
+            print(f"Sending admin command: {command}")
+            response = await session.command(command, matcher)
+            print(f"Admin command response: {response}")
+            return response
+        except asyncio.TimeoutError:
+            print(f"Timeout waiting for the result of: {command}")
+            return None
         except Exception as e:
-            print(f"Failed to create admin session: {e}")
+            print(f"Failed to send admin command: {e}")
+            # Remove failed session
+            if self.admin_sessions.get(server_url) is session:
+                del self.admin_sessions[server_url]
+                await session.close()
             return None
     
-    async def send_admin_command(self, command: str, server_url: str = None) -> Optional[str]:
+    async def send_admin_commands(self, commands: list, server_url: str = None,
+                                  matcher: Optional[Callable[[dict], bool]] = None) -> Optional[list]:
         """
-        Send an admin command to the server and return the response.
+        Send several admin commands over one session, pipelined a window at a time.
+        Returns (command, response, error) for each command in order, or None if no session is available.
         """
-        print(f"send_admin_command called with: {command}")
-        print(f"Current admin sessions: {list(self.admin_sessions.keys())}")
         session = await self.get_admin_session(server_url)
         if not session:
             print("No admin session available")
             return None
-        print(f"Got admin session: {session.keys()}")
         
+        print(f"Sending {len(commands)} admin commands")
+        results = await session.run_bulk(commands, matcher)
+        for command, response, error in results:
+            print(f"Admin command {command}: {response if error is None else error}")
+        return results
+    
+    def format_bulk_results(self, title: str, labels: list, results: list, max_length: int = 1900) -> str:
+        """Summarize bulk command results in one message: a count, the failures, then the server output."""
+        failures = []
+        output_lines = []
+        for label, (command, response, error) in zip(labels, results):
+            if error is not None:
+                failures.append(f"└ **{label}**: {error}")
+            elif "error" in response.lower() or "failed" in response.lower():
+                failures.append(f"└ **{label}**: {response}")
+            else:
+                output_lines.append(response)
+        
+        succeeded = len(results) - len(failures)
+        status = "✅" if not failures else ("⚠️" if succeeded else "❌")
+        lines = [f"{status} {title}: {succeeded}/{len(results)} succeeded"]
+        lines.extend(failures)
+        message = "\n".join(lines)
+        
+        if output_lines:
+            output = "\n".join(output_lines)
+            room = max_length - len(message) - 10
+            if len(output) > room:
+                output = output[:max(room - 1, 0)] + "…"
+            if room > 0:
+                message += f"\n```{output}```"
+        return message
+    
+    async def run_bulk_admin_command(self, interaction: discord.Interaction, game_number: int, names: str,
+                                     make_command: Callable[[str], str], title: str, noun: str, action: str):
+        """
+        Shared body of the bulk admin commands: validate, defer, check access and the server, then
+        run make_command(name) for each comma-separated name and report the results in one message.
+        noun ("item", "player") and action ("send", "release") fill in the error messages.
+        """
+        # Validate game_number
+        if not 1 <= game_number <= 3:
+            await interaction.response.send_message(
+                f"❌ Invalid game number. Please choose between 1 and 3. You provided: {game_number}"
+            )
+            return
+
+        await interaction.response.defer()
+
+        # Check if user is authorized
+        if not self.is_authorized_user(interaction.user.id):
+            await interaction.followup.send("❌ You are not authorized to use admin commands.")
+            return
+
+        # Check if server is running
+        if not is_server_running():
+            await interaction.followup.send("❌ Archipelago server is not running.")
+            return
+
+        labels = [name.strip() for name in names.split(",") if name.strip()]
+        if not labels:
+            await interaction.followup.send(f"❌ No {noun} names given.")
+            return
+
         try:
-            websocket = session['websocket']
-            print(f"Using websocket: {websocket}")
+            # Get server URL for the specific game
+            server_port = get_server_port(game_number=game_number)
+            server_url = f"ws://ap.rhelys.com:{server_port}"
 
-            # Check if websocket is still connected
-            try:
-                if hasattr(websocket, 'closed'):
-                    is_closed = websocket.closed
-                elif hasattr(websocket, 'state'):
-                    is_closed = websocket.state != State.OPEN
-                else:
-                    # If we can't determine state, try to proceed
-                    is_closed = False
+            results = await self.send_admin_commands([make_command(label) for label in labels], server_url=server_url)
+            if results is None:
+                await interaction.followup.send("❌ Failed to connect to server or authenticate as admin.")
+                return
+            await interaction.followup.send(self.format_bulk_results(title, labels, results))
 
-                if is_closed:
-                    print("Websocket is closed, admin session expired")
-                    if server_url in self.admin_sessions:
-                        del self.admin_sessions[server_url]
-                    return None
-            except Exception as e:
-                print(f"Error checking websocket state: {e}")
-                # If we can't check, assume it's still open and let the send fail if needed
-            
-            # Send the command as JSON message (in array format like ap.py)
-            command_message = {
-                "cmd": "Say",
-                "text": command
-            }
-            print(f"Sending command message: {json.dumps([command_message])}")
-            await websocket.send(json.dumps([command_message]))
-            
-            # Wait for response - need to handle command echo vs actual result
-            print("Waiting for command response...")
-            response_text = await asyncio.wait_for(websocket.recv(), timeout=15.0)
-            print(f"Raw command response 1: {response_text}")
-            
-            # Check if this is just the command echo - if so, wait for the actual result
-            is_command_echo = False
-            try:
-                echo_data = json.loads(response_text)
-                if isinstance(echo_data, list):
-                    for msg in echo_data:
-                        if isinstance(msg, dict) and msg.get("cmd") == "PrintJSON":
-                            data_items = msg.get("data", [])
-                            for item in data_items:
-                                if isinstance(item, dict) and "text" in item:
-                                    text = item["text"]
-                                    # Check if this is our command being echoed back
-                                    if text.startswith("Rhelbot:") and command in text:
-                                        is_command_echo = True
-                                        print("Detected command echo, waiting for actual result...")
-                                        break
-            except json.JSONDecodeError:
-                pass
-            
-            # If it was a command echo, wait for the next message (the actual result)
-            if is_command_echo:
-                try:
-                    response_text = await asyncio.wait_for(websocket.recv(), timeout=10.0)
-                    print(f"Raw command response 2 (actual result): {response_text}")
-                except asyncio.TimeoutError:
-                    print("Timeout waiting for actual command result")
-                    # Fall back to using the echo if no result comes
-            
-            # Update last used timestamp
-            session['last_used'] = datetime.now()
-            
-            # Try to parse JSON response
-            try:
-                response = json.loads(response_text)
-                text_parts = []
-                
-                # Handle response as list (common Archipelago format)
-                if isinstance(response, list):
-                    for msg in response:
-                        if isinstance(msg, dict):
-                            # Extract meaningful text from Print commands
-                            if msg.get("cmd") == "Print":
-                                print_data = msg.get("data", [])
-                                for item in print_data:
-                                    if isinstance(item, dict) and "text" in item:
-                                        text_parts.append(item["text"])
-                                    elif isinstance(item, str):
-                                        text_parts.append(item)
-                            elif msg.get("cmd") == "PrintJSON":
-                                # Handle PrintJSON format
-                                print_data = msg.get("data", [])
-                                for item in print_data:
-                                    if isinstance(item, dict) and "text" in item:
-                                        text_parts.append(item["text"])
-                                    elif isinstance(item, str):
-                                        text_parts.append(item)
-                
-                # Handle response as single object
-                elif isinstance(response, dict):
-                    if response.get("cmd") == "Print":
-                        print_data = response.get("data", [])
-                        for item in print_data:
-                            if isinstance(item, dict) and "text" in item:
-                                text_parts.append(item["text"])
-                            elif isinstance(item, str):
-                                text_parts.append(item)
-                
-                if text_parts:
-                    result = " ".join(text_parts)
-                    print(f"Extracted text from response: {result}")
-                    return result
-                
-                # For other response types, return the JSON as formatted string
-                formatted_json = json.dumps(response, indent=2)
-                print(f"Returning formatted JSON: {formatted_json}")
-                return formatted_json
-                
-            except json.JSONDecodeError:
-                # If not JSON, return as-is
-                return response_text
-            
         except Exception as e:
-            print(f"Failed to send admin command: {e}")
-            # Remove failed session
-            if server_url in self.admin_sessions:
-                del self.admin_sessions[server_url]
-            return None
+            await interaction.followup.send(f"❌ Error executing {action} commands: {str(e)}")
     
     @app_commands.command(
         name="release",
@@ -781,6 +558,47 @@ class ApAdminCog(commands.GroupCog, group_name="apadmin"):
         except Exception as e:
             await interaction.followup.send(f"❌ Error executing send_location command: {str(e)}")
 
+    @app_commands.command(
+        name="send_items",
+        description="Send several different items to the specified player at once"
+    )
+    @app_commands.describe(
+        player_name="The player who should receive the items",
+        item_names="Comma-separated item names (repeat a name to send it more than once)",
+        game_number="Game slot to execute command on (1-3, default: 1)"
+    )
+    async def admin_send_items(self, interaction: discord.Interaction, player_name: str, item_names: str, game_number: int = 1):
+        await self.run_bulk_admin_command(interaction, game_number, item_names,
+                                         lambda item: f"!admin /send {player_name} {item}",
+                                         f"Sent items to **{player_name}**", "item", "send")
+
+    @app_commands.command(
+        name="release_multiple",
+        description="Send out the remaining items from several players at once"
+    )
+    @app_commands.describe(
+        player_names="Comma-separated names of the players whose remaining items should be released",
+        game_number="Game slot to execute command on (1-3, default: 1)"
+    )
+    async def admin_release_multiple(self, interaction: discord.Interaction, player_names: str, game_number: int = 1):
+        await self.run_bulk_admin_command(interaction, game_number, player_names,
+                                         lambda player: f"!admin /release {player}",
+                                         "Released remaining items", "player", "release")
+
+    @app_commands.command(
+        name="hint_multiple",
+        description="Send out hints for several of a player's items at once"
+    )
+    @app_commands.describe(
+        player_name="The player whose items should be hinted",
+        item_names="Comma-separated names of the items to hint",
+        game_number="Game slot to execute command on (1-3, default: 1)"
+    )
+    async def admin_hint_multiple(self, interaction: discord.Interaction, player_name: str, item_names: str, game_number: int = 1):
+        await self.run_bulk_admin_command(interaction, game_number, item_names,
+                                         lambda item: f"!admin /hint {player_name} {item}",
+                                         f"Hinted items for **{player_name}**", "item", "hint")
+
     @app_commands.command(
         name="status",
         description="Check admin session status and connection"
@@ -800,28 +618,16 @@ class ApAdminCog(commands.GroupCog, group_name="apadmin"):
             status_lines.append("❌ No active admin sessions")
         else:
             for server_url, session in self.admin_sessions.items():
-                websocket = session.get('websocket')
-                if websocket:
-                    try:
-                        if hasattr(websocket, 'closed'):
-                            is_closed = websocket.closed
-                        elif hasattr(websocket, 'state'):
-                            is_closed = websocket.state != State.OPEN
-                        else:
-                            is_closed = False
-
-                        if not is_closed:
-                            logged_in_at = session.get('logged_in_at', 'Unknown')
-                            last_used = session.get('last_used', 'Unknown')
-                            status_lines.append(f"✅ **{server_url}**")
-                            status_lines.append(f"   └ Logged in: {logged_in_at}")
-                            status_lines.append(f"   └ Last used: {last_used}")
-                        else:
-                            status_lines.append(f"❌ **{server_url}** (Connection closed)")
-                    except:
-                        status_lines.append(f"❌ **{server_url}** (Connection closed)")
+                if session.is_open:
+                    idle = time.monotonic() - session.last_used
+                    status_lines.append(f"✅ **{server_url}**")
+                    status_lines.append(f"   └ Logged in: {session.logged_in_at}")
+                    status_lines.append(f"   └ Last used: {idle:.0f}s ago")
+                    rtt = session.heartbeat.stats()["rtt_ms"]
+                    if rtt is not None:
+                        status_lines.append(f"   └ Heartbeat RTT: {rtt} ms")
                 else:
-                    status_lines.append(f"❌ **{server_url}** (No websocket)")
+                    status_lines.append(f"❌ **{server_url}** (Connection closed)")
 
         # Check server running status
         server_running = is_server_running()
@@ -845,23 +651,12 @@ class ApAdminCog(commands.GroupCog, group_name="apadmin"):
         disconnected_count = 0
         
         for server_url, session in list(self.admin_sessions.items()):
-            websocket = session.get('websocket')
-            if websocket:
-                try:
-                    # Check if websocket is open before attempting to close
-                    if hasattr(websocket, 'closed'):
-                        is_closed = websocket.closed
-                    elif hasattr(websocket, 'state'):
-                        is_closed = websocket.state != State.OPEN
-                    else:
-                        is_closed = False
-
-                    if not is_closed:
-                        await websocket.close()
-                        disconnected_count += 1
-                except:
-                    pass
-            del self.admin_sessions[server_url]
+            if session.is_open:
+                disconnected_count += 1
+            await self.stop_keeping(server_url)
+        # Also stop background logins that haven't produced a session yet
+        for server_url in list(self.session_keepers):
+            await self.stop_keeping(server_url)
         
         if disconnected_count > 0:
             await interaction.followup.send(f"✅ Disconnected {disconnected_count} admin session(s)")
@@ -16,7 +16,7 @@ from helpers.s3_helpers import (
     save_cache,
     refresh_user_cache
 )
-from helpers.data_helpers import parse_yaml_metadata
+from helpers.data_helpers import parse_yaml_metadata, save_game_status, get_player_index
 
 donkeyServer = discord.Object(id=591625815528177690)
 
@@ -364,16 +364,8 @@ class ApConfigCog(commands.GroupCog, group_name="apconfig"):
 
             # Check if player already exists
             if player_name in game_status["players"]:
-                existing_discord_user = None
                 # Find which Discord user owns this player
-                for discord_id, players in game_status["discord_users"].items():
-                    if isinstance(players, list):
-                        if player_name in players:
-                            existing_discord_user = discord_id
-                            break
-                    elif players == player_name:
-                        existing_discord_user = discord_id
-                        break
+                existing_discord_user = get_player_index().owner_of(player_name)
 
                 # If the same Discord user is updating their file, allow it
                 if existing_discord_user == str(interaction.user.id):
@@ -386,8 +378,7 @@ class ApConfigCog(commands.GroupCog, group_name="apconfig"):
                     }
 
                     # Save updated game status
-                    with open(status_file, 'w') as f:
-                        json.dump(game_status, f, indent=2)
+                    save_game_status(game_status, status_file)
 
                     await interaction.followup.send(
                         f"✅ Updated configuration for **{player_name}** ({game_name})"
@@ -422,9 +413,8 @@ class ApConfigCog(commands.GroupCog, group_name="apconfig"):
                     # Handle old format where it was a single string
                     game_status["discord_users"][user_id_str] = [player_name]
 
-                # Save updated game status
-                with open(status_file, 'w') as f:
-                    json.dump(game_status, f, indent=2)
+                # Save updated game status (this also updates the player index)
+                save_game_status(game_status, status_file)
 
                 logger.info(f"Successfully joined player {player_name} to game for user {discord_user_id}")
 
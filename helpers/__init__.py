@@ -29,7 +29,6 @@ from .server_helpers import (
 from .formatting_helpers import (
     create_progress_bar,
     process_hint_response,
-    resolve_hint_pattern,
     format_hint_message
 )
 
@@ -68,7 +67,6 @@ __all__ = [
     # Formatting helpers
     'create_progress_bar',
     'process_hint_response',
-    'resolve_hint_pattern',
     'format_hint_message',
     
     # Progress helpers
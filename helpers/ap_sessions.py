@@ -0,0 +1,388 @@
+"""
+Persistent Archipelago client sessions.
+An APSession is one authenticated websocket with a reader task that hands incoming messages to
+waiting requests, so a command is a single send plus an awaited response instead of a recv() loop.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, Deque, List, Tuple, Optional, Callable
+
+from helpers.server_helpers import connect_to_server, create_connection_message
+from helpers.formatting_helpers import printjson_text
+from helpers.websocket_managers import ConnectionHeartbeat
+
+logger = logging.getLogger(__name__)
+
+
+class APSession:
+    """
+    One connected Archipelago client (tracker, player slot or admin).
+
+    Requests register a matcher before sending; the reader task gives each incoming message
+    to the oldest pending matcher that accepts it, so concurrent requests each get their own reply.
+    """
+
+    def __init__(self, server_url: str, name: str, game: str = "", password: Optional[str] = None,
+                 tags: Optional[List[str]] = None, items_handling: int = 0b000):
+        self.server_url = server_url
+        self.name = name
+        self.game = game
+        self.password = password
+        self.tags = ["Tracker"] if tags is None else tags
+        self.items_handling = items_handling
+
+        self.websocket = None
+        self.connected_msg: Optional[dict] = None
+        self.lock = asyncio.Lock()  # for callers that need one exchange at a time
+        self.last_used = time.monotonic()
+        self._reader: Optional[asyncio.Task] = None
+        self._waiters: List[Tuple[Callable[[dict], bool], asyncio.Future]] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def open(self, timeout: float = 15.0) -> dict:
+        """
+        Connect and authenticate, then start the reader task.
+
+        Returns:
+            dict: The server's Connected message
+
+        Raises:
+            ConnectionRefusedError: If the server refused the slot (message lists its errors)
+        """
+        self.websocket = await connect_to_server(self.server_url, timeout)
+        try:
+            connect_msg = create_connection_message(self.password, self.name, self.game)
+            connect_msg["tags"] = self.tags
+            connect_msg["items_handling"] = self.items_handling
+            await self.websocket.send(json.dumps([connect_msg]))
+
+            deadline = time.monotonic() + timeout
+            while self.connected_msg is None:
+                message = await asyncio.wait_for(self.websocket.recv(), timeout=max(deadline - time.monotonic(), 0.1))
+                for msg in json.loads(message):
+                    if msg.get("cmd") == "Connected":
+                        self.connected_msg = msg
+                    elif msg.get("cmd") == "ConnectionRefused":
+                        raise ConnectionRefusedError(", ".join(msg.get("errors", ["Unknown error"])))
+        except BaseException:
+            await self.websocket.close()
+            raise
+
+        self.last_used = time.monotonic()
+        self._reader = asyncio.create_task(self._read_loop())
+        logger.debug(f"Opened session for {self.name} on {self.server_url}")
+        return self.connected_msg
+
+    def expect(self, matcher: Callable[[dict], bool]) -> asyncio.Future:
+        """Register interest in the next message the matcher accepts; register before sending the request."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((matcher, future))
+        return future
+
+    async def send(self, *messages: dict):
+        self.last_used = time.monotonic()
+        await self.websocket.send(json.dumps(list(messages)))
+
+    async def request(self, messages: List[dict], matcher: Callable[[dict], bool], timeout: float = 10.0) -> dict:
+        """
+        Send messages and wait for the first incoming message the matcher accepts.
+
+        Raises:
+            asyncio.TimeoutError: If no matching reply arrived in time
+            ConnectionError: If the session closed while waiting
+        """
+        if not self.is_open:
+            raise ConnectionError(f"Session for {self.name} is closed")
+        future = self.expect(matcher)
+        try:
+            await self.send(*messages)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._drop_waiter(future)
+            self.last_used = time.monotonic()
+
+    def _drop_waiter(self, future: asyncio.Future):
+        self._waiters = [(matcher, waiter) for matcher, waiter in self._waiters if waiter is not future]
+
+    def _dispatch(self, msg: dict):
+        for matcher, future in self._waiters:
+            if future.done():
+                continue
+            try:
+                matched = matcher(msg)
+            except Exception as e:
+                logger.debug(f"Response matcher failed on {msg.get('cmd')}: {e}")
+                continue
+            if matched:
+                future.set_result(msg)
+                self._drop_waiter(future)
+                return
+
+    async def _read_loop(self):
+        try:
+            async for message in self.websocket:
+                try:
+                    data = json.loads(message)
+                except ValueError:
+                    continue
+                for msg in data:
+                    if isinstance(msg, dict):
+                        self._dispatch(msg)
+        except Exception as e:
+            logger.info(f"Session for {self.name} on {self.server_url} closed: {e}")
+        finally:
+            self._on_closed()
+
+    def _on_closed(self):
+        for _, future in self._waiters:
+            if not future.done():
+                future.set_exception(ConnectionError(f"Session for {self.name} closed"))
+        self._waiters.clear()
+
+    async def wait_closed(self):
+        """Wait until the connection drops or is closed."""
+        if self._reader is not None:
+            await asyncio.wait([self._reader])
+
+    async def close(self):
+        if self._reader and not self._reader.done():
+            self._reader.cancel()
+        if self.websocket is not None:
+            try:
+                await self.websocket.close()
+            except Exception as e:
+                logger.debug(f"Error closing session for {self.name}: {e}")
+
+
+def is_command_result(msg: dict) -> bool:
+    """Replies the server sends only to the client that ran a command (not broadcasts like ItemSend or Join)."""
+    if msg.get("cmd") == "Print":
+        return True
+    return msg.get("cmd") == "PrintJSON" and msg.get("type") in (None, "CommandResult")
+
+
+def is_admin_login_success(text: str) -> bool:
+    """Check whether an !admin login reply says the login worked."""
+    text = text.lower()
+    return ("login successful" in text or
+            ("admin" in text and ("logged in" in text or "authenticated" in text)) or
+            "administrator" in text or "admin mode" in text or "admin privileges" in text)
+
+
+def is_admin_sentinel_reply(text: str) -> bool:
+    """Check whether a reply is the usage text a bare "!admin" gets, which AdminSession uses to end each reply."""
+    return text.startswith("Usage: !admin")
+
+
+class AdminCommand:
+    """An admin command waiting for its reply."""
+
+    __slots__ = ("text", "matcher", "future", "lines")
+
+    def __init__(self, text: str, matcher: Callable[[dict], bool], future: asyncio.Future):
+        self.text = text
+        self.matcher = matcher
+        self.future = future
+        self.lines: List[str] = []
+
+
+class AdminSession(APSession):
+    """
+    A Rhelbot session logged in with !admin login, running admin commands over one connection.
+
+    The server doesn't echo !admin commands back, so nothing in a reply says which command it
+    answers. Each command is sent together with a bare SENTINEL ("!admin"), whose usage reply
+    always comes after the command's own output because the server handles one client's
+    messages in order. Replies the oldest outstanding command's matcher accepts belong to it
+    until the next sentinel reply, which completes it.
+    """
+
+    SENTINEL = "!admin"
+    PIPELINE_WINDOW = 8  # commands run_bulk keeps in flight at once
+
+    def __init__(self, server_url: str, password: Optional[str], admin_password: str):
+        super().__init__(server_url, "Rhelbot", "", password)
+        self.admin_password = admin_password
+        self.logged_in_at: Optional[datetime] = None
+        self.heartbeat = ConnectionHeartbeat()  # drops a dead connection so it can be logged back into
+        self._send_lock = asyncio.Lock()
+        self._pending: Deque[AdminCommand] = deque()
+
+    async def open(self, timeout: float = 15.0) -> dict:
+        connected_msg = await super().open(timeout)
+        self.heartbeat.start(self.websocket)
+        return connected_msg
+
+    async def close(self):
+        self.heartbeat.stop()
+        await super().close()
+
+    async def login(self, timeout: float = 10.0) -> bool:
+        try:
+            reply = await self.command(f"!admin login {self.admin_password}", timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"No reply to admin login on {self.server_url}")
+            return False
+        if not is_admin_login_success(reply):
+            logger.warning(f"Admin login failed on {self.server_url}: {reply}")
+            return False
+        self.logged_in_at = datetime.now()
+        return True
+
+    async def command(self, text: str, matcher: Optional[Callable[[dict], bool]] = None, timeout: float = 15.0) -> str:
+        """
+        Run an admin command and return its reply text (empty if the command printed nothing).
+
+        Args:
+            text: The chat text to send, e.g. "!admin /send Player Item"
+            matcher: Which messages count as this command's reply (default: command results)
+
+        Raises:
+            asyncio.TimeoutError: If the reply didn't finish in time
+            ConnectionError: If the session is or becomes closed
+        """
+        if not self.is_open:
+            raise ConnectionError(f"Admin session for {self.server_url} is closed")
+        pending = AdminCommand(text, matcher or is_command_result, asyncio.get_running_loop().create_future())
+        # Queue order has to match send order, since replies are handed out by position
+        async with self._send_lock:
+            self._pending.append(pending)
+            try:
+                await self.send({"cmd": "Say", "text": text}, {"cmd": "Say", "text": self.SENTINEL})
+            except Exception:
+                self._pending.remove(pending)
+                raise
+        # A command that times out stays queued, so its late output is still consumed by it
+        return await asyncio.wait_for(asyncio.shield(pending.future), timeout)
+
+    async def run_bulk(self, commands: List[str], matcher: Optional[Callable[[dict], bool]] = None,
+                       timeout: float = 15.0) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Run several admin commands over this session, keeping up to PIPELINE_WINDOW in flight.
+
+        Replies are matched to commands by send order (see the class docstring), so a batch
+        costs about one round trip per window rather than one per command; a failed command
+        doesn't stop the ones after it.
+
+        Returns:
+            List of (command, reply, error) in the order given; reply is None when error is set
+        """
+        window = asyncio.Semaphore(self.PIPELINE_WINDOW)
+
+        async def run(text: str) -> Tuple[str, Optional[str], Optional[str]]:
+            async with window:
+                try:
+                    return text, await self.command(text, matcher, timeout), None
+                except asyncio.TimeoutError:
+                    return text, None, "no reply from server"
+                except ConnectionError as e:
+                    return text, None, str(e)
+
+        return list(await asyncio.gather(*(run(text) for text in commands)))
+
+    def _dispatch(self, msg: dict):
+        if not self._pending:
+            return super()._dispatch(msg)
+        pending = self._pending[0]
+
+        if is_command_result(msg) and is_admin_sentinel_reply(printjson_text(msg)):
+            self._pending.popleft()
+            if not pending.future.done():
+                pending.future.set_result("\n".join(pending.lines))
+            return
+
+        try:
+            matched = pending.matcher(msg)
+        except Exception as e:
+            logger.debug(f"Admin response matcher failed on {msg.get('cmd')}: {e}")
+            matched = False
+        if not matched:
+            return super()._dispatch(msg)
+        pending.lines.append(printjson_text(msg))
+
+    def _on_closed(self):
+        super()._on_closed()
+        self.heartbeat.stop()
+        while self._pending:
+            pending = self._pending.popleft()
+            if not pending.future.done():
+                pending.future.set_exception(ConnectionError(f"Admin session for {self.server_url} closed"))
+
+
+class SlotConnectionPool:
+    """
+    Player-slot sessions kept open between commands.
+
+    Sessions are keyed by (server_url, player name) and closed after idle_timeout seconds
+    without use; at most max_sessions are kept, dropping the least recently used.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, max_sessions: int = 8):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.sessions: Dict[Tuple[str, str], APSession] = {}
+        self._opening: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._janitor: Optional[asyncio.Task] = None
+        self.opened = 0
+        self.reused = 0
+
+    async def get(self, server_url: str, name: str, game: str, password: Optional[str] = None) -> APSession:
+        """
+        An open session for the player slot, connecting it if needed.
+
+        Raises:
+            ConnectionRefusedError: If the server refused the slot
+        """
+        key = (server_url, name.lower())
+        async with self._opening.setdefault(key, asyncio.Lock()):
+            session = self.sessions.get(key)
+            if session is not None and session.is_open and session.game == game:
+                self.reused += 1
+                session.last_used = time.monotonic()
+                return session
+            if session is not None:
+                await self._close(key)
+
+            session = APSession(server_url, name, game, password, tags=[], items_handling=0b111)
+            await session.open()
+            self.sessions[key] = session
+            self.opened += 1
+
+        while len(self.sessions) > self.max_sessions:
+            oldest = min(self.sessions, key=lambda k: self.sessions[k].last_used)
+            await self._close(oldest)
+        if self._janitor is None or self._janitor.done():
+            self._janitor = asyncio.create_task(self._evict_idle())
+        return session
+
+    async def _evict_idle(self):
+        while self.sessions:
+            await asyncio.sleep(self.idle_timeout / 4)
+            cutoff = time.monotonic() - self.idle_timeout
+            for key, session in list(self.sessions.items()):
+                if not session.is_open or (session.last_used < cutoff and not session.lock.locked()):
+                    logger.debug(f"Closing idle slot session for {session.name}")
+                    await self._close(key)
+
+    async def _close(self, key: Tuple[str, str]):
+        session = self.sessions.pop(key, None)
+        if session is not None:
+            await session.close()
+
+    async def close(self, server_url: Optional[str] = None):
+        """Close every session, or only those for one server."""
+        for key in [key for key in self.sessions if server_url is None or key[0] == server_url]:
+            await self._close(key)
+        if not self.sessions and self._janitor and not self._janitor.done():
+            self._janitor.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"open": len(self.sessions), "opened": self.opened, "reused": self.reused}
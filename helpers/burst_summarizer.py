@@ -0,0 +1,213 @@
+"""
+Release/Collect burst summarizer for Archipelago tracking.
+Folds the flood of ItemSend messages that follows a release or collect into one summary per burst.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+from typing import Dict, Any, List, Set, Tuple, Optional, Callable, Awaitable, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+class ItemBurst:
+    """Items collected for a single release or collect."""
+
+    __slots__ = ("kind", "slot", "items", "started_at", "last_seen", "task")
+
+    def __init__(self, kind: str, slot: int):
+        self.kind = kind
+        self.slot = slot
+        # (sender_id, recipient_id, item_id, item_flags, location_id)
+        self.items: List[Tuple[int, int, int, int, int]] = []
+        self.started_at = time.monotonic()
+        self.last_seen = self.started_at
+        self.task: Optional[asyncio.Task] = None
+
+
+class ReleaseBurstSummarizer:
+    """
+    Detects release/collect bursts and hands each finished burst to a flush callback.
+
+    A burst starts either from the Release/Collect game event that the server sends ahead
+    of the items, or when a single sender emits more than volume_threshold ItemSends within
+    volume_window seconds. It is flushed once no new items have arrived for quiet_period seconds.
+
+    So the items that lead up to a volume-detected burst aren't announced one by one first,
+    items absorbed with a payload are held for volume_window seconds: they join the burst if
+    one starts, otherwise their payloads are handed to release_func to be announced as usual.
+    """
+
+    def __init__(self, flush_func: Callable[[ItemBurst], Awaitable[None]],
+                 release_func: Optional[Callable[[List[Any]], Awaitable[None]]] = None, quiet_period: float = 1.5,
+                 volume_threshold: int = 25, volume_window: float = 2.0):
+        self.flush_func = flush_func
+        self.release_func = release_func
+        self.quiet_period = quiet_period
+        self.volume_threshold = volume_threshold
+        self.volume_window = volume_window
+
+        self._bursts: Dict[Tuple[str, int], ItemBurst] = {}
+        self._recent_sends: Dict[int, deque] = {}
+        # sender_id -> [(arrival time, item, payload)] waiting to see whether a burst follows
+        self._held: Dict[int, List[Tuple[float, Tuple[int, int, int, int, int], Any]]] = {}
+        self._release_tasks: Dict[int, asyncio.Task] = {}
+
+    def start_burst(self, kind: str, slot: int) -> ItemBurst:
+        """Start (or return the running) burst for a Release or Collect event."""
+        key = (kind.lower(), int(slot))
+        burst = self._bursts.get(key)
+        if burst is None:
+            burst = ItemBurst(key[0], key[1])
+            self._bursts[key] = burst
+            burst.task = asyncio.create_task(self._flush_when_quiet(key))
+            logger.debug(f"Started {key[0]} burst for slot {key[1]}")
+        return burst
+
+    def absorb(self, sender_id: int, recipient_id: int, item_id: int, item_flags: int, location_id: int,
+               payload: Any = None) -> bool:
+        """
+        Add an ItemSend to a running burst, starting one if the sender's volume looks like a release.
+
+        Args:
+            payload: What release_func needs to announce the item if no burst follows; items
+                without one are never held
+
+        Returns:
+            bool: True if the item belongs to a burst or is being held, and shouldn't be announced now
+        """
+        now = time.monotonic()
+        item = (sender_id, recipient_id, item_id, item_flags or 0, location_id)
+        burst = self._bursts.get(("release", sender_id)) or self._bursts.get(("collect", recipient_id))
+
+        if burst is None:
+            recent = self._recent_sends.setdefault(sender_id, deque())
+            recent.append(now)
+            while recent and now - recent[0] > self.volume_window:
+                recent.popleft()
+            if len(recent) < self.volume_threshold:
+                if payload is None or self.release_func is None:
+                    return False
+                self._held.setdefault(sender_id, []).append((now, item, payload))
+                task = self._release_tasks.get(sender_id)
+                if task is None or task.done():
+                    self._release_tasks[sender_id] = asyncio.create_task(self._release_held(sender_id))
+                return True
+            del self._recent_sends[sender_id]
+            burst = self.start_burst("release", sender_id)
+            # The items that led up to the burst are part of it
+            burst.items.extend(held_item for _, held_item, _ in self._held.pop(sender_id, []))
+
+        burst.items.append(item)
+        burst.last_seen = now
+        return True
+
+    async def _release_held(self, sender_id: int):
+        """Announce a sender's held items once they're volume_window old without a burst starting."""
+        while self._held.get(sender_id):
+            held = self._held[sender_id]
+            delay = held[0][0] + self.volume_window - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            cutoff = time.monotonic() - self.volume_window
+            due = [payload for arrived, _, payload in held if arrived <= cutoff]
+            self._held[sender_id] = [entry for entry in held if entry[0] > cutoff]
+            try:
+                await self.release_func(due)
+            except Exception as e:
+                logger.error(f"Error announcing held items for slot {sender_id}: {e}")
+        self._held.pop(sender_id, None)
+
+    async def _flush_when_quiet(self, key: Tuple[str, int]):
+        """Wait until the burst goes quiet, then hand it to the flush callback."""
+        burst = self._bursts[key]
+        try:
+            while True:
+                delay = burst.last_seen + self.quiet_period - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            self._bursts.pop(key, None)
+
+        if not burst.items:
+            return
+        logger.info(f"Flushing {burst.kind} burst for slot {burst.slot} with {len(burst.items)} items")
+        try:
+            await self.flush_func(burst)
+        except Exception as e:
+            logger.error(f"Error flushing {burst.kind} burst for slot {burst.slot}: {e}")
+
+    def cancel(self):
+        """Cancel all pending bursts and held items without flushing them."""
+        for burst in self._bursts.values():
+            if burst.task and not burst.task.done():
+                burst.task.cancel()
+        for task in self._release_tasks.values():
+            if not task.done():
+                task.cancel()
+        self._bursts.clear()
+        self._recent_sends.clear()
+        self._held.clear()
+        self._release_tasks.clear()
+
+
+async def stream_burst_summary(burst: ItemBurst, players: Dict[int, Dict[str, str]],
+                               resolve_item_names: Callable[[Set[Tuple[str, int]]], Awaitable[Dict[Tuple[str, int], str]]],
+                               max_names: int = 8) -> AsyncIterator[str]:
+    """
+    Format a finished burst as Discord message lines, yielding each line as it is ready.
+
+    The headline only needs player names and item counts, so it is yielded before the
+    key item names are resolved.
+
+    Args:
+        burst: The finished burst
+        players: {player_id: {"name": ..., "game": ...}} covering every slot in the burst
+        resolve_item_names: Coroutine function resolving {(game, item_id)} to {(game, item_id): name}
+        max_names: Maximum distinct key item names listed per player before collapsing to "+N more"
+
+    Yields:
+        Lines ending in a newline; the first is the headline, the rest list key items per player
+    """
+    def name_of(player_id):
+        return players.get(player_id, {}).get("name", f"Player {player_id}")
+
+    # Group key items by the other side of the transfer: recipients for a release, senders for a collect
+    grouped: Dict[int, List[Tuple[str, int]]] = {}
+    for sender_id, recipient_id, item_id, item_flags, location_id in burst.items:
+        if not item_flags & 1:
+            continue
+        other_id = recipient_id if burst.kind == "release" else sender_id
+        if name_of(other_id).lower() == "rhelbot":
+            continue
+        recipient_game = players.get(recipient_id, {}).get("game", "Unknown")
+        grouped.setdefault(other_id, []).append((recipient_game, item_id))
+
+    verb, preposition, emoji = ("released", "to", "📤") if burst.kind == "release" else ("collected", "from", "📥")
+    ordered = sorted(grouped.items(), key=lambda entry: (-len(entry[1]), name_of(entry[0]).lower()))
+
+    headline = f"{emoji} **{name_of(burst.slot)}** {verb} {len(burst.items)} items"
+    if ordered:
+        headline += ": " + ", ".join(
+            f"{len(items)} key item{'s' if len(items) != 1 else ''} {preposition} **{name_of(other_id)}**"
+            for other_id, items in ordered
+        )
+    else:
+        headline += " (no key items)"
+    yield headline + "\n"
+    if not ordered:
+        return
+
+    # All key item names in one pass
+    item_names = await resolve_item_names({item for _, items in ordered for item in items})
+    for other_id, items in ordered:
+        names = [item_names.get(item, f"Item {item[1]}") for item in items]
+        counts = sorted(Counter(names).items(), key=lambda entry: (-entry[1], entry[0]))
+        shown = ", ".join(f"{name} x{count}" if count > 1 else name for name, count in counts[:max_names])
+        if len(counts) > max_names:
+            shown += f" (+{len(counts) - max_names} more)"
+        yield f"└ **{name_of(other_id)}**: {shown}\n"
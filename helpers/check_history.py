@@ -0,0 +1,271 @@
+"""
+Compact per-player check history for Archipelago game tracking.
+Stores (timestamp, slot, cumulative checks) samples in array-backed columns so check rates
+and inactivity can be answered with a binary search instead of re-reading old saves.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import struct
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, List, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Record layout on disk: <timestamp: float64><slot: uint32><cumulative checks: uint32>
+SAMPLE = struct.Struct("<dII")
+
+
+def check_history_path_for_seed(seed_name: str, base_path: str) -> str:
+    """Build the history path for a seed, so each game keeps its own samples (e.g. check_history_12345)."""
+    safe_seed = re.sub(r"[^A-Za-z0-9.-]+", "_", seed_name).strip("_")
+    return f"{base_path}_{safe_seed}"
+
+
+class SlotSeries:
+    """Timestamps and cumulative check counts for one slot, oldest first."""
+
+    __slots__ = ("times", "counts")
+
+    def __init__(self):
+        self.times = array("d")
+        self.counts = array("L")
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def append(self, timestamp: float, count: int):
+        self.times.append(timestamp)
+        self.counts.append(count)
+
+    def count_at(self, timestamp: float) -> Optional[int]:
+        """Cumulative checks as of a timestamp, or None if the series starts later."""
+        index = bisect_right(self.times, timestamp)
+        return self.counts[index - 1] if index else None
+
+    def drop_before(self, timestamp: float) -> "SlotSeries":
+        """Remove samples older than a timestamp and return them as a new series."""
+        index = bisect_left(self.times, timestamp)
+        dropped = SlotSeries()
+        dropped.times, dropped.counts = self.times[:index], self.counts[:index]
+        del self.times[:index]
+        del self.counts[:index]
+        return dropped
+
+
+class CheckHistory:
+    """
+    Per-slot check history with downsampling.
+
+    Every increase in a slot's checked count is kept as a raw sample for raw_retention
+    seconds; older samples are rolled up to one sample per rollup_interval (the last count
+    in each interval). Raw samples are appended to <path>.raw as they arrive and flushed
+    once per flush_interval, and both files are rewritten when a compaction runs.
+    """
+
+    def __init__(self, file_path: str, raw_retention: float = 86400, rollup_interval: float = 3600,
+                 flush_interval: float = 1.0):
+        self.file_path = file_path
+        self.raw_retention = raw_retention
+        self.rollup_interval = rollup_interval
+        self.flush_interval = flush_interval
+
+        self.raw: Dict[int, SlotSeries] = {}
+        self.rollups: Dict[int, SlotSeries] = {}
+        self._file = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._last_compact = time.time()
+
+    @property
+    def raw_path(self) -> str:
+        return f"{self.file_path}.raw"
+
+    @property
+    def rollup_path(self) -> str:
+        return f"{self.file_path}.hourly"
+
+    def load(self) -> int:
+        """
+        Load both history files, dropping a torn trailing record if there is one.
+
+        Returns:
+            int: Number of samples loaded
+        """
+        loaded = 0
+        for path, series_map in ((self.rollup_path, self.rollups), (self.raw_path, self.raw)):
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            usable = len(data) - len(data) % SAMPLE.size
+            for timestamp, slot, count in SAMPLE.iter_unpack(data[:usable]):
+                series_map.setdefault(slot, SlotSeries()).append(timestamp, count)
+                loaded += 1
+            if usable < len(data):
+                logger.warning(f"Truncating {len(data) - usable} torn trailing bytes from {path}")
+                with open(path, "r+b") as f:
+                    f.truncate(usable)
+        logger.debug(f"Loaded {loaded} check history samples from {self.file_path}")
+        return loaded
+
+    def last_count(self, slot: int) -> int:
+        for series in (self.raw.get(slot), self.rollups.get(slot)):
+            if series:
+                return series.counts[-1]
+        return 0
+
+    def record(self, slot: int, count: int, timestamp: Optional[float] = None) -> bool:
+        """
+        Record a slot's cumulative checked count if it went up.
+
+        Returns:
+            bool: True if a sample was added
+        """
+        if count <= self.last_count(slot):
+            return False
+        timestamp = time.time() if timestamp is None else timestamp
+        last_time = self.last_check_time(slot)
+        if last_time is not None and timestamp < last_time:
+            timestamp = last_time  # Keep each series in time order for the binary searches
+        self.raw.setdefault(slot, SlotSeries()).append(timestamp, count)
+
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.raw_path) or ".", exist_ok=True)
+                self._file = open(self.raw_path, "ab")
+            self._file.write(SAMPLE.pack(timestamp, slot, count))
+        except Exception as e:
+            logger.error(f"Error appending to check history {self.raw_path}: {e}")
+        self._schedule_flush()
+
+        if timestamp - self._last_compact >= self.rollup_interval:
+            self.compact(timestamp)
+        return True
+
+    def compact(self, now: Optional[float] = None):
+        """Roll raw samples older than raw_retention up into one sample per rollup_interval."""
+        now = time.time() if now is None else now
+        cutoff = now - self.raw_retention
+        rolled = 0
+        for slot, series in self.raw.items():
+            old = series.drop_before(cutoff)
+            if not len(old):
+                continue
+            rollup = self.rollups.setdefault(slot, SlotSeries())
+            for timestamp, count in zip(old.times, old.counts):
+                bucket = timestamp - timestamp % self.rollup_interval
+                if len(rollup) and rollup.times[-1] == bucket:
+                    rollup.counts[-1] = count  # Keep the last count in each interval
+                else:
+                    rollup.append(bucket, count)
+            rolled += len(old)
+        self._last_compact = now
+
+        if rolled:
+            self._rewrite(self.rollup_path, self.rollups)
+            self._rewrite(self.raw_path, self.raw)
+            logger.debug(f"Rolled up {rolled} check history samples in {self.file_path}")
+
+    def _rewrite(self, path: str, series_map: Dict[int, SlotSeries]):
+        """Replace a history file with the current samples, atomically."""
+        if path == self.raw_path:
+            self.close()
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(temp_path, "wb") as f:
+                for slot, series in series_map.items():
+                    f.write(b"".join(SAMPLE.pack(t, slot, c) for t, c in zip(series.times, series.counts)))
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.error(f"Error rewriting check history {path}: {e}")
+
+    def count_at(self, slot: int, timestamp: float) -> int:
+        """
+        Cumulative checks for a slot as of a timestamp.
+
+        Before the first sample the count is taken as flat at the first recorded value, so
+        checks picked up in bulk when tracking starts don't show up as a burst of activity.
+        """
+        raw = self.raw.get(slot)
+        if raw and timestamp >= raw.times[0]:
+            return raw.count_at(timestamp)
+        rollup = self.rollups.get(slot)
+        if rollup:
+            count = rollup.count_at(timestamp)
+            return rollup.counts[0] if count is None else count
+        return raw.counts[0] if raw else 0
+
+    def last_check_time(self, slot: int) -> Optional[float]:
+        """Time of the slot's most recent recorded check (interval start once rolled up), or None."""
+        for series in (self.raw.get(slot), self.rollups.get(slot)):
+            if series:
+                return series.times[-1]
+        return None
+
+    def checks_since(self, slot: int, since: float, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return self.count_at(slot, now) - self.count_at(slot, since)
+
+    def rate(self, slot: int, window: float, now: Optional[float] = None) -> float:
+        """Average checks per hour over the last window seconds."""
+        now = time.time() if now is None else now
+        return self.checks_since(slot, now - window, now) * 3600 / window if window > 0 else 0.0
+
+    def inactive(self, slots: Iterable[int], cutoff: float) -> List[int]:
+        """Slots with no recorded check since the cutoff timestamp."""
+        return [slot for slot in slots if (self.last_check_time(slot) or 0) < cutoff]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "slots": len(set(self.raw) | set(self.rollups)),
+            "raw_samples": sum(len(series) for series in self.raw.values()),
+            "rollup_samples": sum(len(series) for series in self.rollups.values())
+        }
+
+    def _schedule_flush(self):
+        """Flush the samples written in this batch once flush_interval passes (right away without an event loop)."""
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except Exception as e:
+                logger.error(f"Error flushing check history {self.raw_path}: {e}")
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def switch(self, file_path: str) -> int:
+        """
+        Move to another history file (e.g. when the server starts a different seed), keeping the
+        current files on disk.
+
+        Returns:
+            int: Number of samples loaded from the new file
+        """
+        self.close()
+        self.raw.clear()
+        self.rollups.clear()
+        self.file_path = file_path
+        self._last_compact = time.time()
+        logger.info(f"Switched check history to {file_path}")
+        return self.load()
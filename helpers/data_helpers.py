@@ -11,12 +11,74 @@ import sys
 import io
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, NamedTuple
 from collections import namedtuple
 from ruyaml import YAML
 
 logger = logging.getLogger(__name__)
 
+# A decoded .apsave together with a version number that changes whenever the file on disk changes,
+# and the save's hints normalized into Hint records
+SaveSnapshot = namedtuple('SaveSnapshot', ['data', 'version', 'path', 'mtime', 'hints'])
+
+class Hint(NamedTuple):
+    """A hint from the save or a live Hint message, with plain int/bool/str fields (same layout as NetUtils.Hint)."""
+    receiving_player: int = 0
+    finding_player: int = 0
+    location: int = 0
+    item: int = 0
+    found: bool = False
+    entrance: str = ""
+    item_flags: int = 0
+    status: int = 0
+
+def normalize_hint(hint: Any) -> Optional[Hint]:
+    """
+    Convert any hint representation found in a save (NetUtils.Hint, tuple/list or dict) into a Hint.
+    
+    Returns:
+        Optional[Hint]: The normalized hint, or None if it isn't recognisable as a hint
+    """
+    if isinstance(hint, dict):
+        fields = [hint.get(field, default) for field, default in Hint._field_defaults.items()]
+    elif hasattr(hint, 'finding_player') and hasattr(hint, 'item_flags'):
+        fields = [getattr(hint, field, default) for field, default in Hint._field_defaults.items()]
+    elif isinstance(hint, (list, tuple)) and len(hint) >= 7:
+        fields = list(hint[:8])
+        fields += list(Hint._field_defaults.values())[len(fields):]
+    else:
+        return None
+    
+    receiving_player, finding_player, location, item, found, entrance, item_flags, status = fields
+    try:
+        # HintStatus is an IntEnum in Archipelago and a plain object with .value in the fallback unpickler
+        status = int(getattr(status, 'value', status) or 0)
+        return Hint(int(receiving_player), int(finding_player), int(location), int(item),
+                    bool(found), entrance or "", int(item_flags or 0), status)
+    except (TypeError, ValueError):
+        return None
+
+def normalize_save_hints(save_data: Dict[str, Any]) -> Tuple[Hint, ...]:
+    """Normalize and deduplicate every hint in the save's hints dictionary (one set per team/slot)."""
+    hints = set()
+    for hint_set in (save_data.get("hints") or {}).values():
+        if hasattr(hint_set, 'finding_player'):
+            candidates = (hint_set,)  # Single hint object (Hint is itself a tuple)
+        elif isinstance(hint_set, (set, frozenset, list, tuple)):
+            candidates = hint_set
+        elif hint_set:
+            candidates = (hint_set,)  # Single hint object
+        else:
+            continue
+        for candidate in candidates:
+            hint = normalize_hint(candidate)
+            if hint is not None:
+                hints.add(hint)
+    return tuple(hints)
+
+_save_snapshots: Dict[str, SaveSnapshot] = {}
+_save_snapshot_version = 0
+
 def load_game_status(status_file: str = "game_status.json") -> Dict[str, Any]:
     """Load game status from JSON file."""
     if os.path.exists(status_file):
@@ -44,14 +106,90 @@ def save_game_status(game_status: Dict[str, Any], status_file: str = "game_statu
         with open(status_file, 'w') as f:
             json.dump(game_status, f, indent=2)
             logger.debug(f"Saved game status to {status_file}")
-            return True
+        
+        # Membership only changes through here, so this is the one place the index is rebuilt
+        get_player_index(status_file).rebuild(game_status)
+        return True
     except Exception as e:
         logger.error(f"Error saving game status to {status_file}: {e}")
         return False
 
-def load_apsave_data(output_directory: str = "./Archipelago/output/", ap_directory: str = "./Archipelago/") -> Optional[Dict[str, Any]]:
-    """Load and parse the .apsave file to get current game state."""
-    # Look for .apsave files in the output directory
+class PlayerIndex:
+    """
+    Bidirectional index over game_status["discord_users"].
+    
+    Maps Discord user IDs to their player names and player names (case-insensitive) back to
+    the owning Discord user, so lookups don't re-read the status file or scan every user.
+    """
+    
+    def __init__(self):
+        self.players_by_user: Dict[str, List[str]] = {}
+        self.user_by_player: Dict[str, str] = {}  # lowercased player name -> Discord user ID
+    
+    def rebuild(self, game_status: Dict[str, Any]):
+        self.players_by_user = {}
+        self.user_by_player = {}
+        for user_id, player_names in game_status.get("discord_users", {}).items():
+            if not isinstance(player_names, list):
+                player_names = [player_names]  # Legacy single-player format
+            self.players_by_user[str(user_id)] = list(player_names)
+            for player_name in player_names:
+                self.user_by_player[player_name.lower()] = str(user_id)
+        logger.debug(f"Rebuilt player index: {len(self.user_by_player)} player(s) across {len(self.players_by_user)} user(s)")
+    
+    def players_for(self, discord_user_id) -> List[str]:
+        """Player names registered to a Discord user (empty if none)."""
+        return self.players_by_user.get(str(discord_user_id), [])
+    
+    def owner_of(self, player_name: str) -> Optional[str]:
+        """Discord user ID that registered a player name, or None."""
+        return self.user_by_player.get(player_name.lower())
+
+_player_indexes: Dict[str, PlayerIndex] = {}
+
+def get_player_index(status_file: str = "game_status.json") -> PlayerIndex:
+    """Get the player index for a status file, building it from the file on first use."""
+    index = _player_indexes.get(status_file)
+    if index is None:
+        index = PlayerIndex()
+        _player_indexes[status_file] = index
+        index.rebuild(load_game_status(status_file))
+    return index
+
+def load_tracked_servers(state_file: str = "tracked_servers.json") -> List[Dict[str, Any]]:
+    """
+    Load persisted tracked-server definitions.
+    
+    Each entry has server_url, channel_id and password_ref ("host_yaml" or "none"); passwords
+    themselves are never stored.
+    """
+    if not os.path.exists(state_file):
+        logger.debug(f"Tracked servers file {state_file} not found, nothing to resume")
+        return []
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            servers = json.load(f).get("servers", [])
+            logger.debug(f"Loaded {len(servers)} tracked server(s) from {state_file}")
+            return servers
+    except (json.JSONDecodeError, IOError, AttributeError) as e:
+        logger.error(f"Error loading tracked servers from {state_file}: {e}")
+        return []
+
+def save_tracked_servers(servers: List[Dict[str, Any]], state_file: str = "tracked_servers.json") -> bool:
+    """Persist tracked-server definitions, replacing the state file atomically."""
+    temp_file = f"{state_file}.tmp"
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"servers": servers, "timestamp": datetime.now().isoformat()}, f, indent=2)
+        os.replace(temp_file, state_file)
+        logger.debug(f"Saved {len(servers)} tracked server(s) to {state_file}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving tracked servers to {state_file}: {e}")
+        return False
+
+def find_latest_apsave(output_directory: str = "./Archipelago/output/") -> Optional[Path]:
+    """Find the most recently written .apsave file in the output directory."""
     output_path = Path(output_directory)
     apsave_files = list(output_path.glob("*.apsave"))
     
@@ -59,8 +197,49 @@ def load_apsave_data(output_directory: str = "./Archipelago/output/", ap_directo
         logger.debug("No .apsave files found in output directory")
         return None
     
-    # Use the most recent .apsave file
-    apsave_file = max(apsave_files, key=lambda f: f.stat().st_mtime)
+    return max(apsave_files, key=lambda f: f.stat().st_mtime)
+
+def load_save_snapshot(output_directory: str = "./Archipelago/output/", ap_directory: str = "./Archipelago/") -> Optional[SaveSnapshot]:
+    """
+    Load the current save as a versioned snapshot.
+    
+    The decoded save is reused until the .apsave file changes on disk, at which point it
+    is decoded again and given a new version number.
+    
+    Args:
+        output_directory: Directory containing the .apsave file
+        ap_directory: Archipelago install directory (needed to unpickle save classes)
+        
+    Returns:
+        Optional[SaveSnapshot]: The snapshot, or None if no save could be loaded
+    """
+    global _save_snapshot_version
+    
+    apsave_file = find_latest_apsave(output_directory)
+    if not apsave_file:
+        return None
+    
+    mtime = apsave_file.stat().st_mtime
+    cached = _save_snapshots.get(output_directory)
+    if cached and cached.path == apsave_file and cached.mtime == mtime:
+        return cached
+    
+    save_data = load_apsave_data(output_directory, ap_directory)
+    if not save_data:
+        return None
+    
+    _save_snapshot_version += 1
+    snapshot = SaveSnapshot(save_data, _save_snapshot_version, apsave_file, mtime, normalize_save_hints(save_data))
+    _save_snapshots[output_directory] = snapshot
+    logger.debug(f"Loaded save snapshot version {snapshot.version} from {apsave_file}")
+    return snapshot
+
+def load_apsave_data(output_directory: str = "./Archipelago/output/", ap_directory: str = "./Archipelago/") -> Optional[Dict[str, Any]]:
+    """Load and parse the .apsave file to get current game state."""
+    # Use the most recent .apsave file in the output directory
+    apsave_file = find_latest_apsave(output_directory)
+    if not apsave_file:
+        return None
     
     try:
         # Add the Archipelago directory to Python path temporarily
@@ -110,13 +289,7 @@ def parse_apsave_alternative(apsave_file: Path) -> Optional[Dict[str, Any]]:
                             self.flags = flags
                     return NetworkItem
                 elif name == 'Hint':
-                    class Hint(namedtuple('Hint', ['receiving_player', 'finding_player', 'location', 'item', 'found', 'entrance', 'item_flags', 'status'])):
-                        def __new__(cls, receiving_player=0, finding_player=0, location=0, item=0, found=False, entrance="", item_flags=0, status=0):
-                            return super().__new__(cls, receiving_player, finding_player, location, item, found, entrance, item_flags, status)
-                        
-                        def __repr__(self):
-                            return f"Hint(receiving_player={self.receiving_player}, finding_player={self.finding_player}, location={self.location}, item={self.item}, found={self.found}, item_flags={self.item_flags})"
-                    
+                    # Unpickles into a Hint whose fields are still raw (HintStatus is an object); normalize_hint coerces them
                     return Hint
                 elif name == 'HintStatus':
                     class HintStatus:
@@ -394,10 +567,11 @@ async def fetch_and_save_datapackage(server_url: str, password: str = None,
     """
     try:
         # Import here to avoid circular imports
-        from helpers.server_helpers import fetch_server_data
+        from helpers.server_helpers import fetch_server_data, clear_server_data_cache
         
-        # Delete any existing datapackage first
+        # Delete any existing datapackage first, and don't reuse a recently fetched copy
         delete_local_datapackage(file_path)
+        clear_server_data_cache(server_url)
         
         # Fetch server data - directly await the async function
         server_data = await fetch_server_data(server_url, password)
@@ -0,0 +1,357 @@
+"""
+Append-only event journal for tracked Archipelago servers.
+Records live tracking events so tracker state can be rebuilt on startup without decoding the .apsave.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import struct
+import time
+import zlib
+from typing import Dict, Any, List, Optional, Tuple
+
+from helpers.message_processors import parse_item_send_data
+
+logger = logging.getLogger(__name__)
+
+# Default directory for per-server journal files
+DEFAULT_JOURNAL_DIR = "./journals/"
+
+# Record layout: <payload length: uint32><crc32 of payload: uint32><compact JSON payload>
+RECORD_HEADER = struct.Struct("<II")
+
+# Journals are rewritten from their folded state once they grow past this many bytes
+DEFAULT_COMPACT_THRESHOLD = 4 * 1024 * 1024
+
+
+def encode_record(event: Dict[str, Any]) -> bytes:
+    payload = json.dumps(event, separators=(",", ":")).encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def parse_records(raw_data: bytes) -> Tuple[List[Dict[str, Any]], int]:
+    """Decode records up to the first torn or corrupt one. Returns (events, end offset of the last good record)."""
+    events = []
+    offset = 0
+    good_offset = 0
+    while offset < len(raw_data):
+        if offset + RECORD_HEADER.size > len(raw_data):
+            break
+        length, checksum = RECORD_HEADER.unpack_from(raw_data, offset)
+        payload_start = offset + RECORD_HEADER.size
+        payload = raw_data[payload_start:payload_start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        try:
+            events.append(json.loads(payload))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            break
+        offset = payload_start + length
+        good_offset = offset
+    return events, good_offset
+
+
+def compact_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reduce a journal's events to the ones that still affect rebuilt state, in their original order:
+    the latest room event, the first event per checked location and per goal/release/collect slot,
+    and the latest event per hint.
+    """
+    keep = []
+    latest_room = None
+    latest_hints: Dict[tuple, int] = {}
+    seen = set()
+    for event in events:
+        kind = event.get("k")
+        if kind == "room":
+            latest_room = len(keep)
+        elif kind == "item":
+            key = ("item", event.get("s"), event.get("l"))
+            if key in seen:
+                continue
+            seen.add(key)
+        elif kind in ("goal", "release", "collect"):
+            key = (kind, event.get("s"))
+            if key in seen:
+                continue
+            seen.add(key)
+        elif kind == "hint":
+            latest_hints[(event.get("s"), event.get("l"), event.get("i"))] = len(keep)
+        keep.append(event)
+    latest = set(latest_hints.values())
+    if latest_room is not None:
+        latest.add(latest_room)
+    return [event for position, event in enumerate(keep)
+            if event.get("k") not in ("room", "hint") or position in latest]
+
+
+def journal_path_for_server(server_url: str, journal_directory: str = DEFAULT_JOURNAL_DIR) -> str:
+    """Build the journal file path for a server URL (e.g. ws://host:port -> ws_host_port.journal)."""
+    safe_name = re.sub(r"[^A-Za-z0-9.-]+", "_", server_url).strip("_")
+    return os.path.join(journal_directory, f"{safe_name}.journal")
+
+
+class EventJournal:
+    """
+    Checksummed append-only journal with group commit.
+
+    Appends are buffered in memory and written as one batch, followed by a single fsync,
+    either when the batch fills up or when the flush interval elapses. Once the file grows
+    past compact_threshold bytes (and twice its last compacted size) it is rewritten with
+    only the events that still affect the rebuilt state.
+    """
+
+    def __init__(self, file_path: str, flush_interval: float = 0.5, max_batch: int = 256,
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        self.file_path = file_path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.compact_threshold = compact_threshold
+        self.seed_name: Optional[str] = None
+        self.size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        self._compacted_size = 0
+
+        self._pending: List[bytes] = []
+        self._file = None
+        self._batch_full = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._commit_task: Optional[asyncio.Task] = None
+
+    def replay(self, truncate: bool = True) -> List[Dict[str, Any]]:
+        """
+        Read every intact record from the journal. Blocking; from the event loop use load(),
+        which keeps writers out while the file is read.
+
+        A torn or corrupted tail (e.g. from a crash mid-write) is truncated so later
+        appends start from the last good record, unless truncate is False.
+
+        Returns:
+            List of event dictionaries in the order they were written
+        """
+        events = []
+        if not os.path.exists(self.file_path):
+            return events
+
+        with open(self.file_path, "rb") as f:
+            raw_data = f.read()
+
+        events, good_offset = parse_records(raw_data)
+        if good_offset < len(raw_data) and truncate:
+            logger.warning(f"Truncating {len(raw_data) - good_offset} corrupt trailing bytes from {self.file_path}")
+            with open(self.file_path, "r+b") as f:
+                f.truncate(good_offset)
+            self.size = good_offset
+        else:
+            self.size = len(raw_data)
+
+        for event in events:
+            if event.get("k") == "room":
+                self.seed_name = event.get("seed")
+
+        logger.debug(f"Replayed {len(events)} events from {self.file_path}")
+        return events
+
+    async def load(self, read_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Flush pending records, then replay the journal off the event loop while holding the write lock,
+        so no batch is half-written while it is read. A torn tail is only truncated when this journal
+        has no file open for appending and read_only is False.
+        """
+        await self.flush()
+        async with self._write_lock:
+            return await asyncio.to_thread(self.replay, not read_only and self._file is None)
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Queue an event for the next group commit."""
+        self._pending.append(encode_record(event))
+
+        if event.get("k") == "room":
+            self.seed_name = event.get("seed")
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. called from a script) - write through immediately
+            batch, self._pending = self._pending, []
+            self._write_batch(batch)
+            return
+
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+        if self._commit_task is None or self._commit_task.done():
+            self._commit_task = loop.create_task(self._group_commit())
+
+    async def _group_commit(self):
+        """Flush pending records once the batch fills up or the flush interval passes."""
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def flush(self):
+        """Write all pending records and fsync them."""
+        async with self._write_lock:
+            self._batch_full.clear()
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            await asyncio.to_thread(self._write_batch, batch)
+            if self.size > max(self.compact_threshold, 2 * self._compacted_size):
+                await asyncio.to_thread(self._compact)
+
+    def _write_batch(self, batch: List[bytes]):
+        """Write a batch of encoded records with a single fsync."""
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+                self._file = open(self.file_path, "ab")
+            data = b"".join(batch)
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.size += len(data)
+        except Exception as e:
+            logger.error(f"Error writing {len(batch)} journal records to {self.file_path}: {e}")
+
+    def _compact(self):
+        """Rewrite the journal with only the events that still affect rebuilt state, atomically."""
+        temp_path = f"{self.file_path}.tmp"
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with open(self.file_path, "rb") as f:
+                events, _ = parse_records(f.read())
+            compacted = compact_events(events)
+            data = b"".join(encode_record(event) for event in compacted)
+            with open(temp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.file_path)
+            logger.info(f"Compacted journal {self.file_path}: {len(events)} -> {len(compacted)} events, "
+                        f"{self.size} -> {len(data)} bytes")
+            self.size = len(data)
+        except Exception as e:
+            logger.error(f"Error compacting journal {self.file_path}: {e}")
+        # Don't try again until the journal has doubled, even if this compaction failed
+        self._compacted_size = self.size
+
+    async def reset(self):
+        """Discard the journal contents, e.g. when the server starts a different seed."""
+        async with self._write_lock:
+            self._pending.clear()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+            self.seed_name = None
+            self.size = 0
+            self._compacted_size = 0
+        logger.info(f"Reset journal {self.file_path}")
+
+    async def close(self):
+        """Flush outstanding records and close the journal file."""
+        await self.flush()
+        if self._commit_task and not self._commit_task.done():
+            self._commit_task.cancel()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def journal_event_from_message(msg: dict) -> Optional[Dict[str, Any]]:
+    """
+    Convert an Archipelago message into a compact journal event.
+
+    Returns:
+        Event dictionary, or None if the message isn't tracked state
+    """
+    cmd = msg.get("cmd", "")
+    now = int(time.time())
+
+    if cmd == "RoomInfo" and msg.get("seed_name"):
+        return {"k": "room", "t": now, "seed": msg["seed_name"]}
+
+    if cmd != "PrintJSON":
+        return None
+
+    msg_type = msg.get("type", "")
+
+    if msg_type == "ItemSend":
+        network_item = msg.get("item")
+        if isinstance(network_item, dict):
+            sender_id = network_item.get("player")
+            recipient_id = msg.get("receiving")
+            item_id = network_item.get("item")
+            item_flags = network_item.get("flags", 0)
+            location_id = network_item.get("location")
+        else:
+            sender_id, recipient_id, item_id, item_flags, location_id = parse_item_send_data(msg.get("data", []))
+
+        if sender_id is None or location_id is None:
+            return None
+        return {
+            "k": "item", "t": now,
+            "s": int(sender_id), "r": int(recipient_id) if recipient_id is not None else None,
+            "i": int(item_id) if item_id is not None else None,
+            "l": int(location_id), "f": int(item_flags or 0)
+        }
+
+    if msg_type == "Hint":
+        network_item = msg.get("item") or {}
+        return {
+            "k": "hint", "t": now,
+            "s": network_item.get("player"), "r": msg.get("receiving"),
+            "i": network_item.get("item"), "l": network_item.get("location"),
+            "f": network_item.get("flags", 0), "found": bool(msg.get("found", False))
+        }
+
+    if msg_type in ("Goal", "Release", "Collect"):
+        return {"k": msg_type.lower(), "t": now, "s": msg.get("slot")}
+
+    return None
+
+
+def rebuild_tracking_state(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fold replayed journal events into tracker state.
+
+    Returns:
+        Dictionary with player_progress ({slot: set of location_ids}), announced
+        ({(sender, location)} for every journaled check, the same keys live dedupe uses), goals, released and collected slot sets,
+        hint events, and the seed name the events belong to
+    """
+    state = {
+        "seed_name": None,
+        "player_progress": {},
+        "announced": set(),
+        "goals": set(),
+        "released": set(),
+        "collected": set(),
+        "hints": []
+    }
+
+    for event in events:
+        kind = event.get("k")
+        if kind == "item":
+            state["player_progress"].setdefault(event["s"], set()).add(event["l"])
+            state["announced"].add((event["s"], event["l"]))
+        elif kind == "goal":
+            state["goals"].add(event.get("s"))
+        elif kind == "release":
+            state["released"].add(event.get("s"))
+        elif kind == "collect":
+            state["collected"].add(event.get("s"))
+        elif kind == "hint":
+            state["hints"].append(event)
+        elif kind == "room":
+            state["seed_name"] = event.get("seed")
+
+    return state
@@ -4,7 +4,9 @@ Formatting and message processing helper functions for Archipelago Discord bot.
 
 import re
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Tuple
+
+from helpers.lookup_helpers import lookup_names_batch
 
 logger = logging.getLogger(__name__)
 
@@ -32,35 +34,131 @@ def format_hint_message(hint_data: Dict[str, Any], player_name: str) -> str:
         logger.error(f"Error formatting hint message for player {player_name}: {e}")
         return f"🔍 **Hint for {player_name}**: Error formatting hint message"
 
-def resolve_hint_pattern(match, player_game: str, pattern_type: str, game_data: Dict[str, Any], lookup_item_func, lookup_location_func) -> str:
-    """Helper method to resolve hint patterns like 'ItemID is at LocationID'."""
-    try:
-        item_id = int(match.group(1))
-        location_id = int(match.group(2))
-        
-        # Look up names
-        item_name = lookup_item_func(player_game, item_id)
-        location_name = lookup_location_func(player_game, location_id)
-        
-        # Clean up names (remove "Item XXXX" or "Location XXXX" formats)
-        if item_name and item_name != f"Item {item_id}" and "Item" not in item_name:
-            resolved_item = item_name
-        else:
-            resolved_item = f"Item {item_id}"
-        
-        if location_name and location_name != f"Location {location_id}" and "Location" not in location_name:
-            resolved_location = location_name
-        else:
-            resolved_location = f"Location {location_id}"
-        
-        return f"{resolved_item} {pattern_type} {resolved_location}"
-        
-    except Exception as e:
-        logger.error(f"Error resolving hint pattern: {e}")
-        return match.group(0)  # Return original if error
+def printjson_text(msg: Dict[str, Any]) -> str:
+    """Plain text of a PrintJSON message, built from its data parts (or of a legacy Print message)."""
+    if "data" not in msg:
+        return str(msg.get("text", ""))
+    text_parts = []
+    for part in msg.get("data", []):
+        if isinstance(part, dict) and "text" in part:
+            text_parts.append(part["text"])
+        elif isinstance(part, str):
+            text_parts.append(part)
+    return "".join(text_parts)
+
+# Phrases the server uses when answering a !hint command
+HINT_RESPONSE_INDICATORS = (
+    "found at",
+    "is at",
+    "you already know",
+    "not enough points",
+    "no such item",
+    "cannot afford",
+    "item does not exist",
+    "already hinted"
+)
+HINT_LOCATION_PATTERNS = (" in ", " at ", " from ", " (world ", " - ")
+
+def is_hint_response(msg: Dict[str, Any], item_name: str, player_name: str) -> bool:
+    """Check whether a message is the server's answer to a player's !hint command for an item."""
+    if msg.get("cmd") != "PrintJSON":
+        return False
+    full_text = printjson_text(msg)
+    
+    # Skip our own hint command message and the player's command echo
+    if full_text.strip() == f"!hint {item_name}":
+        return False
+    if full_text.strip().startswith(f"{player_name}:") and "!hint" in full_text:
+        return False
+    
+    lowered = full_text.lower()
+    contains_item = item_name.lower() in lowered
+    has_hint_pattern = any(indicator in lowered for indicator in HINT_RESPONSE_INDICATORS)
+    has_location_info = any(pattern in lowered for pattern in HINT_LOCATION_PATTERNS)
+    
+    # Looks like a server response (not just our command)
+    return bool(
+        ((contains_item and (has_hint_pattern or has_location_info)) or has_hint_pattern)
+        and full_text.strip() and not full_text.startswith("!")
+    )
+
+# PrintJSON part types whose text is an ID to be resolved to a name
+TYPED_ID_PARTS = ("player_id", "item_id", "location_id")
+# Standalone numbers in plain hint text, for messages without typed parts
+HINT_ID_PATTERN = re.compile(r'\b\d{1,6}\b')
+# Larger numbers are unlikely to be game IDs
+MAX_PLAIN_HINT_ID = 100000
 
-async def process_hint_response(hint_text: str, player_game: str, game_data: Dict[str, Any], lookup_item_func, lookup_location_func, fetch_server_data_func) -> str:
-    """Process hint response to resolve item and location names from IDs."""
+def resolve_printjson_parts(parts: List[Any], slot_info: Dict[str, Dict[str, Any]], default_game: str,
+                            game_data: Dict[str, Any]) -> str:
+    """
+    Render PrintJSON parts as text, replacing player, item and location IDs with names.
+
+    Items and locations are looked up in the game of the slot the part names (its "player"
+    field), falling back to default_game, and all names are resolved in one batch.
+    """
+    def part_game(part: Dict[str, Any]) -> str:
+        slot = slot_info.get(str(part.get("player")), {})
+        return slot.get("game") or default_game
+
+    item_requests: List[Tuple[str, int]] = []
+    location_requests: List[Tuple[str, int]] = []
+    for part in parts:
+        if isinstance(part, dict) and str(part.get("text", "")).isdigit():
+            if part.get("type") == "item_id":
+                item_requests.append((part_game(part), int(part["text"])))
+            elif part.get("type") == "location_id":
+                location_requests.append((part_game(part), int(part["text"])))
+    item_names, location_names = lookup_names_batch(item_requests, location_requests, game_data)
+
+    text_parts = []
+    for part in parts:
+        if isinstance(part, str):
+            text_parts.append(part)
+            continue
+        if not isinstance(part, dict):
+            continue
+        text = str(part.get("text", ""))
+        part_type = part.get("type")
+        if part_type == "player_id":
+            text = slot_info.get(text, {}).get("name", text)
+        elif part_type == "item_id" and text.isdigit():
+            text = item_names[(part_game(part), int(text))]
+        elif part_type == "location_id" and text.isdigit():
+            text = location_names[(part_game(part), int(text))]
+        text_parts.append(text)
+    return "".join(text_parts)
+
+def resolve_plain_hint_text(hint_text: str, player_game: str, game_data: Dict[str, Any]) -> str:
+    """
+    Replace standalone IDs in plain hint text with item (or else location) names from one game.
+
+    Only used for messages that don't carry typed parts; IDs that resolve to neither are left as-is.
+    """
+    matches = [match for match in HINT_ID_PATTERN.finditer(hint_text) if int(match.group()) <= MAX_PLAIN_HINT_ID]
+    if not matches:
+        return hint_text
+    requests = [(player_game, int(match.group())) for match in matches]
+    item_names, location_names = lookup_names_batch(requests, requests, game_data)
+
+    text_parts = []
+    position = 0
+    for match, request in zip(matches, requests):
+        name = item_names[request]
+        if name == f"Item {request[1]}":
+            name = location_names[request]
+            if name == f"Location {request[1]}":
+                name = match.group()
+        text_parts.append(hint_text[position:match.start()])
+        text_parts.append(name)
+        position = match.end()
+    text_parts.append(hint_text[position:])
+    return "".join(text_parts)
+
+async def process_hint_response(msg: Dict[str, Any], player_game: str, game_data: Dict[str, Any],
+                                slot_info: Dict[str, Dict[str, Any]], fetch_server_data_func) -> str:
+    """Render a hint response message with item, location and player names in place of IDs."""
+    hint_text = printjson_text(msg)
     try:
         # First, try to get game data if we don't have it
         if not game_data:
@@ -73,59 +171,12 @@ async def process_hint_response(hint_text: str, player_game: str, game_data: Dic
                 logger.debug("Failed to fetch game data for hint processing")
                 return hint_text  # Return original if can't get data
         
-        processed_text = hint_text
-        
-        # Look for patterns that might contain IDs to resolve
-        if player_game in game_data:
-            # Look for item and location IDs in various patterns
-            id_pattern = r'\b(\d+)\b'
-            ids_found = re.findall(id_pattern, processed_text)
-            
-            # Create a map of resolved IDs to avoid duplicates
-            id_replacements = {}
-            
-            for id_str in ids_found:
-                try:
-                    id_num = int(id_str)
-                    
-                    # Skip very large numbers (likely not game IDs)
-                    if id_num > 100000:
-                        continue
-                    
-                    # Try as item ID first
-                    item_name = lookup_item_func(player_game, id_num)
-                    if item_name and item_name != f"Item {id_num}" and "Item" not in item_name:
-                        id_replacements[id_str] = item_name
-                        continue
-
-                    # Try as location ID
-                    location_name = lookup_location_func(player_game, id_num)
-                    if location_name and location_name != f"Location {id_num}" and "Location" not in location_name:
-                        id_replacements[id_str] = location_name
-                        continue
-                        
-                except ValueError:
-                    continue
-            
-            # Apply all replacements, but only replace raw IDs with names (no ID numbers shown)
-            for id_str, name in id_replacements.items():
-                # Replace only if the ID appears as a standalone number
-                processed_text = re.sub(rf'\b{id_str}\b', name, processed_text)
-        
-        # Advanced pattern matching for common Archipelago hint formats
-        # Pattern: "ItemName is at LocationName"
-        processed_text = re.sub(r'\b(\d+)\s+is\s+at\s+(\d+)\b', 
-                              lambda m: resolve_hint_pattern(m, player_game, "is at", game_data, lookup_item_func, lookup_location_func), 
-                              processed_text)
-        
-        # Pattern: "ItemName found at LocationName"
-        processed_text = re.sub(r'\b(\d+)\s+found\s+at\s+(\d+)\b', 
-                              lambda m: resolve_hint_pattern(m, player_game, "found at", game_data, lookup_item_func, lookup_location_func), 
-                              processed_text)
-        
-        # Clean up any remaining unreplaced patterns that look like "Item XXXX" or "Location XXXX"
-        processed_text = re.sub(r'\bItem\s+(\d+)\b', r'Item \1', processed_text)
-        processed_text = re.sub(r'\bLocation\s+(\d+)\b', r'Location \1', processed_text)
+        # The server marks IDs in typed parts; only fall back to scanning the text when it doesn't
+        parts = msg.get("data", [])
+        if any(isinstance(part, dict) and part.get("type") in TYPED_ID_PARTS for part in parts):
+            processed_text = resolve_printjson_parts(parts, slot_info, player_game, game_data)
+        else:
+            processed_text = resolve_plain_hint_text(hint_text, player_game, game_data)
         
         logger.debug(f"Hint processing: '{hint_text}' -> '{processed_text}'")
         return processed_text
@@ -0,0 +1,137 @@
+"""
+Indexed hint store for Archipelago game tracking.
+Groups hints by finding player, receiving player and status so hint commands read buckets
+instead of scanning every hint for every player.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple, Iterable
+
+from helpers.data_helpers import Hint, normalize_hint
+
+logger = logging.getLogger(__name__)
+
+# HintStatus.HINT_FOUND in Archipelago
+HINT_STATUS_FOUND = 40
+
+
+class HintIndex:
+    """
+    Hints keyed by (finding_player, location), bucketed by finder, receiver and status.
+
+    Built from a save snapshot once per snapshot version and updated incrementally from
+    newer snapshots and live Hint messages; a hint whose found flag or status changes
+    is moved between buckets rather than duplicated.
+    """
+
+    def __init__(self):
+        self.hints: Dict[Tuple[int, int], Hint] = {}
+        self.by_finder: Dict[int, Dict[Tuple[int, int], Hint]] = {}
+        self.by_receiver: Dict[int, Dict[Tuple[int, int], Hint]] = {}
+        self.by_status: Dict[int, Dict[Tuple[int, int], Hint]] = {}
+        self.found: set = set()  # keys of found hints
+        self.unfound: set = set()  # keys of unfound hints
+        self.snapshot_version: Optional[int] = None
+        self.version = 0  # bumped whenever a hint is added or changes
+
+    def __len__(self) -> int:
+        return len(self.hints)
+
+    def add(self, hint) -> bool:
+        """
+        Add or update a hint.
+
+        Returns:
+            bool: True if the hint was new or changed
+        """
+        hint = normalize_hint(hint)
+        if hint is None:
+            return False
+
+        key = (hint.finding_player, hint.location)
+        existing = self.hints.get(key)
+        if existing is not None:
+            if (existing.found, existing.status) == (hint.found, hint.status):
+                return False
+            if existing.found and not hint.found:
+                return False  # Found is final; an older save can't un-find a hint seen live
+            self._remove(key, existing)
+
+        self.hints[key] = hint
+        self.by_finder.setdefault(hint.finding_player, {})[key] = hint
+        self.by_receiver.setdefault(hint.receiving_player, {})[key] = hint
+        self.by_status.setdefault(hint.status, {})[key] = hint
+        (self.found if hint.found else self.unfound).add(key)
+        self.version += 1
+        return True
+
+    def _remove(self, key: Tuple[int, int], hint: Hint):
+        self.by_finder.get(hint.finding_player, {}).pop(key, None)
+        self.by_receiver.get(hint.receiving_player, {}).pop(key, None)
+        self.by_status.get(hint.status, {}).pop(key, None)
+        self.found.discard(key)
+        self.unfound.discard(key)
+
+    def apply_snapshot(self, snapshot) -> int:
+        """
+        Fold in the hints from a save snapshot if it is newer than the last one applied.
+
+        Returns:
+            int: Number of hints added or changed
+        """
+        if snapshot is None or snapshot.version == self.snapshot_version:
+            return 0
+        changed = sum(self.add(hint) for hint in snapshot.hints)
+        self.snapshot_version = snapshot.version
+        logger.debug(f"Applied hints from save snapshot {snapshot.version}: {changed} new or changed")
+        return changed
+
+    def add_from_message(self, msg: dict) -> bool:
+        """Add a hint from a live PrintJSON Hint message."""
+        network_item = msg.get("item") or {}
+        if network_item.get("player") is None or network_item.get("location") is None:
+            return False
+        found = bool(msg.get("found", False))
+        return self.add(Hint(
+            msg.get("receiving", 0), network_item["player"], network_item["location"], network_item.get("item", 0),
+            found, "", network_item.get("flags", 0), HINT_STATUS_FOUND if found else 0
+        ))
+
+    def query(self, finder: Optional[int] = None, receiver: Optional[int] = None,
+              key_items_only: bool = True, exclude_found: bool = False) -> List[Hint]:
+        """
+        Hints for a finding and/or receiving player, read straight from the buckets.
+
+        Args:
+            finder: Only hints found in this player's world
+            receiver: Only hints for this player's items
+            key_items_only: Only progression items (item_flags == 1)
+            exclude_found: Skip hints whose item has already been found
+        """
+        if finder is not None:
+            bucket = self.by_finder.get(finder, {})
+            if receiver is not None:
+                bucket = {key: hint for key, hint in bucket.items() if hint.receiving_player == receiver}
+        elif receiver is not None:
+            bucket = self.by_receiver.get(receiver, {})
+        else:
+            bucket = self.hints
+
+        return [
+            hint for key, hint in bucket.items()
+            if not (key_items_only and hint.item_flags != 1) and not (exclude_found and key in self.found)
+        ]
+
+    def finders(self) -> Iterable[int]:
+        """Players that have at least one hint in their world."""
+        return [finder for finder, bucket in self.by_finder.items() if bucket]
+
+    def reset(self):
+        self.hints.clear()
+        self.by_finder.clear()
+        self.by_receiver.clear()
+        self.by_status.clear()
+        self.found.clear()
+        self.unfound.clear()
+        self.snapshot_version = None
+        self.version += 1
@@ -0,0 +1,153 @@
+"""
+Compact bitset storage for checked Archipelago locations.
+Maps each game's location IDs to dense offsets so a player's checks fit in one bit per location.
+"""
+
+import logging
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Cached per (game, checksum) so every slot playing the same game shares one index
+_location_indexes: Dict[Tuple[str, Any], "LocationIndex"] = {}
+
+
+class LocationIndex:
+    """Dense offsets for one game's location table."""
+
+    __slots__ = ("game", "ids", "_base", "_offsets")
+
+    def __init__(self, game: str, location_ids: Iterable[int]):
+        self.game = game
+        self.ids = sorted(set(int(location_id) for location_id in location_ids))
+
+        # Most worlds number their locations contiguously, in which case the offset is just id - base
+        if self.ids and self.ids[-1] - self.ids[0] + 1 == len(self.ids):
+            self._base = self.ids[0]
+            self._offsets = None
+        else:
+            self._base = None
+            self._offsets = {location_id: offset for offset, location_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def offset(self, location_id: int) -> Optional[int]:
+        """Dense offset for a location ID, or None if it isn't in this game's table."""
+        if self._offsets is None:
+            offset = location_id - self._base
+            return offset if 0 <= offset < len(self.ids) else None
+        return self._offsets.get(location_id)
+
+
+def get_location_index(game: str, game_info: Dict[str, Any]) -> Optional[LocationIndex]:
+    """
+    Get the (cached) location index for a game from its DataPackage entry.
+
+    Returns:
+        LocationIndex, or None if the game has no location table
+    """
+    location_table = game_info.get("location_name_to_id")
+    if not location_table:
+        return None
+
+    cache_key = (game, game_info.get("checksum") or len(location_table))
+    index = _location_indexes.get(cache_key)
+    if index is None:
+        index = LocationIndex(game, location_table.values())
+        _location_indexes[cache_key] = index
+        logger.debug(f"Built location index for {game} with {len(index)} locations")
+    return index
+
+
+class LocationBitset:
+    """
+    Set of checked location IDs for one slot, stored as one bit per location.
+
+    Supports the set operations the tracker uses (add, update, membership, len, iteration).
+    len() is a maintained popcount, and merging with another bitset over the same index is
+    a single word-wise OR. IDs outside the game's table, such as server-sent items, go in a small overflow set.
+    """
+
+    __slots__ = ("index", "_bits", "_count", "_extra")
+
+    def __init__(self, index: LocationIndex, location_ids: Iterable[int] = ()):
+        self.index = index
+        self._bits = bytearray((len(index) + 7) // 8)
+        self._count = 0
+        self._extra = set()
+        self.update(location_ids)
+
+    def add(self, location_id: int):
+        offset = self.index.offset(location_id)
+        if offset is None:
+            self._extra.add(location_id)
+            return
+        byte, mask = offset >> 3, 1 << (offset & 7)
+        if not self._bits[byte] & mask:
+            self._bits[byte] |= mask
+            self._count += 1
+
+    def update(self, location_ids: Iterable[int]):
+        if isinstance(location_ids, LocationBitset) and location_ids.index is self.index:
+            self |= location_ids
+            return
+        for location_id in location_ids:
+            self.add(location_id)
+
+    def __ior__(self, other: "LocationBitset") -> "LocationBitset":
+        """Word-wise merge with another bitset over the same index."""
+        if other.index is not self.index:
+            for location_id in other:
+                self.add(location_id)
+            return self
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(other._bits, "little")
+        self._bits = bytearray(merged.to_bytes(len(self._bits), "little"))
+        self._count = merged.bit_count()
+        self._extra |= other._extra
+        return self
+
+    def union(self, other: Iterable[int]) -> "LocationBitset":
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    __or__ = union
+
+    def copy(self) -> "LocationBitset":
+        duplicate = LocationBitset(self.index)
+        duplicate._bits = bytearray(self._bits)
+        duplicate._count = self._count
+        duplicate._extra = set(self._extra)
+        return duplicate
+
+    def __contains__(self, location_id: int) -> bool:
+        offset = self.index.offset(location_id)
+        if offset is None:
+            return location_id in self._extra
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def __len__(self) -> int:
+        return self._count + len(self._extra)
+
+    def __iter__(self) -> Iterator[int]:
+        ids = self.index.ids
+        for byte_offset, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield ids[(byte_offset << 3) + bit]
+        yield from self._extra
+
+    def __repr__(self) -> str:
+        return f"LocationBitset({self.index.game!r}, {self._count}/{len(self.index)} checked, {len(self._extra)} extra)"
+
+
+def union_locations(first: Iterable[int], second: Iterable[int]):
+    """Union two location collections, using a word-wise merge when either is a bitset."""
+    if isinstance(first, LocationBitset):
+        return first.union(second)
+    if isinstance(second, LocationBitset):
+        return second.union(first)
+    return set(first).union(second)
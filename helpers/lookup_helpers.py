@@ -4,7 +4,7 @@ Lookup and name resolution helper functions for Archipelago Discord bot.
 
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Tuple
 from helpers.data_helpers import get_from_datapackage
 
 logger = logging.getLogger(__name__)
@@ -253,3 +253,80 @@ def lookup_player_game(player_id: int, connection_data: Dict[str, Any] = None,
         str: Player's game or "Unknown" if not found
     """
     return lookup_player_info(player_id, "game", "Unknown", connection_data, file_path)
+
+def lookup_names_batch(item_requests: Iterable[Tuple[str, int]], location_requests: Iterable[Tuple[str, int]],
+                       game_data: Dict[str, Any] = None,
+                       file_path: str = DEFAULT_DATAPACKAGE_PATH) -> Tuple[Dict[Tuple[str, int], str], Dict[Tuple[str, int], str]]:
+    """
+    Resolve many item and location names in one pass.
+    
+    The datapackage is loaded at most once and each game's reverse mapping is built
+    only once, instead of once per lookup.
+    
+    Args:
+        item_requests: (game, item_id) pairs to resolve
+        location_requests: (game, location_id) pairs to resolve
+        game_data: Optional game data from server (fallback)
+        file_path: Path to local datapackage file
+        
+    Returns:
+        Tuple of ({(game, item_id): name}, {(game, location_id): name}), using
+        "Item {id}" / "Location {id}" for anything that can't be resolved
+    """
+    if not game_data and os.path.exists(file_path):
+        try:
+            game_data = get_from_datapackage("game_data", file_path)
+        except Exception as e:
+            logger.debug(f"Error using local datapackage: {e}")
+    game_data = game_data or {}
+    
+    reverse_mappings = {}
+    
+    def resolve(requests, mapping_key, default_prefix):
+        resolved = {}
+        for game, lookup_id in requests:
+            if (game, lookup_id) in resolved:
+                continue
+            if (game, mapping_key) not in reverse_mappings:
+                mapping = game_data.get(game, {}).get(mapping_key, {})
+                reverse_mappings[(game, mapping_key)] = {str(id_value): name for name, id_value in mapping.items()}
+            name = reverse_mappings[(game, mapping_key)].get(str(lookup_id))
+            resolved[(game, lookup_id)] = name if name else f"{default_prefix} {lookup_id}"
+        return resolved
+    
+    item_names = resolve(item_requests, "item_name_to_id", "Item")
+    location_names = resolve(location_requests, "location_name_to_id", "Location")
+    logger.debug(f"Batch resolved {len(item_names)} items and {len(location_names)} locations")
+    return item_names, location_names
+
+def lookup_players_batch(player_ids: Iterable[int], connection_data: Dict[str, Any] = None,
+                         file_path: str = DEFAULT_DATAPACKAGE_PATH) -> Dict[int, Dict[str, str]]:
+    """
+    Resolve name and game for many players in one pass.
+    
+    Args:
+        player_ids: Player IDs to look up
+        connection_data: Optional connection data from server (fallback)
+        file_path: Path to local datapackage file
+        
+    Returns:
+        Dict[int, Dict[str, str]]: {player_id: {"name": ..., "game": ...}} for every requested ID
+    """
+    if not connection_data and os.path.exists(file_path):
+        try:
+            connection_data = get_from_datapackage("connection_data", file_path)
+        except Exception as e:
+            logger.debug(f"Error using local datapackage: {e}")
+    
+    slot_info = {}
+    for conn_data in (connection_data or {}).values():
+        slot_info.update(conn_data.get("slot_info", {}))
+    
+    players = {}
+    for player_id in player_ids:
+        info = slot_info.get(str(player_id), {})
+        players[player_id] = {
+            "name": info.get("name", f"Player {player_id}"),
+            "game": info.get("game", "Unknown")
+        }
+    return players
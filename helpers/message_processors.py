@@ -3,8 +3,6 @@ Message processors for handling different Archipelago message types.
 This module contains functions to process and format AP messages for Discord.
 """
 
-from helpers.data_helpers import load_apsave_data
-
 async def process_connected_message(msg: dict, channel, connection_data: dict):
     """Process Connected message type"""
     # Store connection data for player lookups - use a simpler approach
@@ -45,41 +43,44 @@ async def process_location_info_message(msg: dict, channel):
         await channel.send(f"📍 **{player_name}** checked: {location_name}")
 
 
-async def process_item_send_message(data: list, channel, player_progress: dict, output_directory: str,
-                                  ap_dir: str, lookup_player_name_func, lookup_player_game_func,
-                                  lookup_item_name_func, lookup_location_name_func, is_player_completed_func):
+def parse_item_send_data(data: list) -> tuple:
+    """Extract (sender_id, recipient_id, item_id, item_flags, location_id) from ItemSend data parts"""
+    sender_id = None
+    recipient_id = None
+    item_id = None
+    item_flags = None
+    location_id = None
+
+    for item in data:
+        if item.get("type") == "player_id":
+            if sender_id is None:
+                sender_id = item.get("text")
+            else:
+                recipient_id = item.get("text")
+        elif item.get("type") == "item_id":
+            item_id = item.get("text")
+            item_flags = item.get("flags", 0)
+        elif item.get("type") == "location_id":
+            location_id = item.get("text")
+
+    return sender_id, recipient_id, item_id, item_flags, location_id
+
+
+async def process_item_send_message(data: list, channel, record_check_func, lookup_player_name_func,
+                                  lookup_player_game_func, lookup_item_name_func, lookup_location_name_func,
+                                  is_player_completed_func):
     """Process ItemSend message type within PrintJSON"""
     try:
         # Extract components from the data array
-        sender_id = None
-        recipient_id = None
-        item_id = None
-        item_flags = None
-        location_id = None
-
-        for item in data:
-            if item.get("type") == "player_id":
-                if sender_id is None:
-                    sender_id = item.get("text")
-                else:
-                    recipient_id = item.get("text")
-            elif item.get("type") == "item_id":
-                item_id = item.get("text")
-                item_flags = item.get("flags", 0)
-            elif item.get("type") == "location_id":
-                location_id = item.get("text")
+        sender_id, recipient_id, item_id, item_flags, location_id = parse_item_send_data(data)
 
         # Track location check for progress tracking
         if sender_id and location_id:
             sender_id_int = int(sender_id)
             location_id_int = int(location_id)
 
-            # Initialize player progress if not exists
-            if sender_id_int not in player_progress:
-                player_progress[sender_id_int] = set()
-
-            # Add this location to the player's checked locations
-            player_progress[sender_id_int].add(location_id_int)
+            # Add this location to the player's checked locations (keeps completion status current)
+            record_check_func(sender_id_int, location_id_int)
             print(f"Tracked location check: Player {sender_id_int} checked location {location_id_int}")
 
         # Only send messages for progression items (key items)
@@ -102,10 +103,8 @@ async def process_item_send_message(data: list, channel, player_progress: dict,
             # Check if the recipient player has completed 100% of their locations
             recipient_id_int = int(recipient_id)
 
-            # Only perform the completion check if we have save data loaded
-            # Try to load save data if needed
-            save_data = load_apsave_data(output_directory, ap_dir)
-            if save_data and is_player_completed_func(recipient_id_int, save_data):
+            # Completed slots are tracked from the save snapshot and live checks, so this is a set lookup
+            if is_player_completed_func(recipient_id_int):
                 print(f"Skipping ItemSend to player {recipient_name} who has completed 100% of locations")
                 return
 
@@ -231,9 +230,11 @@ async def process_data_package_message(msg: dict, channel, game_data: dict):
             location_count = len(game_info.get("location_name_to_id", {}))
             print(f"Game '{game_name}': {item_count} items, {location_count} locations")
 
-        game_list = list(games.keys())
-        await channel.send(f"🎲 **Available games**: {', '.join(game_list[:10])}" +
-                        ("..." if len(game_list) > 10 else ""))
+        # No channel means the announcement was already made (e.g. on a resumed connection)
+        if channel is not None:
+            game_list = list(games.keys())
+            await channel.send(f"🎲 **Available games**: {', '.join(game_list[:10])}" +
+                            ("..." if len(game_list) > 10 else ""))
     else:
         print("DataPackage received but no games data found")
 
@@ -0,0 +1,151 @@
+"""
+Self-updating progress dashboard for Archipelago game tracking.
+Keeps one message per tracked seed edited in place from the live progress state.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, List, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressDashboard:
+    """
+    One dashboard message, re-rendered when progress changes.
+
+    notify() is cheap and can be called on every progress change. Changes are coalesced:
+    the message is edited at most once every min_interval seconds, and only when the
+    rendered content actually differs from what is already posted.
+    """
+
+    def __init__(self, channel, render_func: Callable[[], str], min_interval: float = 30.0,
+                 message_id: Optional[int] = None, on_new_message: Optional[Callable[[int], None]] = None):
+        self.channel = channel
+        self.render_func = render_func
+        self.min_interval = min_interval
+        self.message_id = message_id
+        self.on_new_message = on_new_message  # called with the ID when a new dashboard message is posted
+
+        self._message = None
+        self._last_content: Optional[str] = None
+        self._last_edit = 0.0
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+        self.edits = 0
+        self.skipped = 0  # renders that matched the posted content
+
+    def notify(self):
+        """Mark the dashboard stale and schedule an update if one isn't already pending."""
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._dirty:
+            delay = self._last_edit + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._dirty = False
+
+            try:
+                content = self.render_func()
+            except Exception as e:
+                logger.error(f"Error rendering progress dashboard: {e}")
+                return
+            if content == self._last_content:
+                self.skipped += 1
+                continue
+
+            try:
+                await self._publish(content)
+            except Exception as e:
+                logger.error(f"Error updating progress dashboard: {e}")
+            # Count failed edits too, so a failing edit isn't retried in a tight loop
+            self._last_edit = time.monotonic()
+
+    async def _publish(self, content: str):
+        """Edit the dashboard message, posting a new one if it doesn't exist (or was deleted)."""
+        if self._message is None and self.message_id is not None:
+            try:
+                self._message = await self.channel.fetch_message(self.message_id)
+            except Exception as e:
+                logger.info(f"Dashboard message {self.message_id} not available, posting a new one: {e}")
+                self.message_id = None
+
+        if self._message is not None:
+            try:
+                await self._message.edit(content=content)
+                self._last_content = content
+                self.edits += 1
+                return
+            except Exception as e:
+                logger.info(f"Could not edit dashboard message {self.message_id}, posting a new one: {e}")
+                self._message = None
+
+        self._message = await self.channel.send(content)
+        self.message_id = self._message.id
+        self._last_content = content
+        self.edits += 1
+        if self.on_new_message:
+            self.on_new_message(self.message_id)
+
+    def stop(self):
+        """Stop pending updates; the message itself is left in place."""
+        self._dirty = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"message_id": self.message_id, "edits": self.edits, "skipped": self.skipped}
+
+
+def format_dashboard(players: Dict[int, Dict[str, str]], progress_table, create_progress_bar_func: Callable[[float], str],
+                     max_length: int = 1900) -> str:
+    """
+    Render the dashboard text from the progress counters.
+
+    Args:
+        players: {player_id: {"name": ..., "game": ...}} for the tracked seed
+        progress_table: ProgressTable with the live counters
+        create_progress_bar_func: Progress bar renderer
+        max_length: Players that don't fit are collapsed into "+N more"
+
+    Returns:
+        str: Dashboard content (without timestamps, so unchanged progress renders identically)
+    """
+    slots = [slot for slot, info in players.items() if info.get("name", "").lower() != "rhelbot"]
+    if not slots:
+        return "📊 **Live Progress**\nWaiting for player data..."
+
+    stats = progress_table.stats(slots)
+    total_checked, total_locations, overall_percentage = progress_table.overall(slots)
+    completed = sum(1 for slot in slots if stats[slot][3])
+
+    header = ["📊 **Live Progress**"]
+    if total_locations > 0:
+        header.append(f"└ {total_checked}/{total_locations} locations ({overall_percentage:.1f}%) · "
+                      f"{completed}/{len(slots)} players done")
+        header.append(f"└ {create_progress_bar_func(overall_percentage)}")
+    header.append("")
+
+    lines: List[str] = []
+    length = sum(len(line) + 1 for line in header)
+    ranked = progress_table.ranked(slots)
+    for shown, slot in enumerate(ranked):
+        checked, total, percentage, is_complete = stats[slot]
+        info = players[slot]
+        if total > 0:
+            line = f"**{info.get('name')}** ({info.get('game', 'Unknown')}) {checked}/{total} ({percentage:.1f}%)"
+            if is_complete:
+                line += " ✅"
+        else:
+            line = f"**{info.get('name')}** ({info.get('game', 'Unknown')}) {checked}/?"
+        if length + len(line) + 1 > max_length - 20:
+            lines.append(f"... +{len(ranked) - shown} more")
+            break
+        lines.append(line)
+        length += len(line) + 1
+
+    return "\n".join(header + lines)
@@ -5,7 +5,9 @@ Handles calculation and formatting of player progress data.
 
 from pathlib import Path
 import time
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterable, Iterator, AsyncIterable, AsyncIterator, Callable, Awaitable
+
+from helpers.location_bitset import union_locations
 
 
 def validate_save_file_timestamp(output_directory: str, connection_data: dict, game_data: dict,
@@ -39,38 +41,43 @@ def validate_save_file_timestamp(output_directory: str, connection_data: dict, g
 
 def get_player_progress_data(all_players: dict, location_checks: dict, activity_timer_dict: dict,
                            target_players: Optional[List[str]], show_specific_players: bool,
-                           get_player_total_locations_func, create_progress_bar_func) -> List[str]:
+                           get_player_total_locations_func, create_progress_bar_func,
+                           progress_table=None) -> List[str]:
     """
     Generate progress data for all or specific players.
+    If a ProgressTable is given, counts, totals and percentages come from it in one pass.
     Returns list of formatted progress lines.
     """
     player_progress_data = []
 
-    for player_id, player_info in all_players.items():
+    # Skip the Rhelbot tracker and filter for specific players if requested
+    selected_players = [
+        (player_id, player_info) for player_id, player_info in all_players.items()
+        if player_info["name"].lower() != "rhelbot"
+        and not (show_specific_players and player_info["name"] not in target_players)
+    ]
+    table_stats = progress_table.stats(player_id for player_id, _ in selected_players) if progress_table else None
+
+    for player_id, player_info in selected_players:
         player_name = player_info["name"]
         player_game = player_info["game"]
 
-        # Skip the Rhelbot tracker
-        if player_name.lower() == "rhelbot":
-            continue
-
-        # Filter for specific players if requested
-        if show_specific_players and player_name not in target_players:
-            continue
+        if table_stats is not None:
+            checked_count, total_locations, percentage, is_complete = table_stats[player_id]
+        else:
+            # Get checked locations for this player from save data
+            # location_checks format: {(team, slot): set of location_ids}
+            checked_locations = location_checks.get((0, player_id), set())  # Assuming team 0
+            checked_count = len(checked_locations)
 
-        # Get checked locations for this player from save data
-        # location_checks format: {(team, slot): set of location_ids}
-        checked_locations = location_checks.get((0, player_id), set())  # Assuming team 0
-        checked_count = len(checked_locations)
+            # Get total locations for this player from the actual multiworld data
+            total_locations = get_player_total_locations_func(player_id)
 
-        # Get total locations for this player from the actual multiworld data
-        total_locations = get_player_total_locations_func(player_id)
+            # Calculate percentage
+            percentage = (checked_count / total_locations) * 100 if total_locations > 0 else 0.0
+            is_complete = total_locations > 0 and percentage >= 100.0
 
-        # Calculate percentage
         if total_locations > 0:
-            percentage = (checked_count / total_locations) * 100
-            is_complete = percentage >= 100.0
-
             # Add checkmark for 100% completion after the game name
             completion_indicator = " ✅" if is_complete else ""
 
@@ -129,11 +136,18 @@ def format_progress_error_message(original_player: Optional[str], target_players
 
 
 def calculate_total_game_progress(all_players: dict, location_checks: dict,
-                                get_player_total_locations_func) -> Tuple[int, int, float]:
+                                get_player_total_locations_func, progress_table=None) -> Tuple[int, int, float]:
     """
     Calculate total game progress across all players.
+    If a ProgressTable is given, the sums are computed from its columns in one pass.
     Returns (total_checked, total_locations, overall_percentage).
     """
+    if progress_table is not None:
+        return progress_table.overall(
+            player_id for player_id, player_info in all_players.items()
+            if player_info["name"].lower() != "rhelbot"
+        )
+
     total_checked = 0
     total_locations = 0
 
@@ -175,31 +189,73 @@ def format_progress_header(target_players: Optional[List[str]], total_checked: i
                 f"({overall_percentage:.1f}%)\n{overall_progress_bar}\n\n")
 
 
-def create_progress_sections(progress_lines: List[str], max_length: int = 1800) -> List[str]:
+def iter_progress_sections(progress_lines: Iterable[str], max_length: int = 1800) -> Iterator[str]:
     """
     Split progress data into sections that fit Discord message limits.
-    Returns list of message sections.
+    Yields each section as soon as it is full.
     """
-    sections = []
     current_section = ""
 
     for line in progress_lines:
         # Check if adding this line would exceed the limit
         if len(current_section) + len(line) > max_length:
             if current_section:
-                sections.append(current_section.strip())
+                yield current_section.strip()
                 current_section = line
             else:
                 # Single line is too long, add it anyway
-                sections.append(line.strip())
+                yield line.strip()
         else:
             current_section += line
 
     # Add the last section if it has content
     if current_section.strip():
-        sections.append(current_section.strip())
+        yield current_section.strip()
+
 
-    return sections
+def create_progress_sections(progress_lines: List[str], max_length: int = 1800) -> List[str]:
+    """
+    Split progress data into sections that fit Discord message limits.
+    Returns list of message sections.
+    """
+    return list(iter_progress_sections(progress_lines, max_length))
+
+
+async def stream_progress_sections(progress_lines: AsyncIterable[str], max_length: int = 1800) -> AsyncIterator[str]:
+    """
+    Split lines from an async line producer into message sections, yielding each section as
+    soon as it is full so it can be sent while later lines are still being computed.
+    """
+    current_section = ""
+
+    async for line in progress_lines:
+        if len(current_section) + len(line) > max_length:
+            if current_section:
+                yield current_section.strip()
+                current_section = line
+            else:
+                # Single line is too long, send it anyway
+                yield line.strip()
+        else:
+            current_section += line
+
+    if current_section.strip():
+        yield current_section.strip()
+
+
+async def send_progress_sections(send_func: Callable[[str], Awaitable[Any]], progress_lines: AsyncIterable[str],
+                                 max_length: int = 1800) -> int:
+    """
+    Send lines from an async line producer as messages, each section going out as soon as it fills.
+
+    Returns:
+        int: Number of messages sent
+    """
+    sent = 0
+    async for section in stream_progress_sections(progress_lines, max_length):
+        await send_func(section)
+        sent += 1
+    return sent
 
 
 async def load_and_validate_game_data(interaction, connection_data: Dict, game_data: Dict,
@@ -265,8 +321,8 @@ def merge_real_time_tracking_data(location_checks: Dict, player_progress: Dict)
         # Get the current save data for this player
         save_locations = location_checks.get((0, player_id), set())
 
-        # Merge real-time data with save data (union of both sets)
-        merged_locations = save_locations.union(real_time_locations)
+        # Merge real-time data with save data (word-wise when the real-time data is a bitset)
+        merged_locations = union_locations(real_time_locations, save_locations)
         updated_location_checks[(0, player_id)] = merged_locations
 
     return updated_location_checks
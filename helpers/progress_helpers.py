@@ -12,6 +12,8 @@ import io
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, Set
 
+from helpers.data_helpers import normalize_hint, normalize_save_hints
+
 logger = logging.getLogger(__name__)
 
 def get_player_total_locations(player_id: int, save_data: dict, output_directory: str = "./Archipelago/output/") -> int:
@@ -309,14 +311,7 @@ def get_hint_cost(player_id: int, save_data: dict, get_total_locations_func) ->
             return calculated_cost
         else:
             # Fallback: Count existing hints and use old formula
-            hints_data = save_data.get("hints", {})
-            player_hint_count = 0
-            
-            for hint_set in hints_data.values():
-                if isinstance(hint_set, set):
-                    for hint in hint_set:
-                        if hasattr(hint, 'receiving_player') and hint.receiving_player == player_id:
-                            player_hint_count += 1
+            player_hint_count = sum(1 for hint in normalize_save_hints(save_data) if hint.receiving_player == player_id)
             
             # Use fallback formula: 10 + (hints_owned * 10)
             calculated_cost = 10 + (player_hint_count * 10)
@@ -328,65 +323,14 @@ def get_hint_cost(player_id: int, save_data: dict, get_total_locations_func) ->
         return 10  # Default cost
 
 def filter_key_item_hints(all_hints: list) -> list:
-    """Filter hints for key items (item_flags = 1) and return processed hint objects"""
+    """Filter hints for key items (item_flags = 1), normalized into Hint records"""
     key_item_hints = []
-    
     for hint in all_hints:
-        # Check if this is a Hint object with item_flags = 1 (progression items)
-        if hasattr(hint, 'item_flags') and hint.item_flags == 1:
+        hint = normalize_hint(hint)
+        if hint is not None and hint.item_flags == 1:
             key_item_hints.append(hint)
-                
-        elif isinstance(hint, (list, tuple)) and len(hint) >= 7:
-            # Handle tuple/list representation
-            item_flags = hint[6] if len(hint) > 6 else 0
-            if item_flags == 1:
-                # Convert to a simple object for easier handling
-                class SimpleHint:
-                    def __init__(self, data):
-                        self.receiving_player = data[0]
-                        self.finding_player = data[1]
-                        self.location = data[2]
-                        self.item = data[3]
-                        self.found = data[4]
-                        self.entrance = data[5] if len(data) > 5 else ""
-                        self.item_flags = data[6] if len(data) > 6 else 0
-                        self.status = data[7] if len(data) > 7 else 0
-                
-                simple_hint = SimpleHint(hint)
-                key_item_hints.append(simple_hint)
-                    
-        elif isinstance(hint, dict) and hint.get('item_flags', 0) == 1:
-            # Handle dictionary representation
-            class SimpleHint:
-                def __init__(self, data):
-                    self.receiving_player = data.get('receiving_player', 0)
-                    self.finding_player = data.get('finding_player', 0)
-                    self.location = data.get('location', 0)
-                    self.item = data.get('item', 0)
-                    self.found = data.get('found', False)
-                    self.entrance = data.get('entrance', "")
-                    self.item_flags = data.get('item_flags', 0)
-                    self.status = data.get('status', 0)
-            
-            simple_hint = SimpleHint(hint)
-            key_item_hints.append(simple_hint)
-    
     return key_item_hints
 
 def extract_hints_from_save_data(save_data: dict) -> list:
-    """Extract all hints from the save data dictionary and deduplicate"""
-    hints_data = save_data.get("hints", {})
-    if not hints_data:
-        return []
-    
-    # Extract all hints from the dictionary of sets and deduplicate
-    all_hints_set = set()
-    for hint_set in hints_data.values():
-        if isinstance(hint_set, set):
-            all_hints_set.update(hint_set)
-        elif isinstance(hint_set, (list, tuple)):
-            all_hints_set.update(hint_set)
-        elif hint_set:  # Single hint object
-            all_hints_set.add(hint_set)
-    
-    return list(all_hints_set)
+    """Extract all hints from the save data dictionary as deduplicated Hint records"""
+    return list(normalize_save_hints(save_data))
@@ -0,0 +1,178 @@
+"""
+Materialized per-player progress for Archipelago game tracking.
+Keeps checked locations and totals per slot up to date from live events and save deltas.
+"""
+
+import logging
+from typing import Dict, Any, Optional, Tuple, Iterable, Callable
+
+from helpers.progress_display import parse_activity_timers
+from helpers.location_bitset import LocationBitset, LocationIndex
+from helpers.progress_table import ProgressTable
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressState:
+    """
+    Per-slot checked locations, totals and activity timestamps for the current game.
+
+    Live ItemSend checks are added as they arrive. Save data is only folded in when the
+    save snapshot version changes, and totals are computed once per slot, so progress
+    queries are O(1) per player instead of re-reading and re-merging the save.
+
+    Checked locations are kept as LocationBitsets once location_index_func can resolve the
+    slot's game; until then (e.g. before the DataPackage arrives) a plain set is used and
+    converted later. Counts, totals and activity are mirrored into a ProgressTable for
+    multiworld-wide aggregates, and the set of completed slots is kept current alongside
+    them so completion checks are a set lookup.
+    """
+
+    def __init__(self, location_index_func: Optional[Callable[[int], Optional[LocationIndex]]] = None):
+        self.location_index_func = location_index_func
+        self.locations: Dict[int, Any] = {}  # slot -> checked location ids (LocationBitset or set)
+        self.totals: Dict[int, int] = {}  # slot -> total location count (0 if unknown)
+        self.activity: Dict[Tuple[int, int], float] = {}  # (team, slot) -> last check timestamp
+        self.save_slots: set = set()  # slots present in the save's location_checks
+        self.save_version: Optional[int] = None
+        self.completed: set = set()  # slots that have checked all of their locations
+        self.version = 0  # bumped on every change, so renders of this state can be cached
+        self.on_change: Optional[Callable[[], None]] = None  # called after every change (e.g. to refresh dashboards)
+        self.history = None  # optional CheckHistory that gets a sample whenever a slot's count goes up
+        self.table = ProgressTable()
+
+    def slot_locations(self, slot: int):
+        """Checked locations for a slot, created (or upgraded from a set to a bitset) as needed."""
+        locations = self.locations.get(slot)
+        if locations is None or type(locations) is set:
+            index = self.location_index_func(slot) if self.location_index_func else None
+            if index is not None:
+                locations = LocationBitset(index, locations or ())
+            elif locations is None:
+                locations = set()
+            self.locations[slot] = locations
+        return locations
+
+    def record_check(self, slot: int, location_id: int) -> bool:
+        """Record a live location check. Returns True if it wasn't already counted."""
+        locations = self.slot_locations(slot)
+        if location_id in locations:
+            return False
+        locations.add(location_id)
+        self.table.set_checked(slot, len(locations))
+        self._update_completion(slot)
+        if self.history is not None:
+            self.history.record(slot, len(locations))
+        self._changed()
+        return True
+
+    def merge(self, slot: int, location_ids: Iterable[int], timestamp: Optional[float] = None) -> int:
+        """
+        Merge a batch of checks for a slot. Returns how many were new.
+
+        timestamp is when the checks happened if known (e.g. the save's activity timer),
+        otherwise the history sample is taken now.
+        """
+        locations = self.slot_locations(slot)
+        before = len(locations)
+        locations.update(location_ids)
+        self.table.set_checked(slot, len(locations))
+        self._update_completion(slot)
+        if len(locations) != before:
+            if self.history is not None:
+                self.history.record(slot, len(locations), timestamp)
+            self._changed()
+        return len(locations) - before
+
+    def _changed(self):
+        self.version += 1
+        if self.on_change:
+            self.on_change()
+
+    def _update_completion(self, slot: int):
+        total = self.totals.get(slot, 0)
+        if total > 0 and len(self.locations.get(slot, ())) >= total:
+            self.completed.add(slot)
+        else:
+            self.completed.discard(slot)
+
+    def apply_save_snapshot(self, snapshot, total_locations_func: Callable[[int, dict], int]) -> bool:
+        """
+        Fold a save snapshot into the counters if it is newer than the last one applied.
+
+        Args:
+            snapshot: SaveSnapshot from load_save_snapshot (or None)
+            total_locations_func: Called as func(slot, save_data) for slots without a known total
+
+        Returns:
+            bool: True if the snapshot was applied, False if it was already current
+        """
+        if snapshot is None or snapshot.version == self.save_version:
+            return False
+
+        save_data = snapshot.data
+        self.activity = parse_activity_timers(save_data.get("client_activity_timers", ()))
+        for (team, slot), timestamp in self.activity.items():
+            if team == 0:  # Assuming team 0
+                self.table.set_activity(slot, timestamp)
+
+        merged = 0
+        self.save_slots = set()
+        for (team, slot), location_ids in save_data.get("location_checks", {}).items():
+            if team != 0:  # Assuming team 0
+                continue
+            self.save_slots.add(slot)
+            merged += self.merge(slot, location_ids, self.activity.get((team, slot)))
+
+        # Retry unknown totals against the new save, keep known ones
+        self.totals = {slot: total for slot, total in self.totals.items() if total > 0}
+        # Pick up checks added straight to the location sets
+        for slot, locations in self.locations.items():
+            self.table.set_checked(slot, len(locations))
+        self.ensure_totals(self.save_slots, save_data, total_locations_func)
+        # Completion is recomputed once per snapshot and kept current by record_check/merge after that
+        for slot in set(self.locations) | set(self.totals):
+            self._update_completion(slot)
+
+        self.save_version = snapshot.version
+        self._changed()
+        logger.debug(f"Applied save snapshot {snapshot.version}: {merged} new checks")
+        return True
+
+    def ensure_totals(self, slots: Iterable[int], save_data: dict, total_locations_func: Callable[[int, dict], int]):
+        """Compute totals for any slots that don't have one yet."""
+        for slot in slots:
+            if slot not in self.totals:
+                self.totals[slot] = total_locations_func(slot, save_data)
+                self.table.set_total(slot, self.totals[slot])
+                self._update_completion(slot)
+                self._changed()
+
+    def checked_count(self, slot: int) -> int:
+        return len(self.locations.get(slot, ()))
+
+    def total(self, slot: int) -> int:
+        return self.totals.get(slot, 0)
+
+    def percentage(self, slot: int) -> float:
+        total = self.total(slot)
+        return (self.checked_count(slot) / total * 100) if total > 0 else 0.0
+
+    def is_complete(self, slot: int) -> bool:
+        """True if the slot has checked all of its locations (False if the total is unknown)."""
+        return slot in self.completed
+
+    def location_checks_view(self) -> Dict[Tuple[int, int], Any]:
+        """Checked locations keyed like the save's location_checks ({(team, slot): set}), without copying."""
+        return {(0, slot): locations for slot, locations in self.locations.items()}
+
+    def reset(self):
+        """Forget everything, e.g. when the tracked server starts a different seed."""
+        self.locations.clear()
+        self.totals.clear()
+        self.activity.clear()
+        self.save_slots = set()
+        self.save_version = None
+        self.completed.clear()
+        self.table.clear()
+        self._changed()
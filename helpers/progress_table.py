@@ -0,0 +1,176 @@
+"""
+Columnar per-slot progress counters for Archipelago game tracking.
+Keeps checked counts, totals and last activity per slot in arrays so multiworld-wide
+aggregates (totals, percentages, completion, sorting, inactivity) are computed in one pass.
+"""
+
+import logging
+from typing import Dict, List, Tuple, Iterable, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressTable:
+    """
+    Per-slot checked/total/last-activity columns, one row per slot.
+
+    Uses NumPy arrays when NumPy is installed and plain lists otherwise; both backends
+    return plain Python values so callers don't need to care which one is active.
+    """
+
+    def __init__(self, capacity: int = 64, use_numpy: Optional[bool] = None):
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else (use_numpy and NUMPY_AVAILABLE)
+        self.rows: Dict[int, int] = {}  # slot -> row
+        self.slots: List[int] = []  # row -> slot
+
+        if self.use_numpy:
+            self.checked = np.zeros(capacity, dtype=np.int64)
+            self.totals = np.zeros(capacity, dtype=np.int64)
+            self.last_activity = np.zeros(capacity, dtype=np.float64)  # 0 means no recorded activity
+        else:
+            self.checked = []
+            self.totals = []
+            self.last_activity = []
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def row(self, slot: int) -> int:
+        """Row for a slot, adding one (and growing the arrays) if needed."""
+        row = self.rows.get(slot)
+        if row is not None:
+            return row
+
+        row = len(self.slots)
+        self.rows[slot] = row
+        self.slots.append(slot)
+        if self.use_numpy:
+            if row >= len(self.checked):
+                new_capacity = max(len(self.checked) * 2, 1)
+                self.checked = np.resize(self.checked, new_capacity)
+                self.totals = np.resize(self.totals, new_capacity)
+                self.last_activity = np.resize(self.last_activity, new_capacity)
+                self.checked[row:] = 0
+                self.totals[row:] = 0
+                self.last_activity[row:] = 0
+        else:
+            self.checked.append(0)
+            self.totals.append(0)
+            self.last_activity.append(0.0)
+        return row
+
+    def set_checked(self, slot: int, count: int):
+        row = self.row(slot)  # Look the row up first, adding one may replace the arrays
+        self.checked[row] = count
+
+    def set_total(self, slot: int, total: int):
+        row = self.row(slot)
+        self.totals[row] = total
+
+    def set_activity(self, slot: int, timestamp: float):
+        row = self.row(slot)
+        self.last_activity[row] = timestamp or 0.0
+
+    def clear(self):
+        self.rows.clear()
+        self.slots.clear()
+        if self.use_numpy:
+            self.checked[:] = 0
+            self.totals[:] = 0
+            self.last_activity[:] = 0
+        else:
+            self.checked.clear()
+            self.totals.clear()
+            self.last_activity.clear()
+
+    def select(self, slots: Iterable[int]):
+        """Row indices for the given slots (slots without a row are added with zero counts)."""
+        rows = [self.row(slot) for slot in slots]
+        return np.asarray(rows, dtype=np.intp) if self.use_numpy else rows
+
+    def stats(self, slots: Iterable[int]) -> Dict[int, Tuple[int, int, float, bool]]:
+        """
+        Checked count, total, percentage and completion for each slot, computed in one pass.
+
+        Returns:
+            Dict[int, Tuple[int, int, float, bool]]: {slot: (checked, total, percentage, is_complete)}
+        """
+        slots = list(slots)
+        rows = self.select(slots)
+        if self.use_numpy:
+            checked = self.checked[rows]
+            totals = self.totals[rows]
+            percentages = np.divide(checked * 100.0, totals, out=np.zeros(len(rows)), where=totals > 0)
+            complete = (totals > 0) & (checked >= totals)
+            return {
+                slot: (int(c), int(t), float(p), bool(done))
+                for slot, c, t, p, done in zip(slots, checked.tolist(), totals.tolist(), percentages.tolist(), complete.tolist())
+            }
+
+        result = {}
+        for slot, row in zip(slots, rows):
+            checked, total = self.checked[row], self.totals[row]
+            percentage = (checked * 100.0 / total) if total > 0 else 0.0
+            result[slot] = (checked, total, percentage, total > 0 and checked >= total)
+        return result
+
+    def overall(self, slots: Iterable[int]) -> Tuple[int, int, float]:
+        """
+        Total checked and total locations across slots (slots with unknown totals only count checks).
+
+        Returns:
+            Tuple[int, int, float]: (total_checked, total_locations, overall_percentage)
+        """
+        rows = self.select(slots)
+        if self.use_numpy:
+            total_checked = int(self.checked[rows].sum())
+            totals = self.totals[rows]
+            total_locations = int(totals[totals > 0].sum())
+        else:
+            total_checked = sum(self.checked[row] for row in rows)
+            total_locations = sum(self.totals[row] for row in rows if self.totals[row] > 0)
+        overall_percentage = (total_checked / total_locations * 100) if total_locations > 0 else 0
+        return total_checked, total_locations, overall_percentage
+
+    def completed(self, slots: Iterable[int]) -> List[int]:
+        """Slots that have checked all of their locations."""
+        slots = list(slots)
+        rows = self.select(slots)
+        if self.use_numpy:
+            totals = self.totals[rows]
+            mask = (totals > 0) & (self.checked[rows] >= totals)
+            return [slots[i] for i in np.flatnonzero(mask).tolist()]
+        return [slot for slot, row in zip(slots, rows)
+                if self.totals[row] > 0 and self.checked[row] >= self.totals[row]]
+
+    def inactive(self, slots: Iterable[int], cutoff: float) -> List[int]:
+        """Unfinished slots with no recorded activity, or none since the cutoff timestamp."""
+        slots = list(slots)
+        rows = self.select(slots)
+        if self.use_numpy:
+            totals = self.totals[rows]
+            complete = (totals > 0) & (self.checked[rows] >= totals)
+            mask = ~complete & (self.last_activity[rows] < cutoff)
+            return [slots[i] for i in np.flatnonzero(mask).tolist()]
+        return [slot for slot, row in zip(slots, rows)
+                if not (self.totals[row] > 0 and self.checked[row] >= self.totals[row])
+                and self.last_activity[row] < cutoff]
+
+    def ranked(self, slots: Iterable[int]) -> List[int]:
+        """Slots ordered by completion percentage, then checked count, highest first."""
+        slots = list(slots)
+        rows = self.select(slots)
+        if self.use_numpy:
+            checked = self.checked[rows]
+            totals = self.totals[rows]
+            percentages = np.divide(checked * 100.0, totals, out=np.zeros(len(rows)), where=totals > 0)
+            order = np.lexsort((-checked, -percentages))
+            return [slots[i] for i in order.tolist()]
+        stats = self.stats(slots)
+        return sorted(slots, key=lambda slot: (-stats[slot][2], -stats[slot][0]))
@@ -0,0 +1,99 @@
+"""
+Render cache for Archipelago command output.
+Keeps the report models of recent /ap progress and /ap hints renders so identical
+requests made close together are answered without recomputing them.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from functools import partial
+from typing import Dict, Any, Tuple, Optional, Callable, Awaitable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """
+    LRU cache of rendered reports keyed by (command, normalized arguments).
+
+    Every lookup carries the data version it was rendered against (save snapshot version
+    plus the live progress and hint versions). A lookup with a different version drops all
+    cached entries, so nothing rendered from older data is ever served. Concurrent renders
+    for the same key and version share one in-flight render, run as its own task so a caller
+    giving up doesn't cancel it for the others; renders must therefore not reply to anyone.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self.version: Optional[Hashable] = None
+        self._entries: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, Hashable, Hashable], asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_render(self, command: str, args: Hashable, version: Hashable,
+                            render_func: Callable[[], Awaitable[Tuple[Any, bool]]]) -> Any:
+        """
+        Return the cached report for a render, rendering it if needed.
+
+        Args:
+            command: Command name, e.g. "progress"
+            args: Normalized (hashable) command arguments
+            version: Data version the render depends on
+            render_func: Coroutine function returning (report, cacheable); error replies that
+                depend on who asked rather than on the data should return cacheable=False
+
+        Returns:
+            Any: The rendered report (a ReportModel; pages it formats on view are kept with it)
+        """
+        if version != self.version:
+            if self._entries:
+                logger.debug(f"Render cache version changed to {version}, dropping {len(self._entries)} entries")
+            self._entries.clear()
+            self.version = version
+
+        key = (command, args)
+        report = self._entries.get(key)
+        if report is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return report
+
+        inflight_key = (command, args, version)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is None:
+            self.misses += 1
+            inflight = asyncio.ensure_future(render_func())
+            self._inflight[inflight_key] = inflight
+            inflight.add_done_callback(partial(self._finish_render, key, inflight_key, version))
+        else:
+            self.hits += 1
+
+        # Shield so one cancelled caller doesn't cancel the render for everyone else
+        report, _ = await asyncio.shield(inflight)
+        return report
+
+    def _finish_render(self, key: Tuple[str, Hashable], inflight_key: Tuple[str, Hashable, Hashable],
+                       version: Hashable, task: asyncio.Task):
+        """Done callback for a shared render: unregister it and cache the report if it can be."""
+        if self._inflight.get(inflight_key) is task:
+            del self._inflight[inflight_key]
+        if task.cancelled():
+            return
+        if task.exception() is not None:  # Also marks it retrieved if every caller gave up
+            logger.error(f"Error rendering {key[0]}: {task.exception()}")
+            return
+        report, cacheable = task.result()
+        if cacheable and self.version == version:
+            self._entries[key] = report
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.version = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "version": self.version}
+
@@ -0,0 +1,200 @@
+"""
+Paginated report views for long command output.
+Reports are split into pages without formatting their entries; a page is only formatted
+the first time someone views it, and browsing edits one message instead of posting chunks.
+"""
+
+import logging
+from typing import Dict, List, Tuple, Optional, Callable, Union, NamedTuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Discord's message limit, minus room for the page indicator
+MAX_PAGE_CHARS = 1900
+# Size assumed for entries formatted on demand (a two-line hint is usually well under this)
+DEFAULT_LAZY_SIZE = 120
+
+
+class ReportEntry(NamedTuple):
+    content: Union[str, Callable[[], str]]  # Text, or a function formatting it on demand
+    size: int  # Characters the entry takes up (estimated for lazy entries)
+    section: Optional[str]  # Section the entry belongs to, used for jumping
+
+
+class ReportModel:
+    """
+    A report as a title, page-one summary, a list of entries and an optional last-page footer.
+
+    Entries are packed into pages by size up front; lazy entries are only formatted when their
+    page is rendered, and each rendered page is kept so repeat views are free.
+    """
+
+    def __init__(self, title: str, entries: List[ReportEntry], summary: str = "", footer: str = "",
+                 max_chars: int = MAX_PAGE_CHARS):
+        self.title = title
+        self.entries = entries
+        self.summary = summary
+        self.footer = footer
+        self.pages: List[Tuple[int, int]] = self._paginate(max_chars)  # (first entry, end entry) per page
+        self._rendered: Dict[int, str] = {}
+
+    @classmethod
+    def text(cls, content: str) -> "ReportModel":
+        """A single-page report from plain text (e.g. an error message)."""
+        return cls(content, [])
+
+    def _paginate(self, max_chars: int) -> List[Tuple[int, int]]:
+        title_size = len(self.title) + 2
+        budget = max_chars - title_size - len(self.summary) - 2
+        pages = []
+        start, used = 0, 0
+        for position, entry in enumerate(self.entries):
+            if used and used + entry.size + 1 > budget:
+                pages.append((start, position))
+                start, used = position, 0
+                budget = max_chars - title_size
+            used += entry.size + 1
+        pages.append((start, len(self.entries)))
+        # Keep the footer on a page of its own if it doesn't fit on the last one
+        if self.footer and used + len(self.footer) + 2 > budget and self.entries:
+            pages.append((len(self.entries), len(self.entries)))
+        return pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def sections(self) -> List[Tuple[str, int]]:
+        """Each section name with the page it starts on, in report order."""
+        sections = []
+        seen = set()
+        for page, (start, end) in enumerate(self.pages):
+            for entry in self.entries[start:end]:
+                if entry.section and entry.section not in seen:
+                    seen.add(entry.section)
+                    sections.append((entry.section, page))
+        return sections
+
+    def render_page(self, page: int) -> str:
+        """Format one page (once) and return its text."""
+        rendered = self._rendered.get(page)
+        if rendered is not None:
+            return rendered
+
+        start, end = self.pages[page]
+        parts = [self.title]
+        if page == 0 and self.summary:
+            parts.append(self.summary)
+        for entry in self.entries[start:end]:
+            parts.append(entry.content() if callable(entry.content) else entry.content)
+        if page == len(self.pages) - 1 and self.footer:
+            parts.append(self.footer)
+
+        rendered = "\n".join(parts)
+        indicator = f"\n-# Page {page + 1}/{len(self.pages)}" if len(self.pages) > 1 else ""
+        if len(rendered) + len(indicator) > 2000:
+            # Lazy entries can come out longer than estimated; trim the body rather than fail the edit
+            rendered = rendered[:1998 - len(indicator)] + "\n…"
+        rendered += indicator
+        self._rendered[page] = rendered
+        return rendered
+
+
+class ReportBuilder:
+    """Collects report entries, tagging each with the section it was added under."""
+
+    def __init__(self, title: str):
+        self.title = title
+        self.summary_lines: List[str] = []
+        self.footer_lines: List[str] = []
+        self.entries: List[ReportEntry] = []
+        self.current_section: Optional[str] = None
+
+    def section(self, name: Optional[str], heading: Optional[str] = None):
+        """Start a new section, optionally adding its heading line."""
+        self.current_section = name
+        if heading is not None:
+            self.add(heading)
+
+    def add(self, text: str):
+        self.entries.append(ReportEntry(text, len(text), self.current_section))
+
+    def add_lazy(self, format_func: Callable[[], str], estimated_size: int = DEFAULT_LAZY_SIZE):
+        self.entries.append(ReportEntry(format_func, estimated_size, self.current_section))
+
+    def build(self) -> ReportModel:
+        return ReportModel(self.title, self.entries, "\n".join(self.summary_lines), "\n".join(self.footer_lines))
+
+
+class ReportPaginator(discord.ui.View):
+    """Previous/next buttons and a section jump menu over a ReportModel, for the user who ran the command."""
+
+    def __init__(self, report: ReportModel, owner_id: int, timeout: float = 900):
+        super().__init__(timeout=timeout)
+        self.report = report
+        self.owner_id = owner_id
+        self.page = 0
+        self.message = None
+
+        # Jump targets: sections if there are few enough for one menu, otherwise pages
+        sections = report.sections()
+        if 1 < len(sections) <= 25:
+            targets = [(name[:100], page) for name, page in sections]
+        else:
+            targets = [(f"Page {page + 1}", page) for page in range(min(report.page_count, 25))]
+        if len(targets) > 1:
+            jump = discord.ui.Select(
+                placeholder="Jump to...",
+                options=[discord.SelectOption(label=label, value=str(page)) for label, page in targets]
+            )
+            jump.callback = self._jump
+            self.jump = jump
+            self.add_item(jump)
+        self._update_buttons()
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.report.page_count - 1
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("Run the command yourself to browse this report.", ephemeral=True)
+            return False
+        return True
+
+    async def show(self, interaction: discord.Interaction, page: int):
+        self.page = max(0, min(page, self.report.page_count - 1))
+        self._update_buttons()
+        await interaction.response.edit_message(content=self.report.render_page(self.page), view=self)
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page - 1)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page + 1)
+
+    async def _jump(self, interaction: discord.Interaction):
+        await self.show(interaction, int(self.jump.values[0]))
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except Exception as e:
+                logger.debug(f"Could not disable expired report controls: {e}")
+
+
+async def send_report(interaction: discord.Interaction, report: ReportModel):
+    """Send page one of a report as the interaction reply, with page controls if there's more than one page."""
+    content = report.render_page(0)
+    if report.page_count == 1:
+        await interaction.followup.send(content)
+        return
+    view = ReportPaginator(report, interaction.user.id)
+    view.message = await interaction.followup.send(content, view=view, wait=True)
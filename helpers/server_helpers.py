@@ -3,14 +3,19 @@ Server management helper functions for Archipelago Discord bot.
 """
 
 import asyncio
+import hashlib
 import websockets
 import json
 import logging
 import subprocess
+import time
 import uuid
+from functools import partial
 from typing import Dict, Any, Optional, Tuple
 from ruyaml import YAML
 
+from helpers.websocket_managers import reconnect_scheduler
+
 try:
     import psutil
     PSUTIL_AVAILABLE = True
@@ -19,6 +24,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# How long a fetched player list and DataPackage are reused before the server is asked again
+SERVER_DATA_TTL = 30.0
+
+# Fetches in progress and recent results, keyed by (server_url, password hash)
+server_data_fetches: Dict[Tuple[str, str], asyncio.Future] = {}
+server_data_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+# Bumped by clear_server_data_cache so fetches started before a clear never cache their result
+server_data_generation = 0
+
 def get_server_password(host_file: str = "./Archipelago/host.yaml") -> str:
     """Read the server password from Archipelago host.yaml configuration file."""
     try:
@@ -123,24 +137,52 @@ def create_connection_message(password: Optional[str] = None, name: str = "Rhelb
     }
 
 async def connect_to_server(server_url: str, timeout: float = 15.0):
-    """Create a websocket connection to the Archipelago server."""
-    return await asyncio.wait_for(
-        websockets.connect(
-            server_url, 
-            ping_interval=20,
-            ping_timeout=10,
-            close_timeout=10,
-            max_size=None,
-            compression="deflate"
-        ),
-        timeout=timeout
-    )
+    """Create a websocket connection to the Archipelago server, within the shared connection attempt cap."""
+    async with reconnect_scheduler.connection_slot():
+        return await asyncio.wait_for(
+            websockets.connect(
+                server_url, 
+                ping_interval=20,
+                ping_timeout=10,
+                close_timeout=10,
+                max_size=None,
+                compression="deflate"
+            ),
+            timeout=timeout
+        )
+
+def server_data_key(server_url: str, password: str) -> Tuple[str, str]:
+    return server_url, hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+def clear_server_data_cache(server_url: Optional[str] = None):
+    """
+    Forget cached server data (for one server, or all), e.g. when a new seed is started.
+    Fetches already in progress are left to finish for their callers but no longer shared or cached.
+    """
+    global server_data_generation
+    server_data_generation += 1
+    for cache in (server_data_cache, server_data_fetches):
+        for key in list(cache):
+            if server_url is None or key[0] == server_url:
+                del cache[key]
+
+def finish_server_data_fetch(key: Tuple[str, str], generation: int, fetch: asyncio.Future):
+    """Done callback for a shared fetch: unregister it and cache a successful result unless the cache was cleared since."""
+    if server_data_fetches.get(key) is fetch:
+        del server_data_fetches[key]
+    if generation != server_data_generation:
+        return
+    if not fetch.cancelled() and fetch.exception() is None and fetch.result():
+        server_data_cache[key] = (time.monotonic(), fetch.result())
 
 async def fetch_server_data(server_url: str = "ws://ap.rhelys.com:38281", password: Optional[str] = None, 
                            save_datapackage: bool = False, file_path: str = "datapackage.json") -> Optional[Dict[str, Any]]:
     """
     Connect to server temporarily to fetch player and game data.
     
+    Concurrent callers for the same server and password share one fetch, and a successful
+    result is reused for SERVER_DATA_TTL seconds.
+    
     Args:
         server_url: Archipelago server URL
         password: Server password (optional)
@@ -150,17 +192,54 @@ async def fetch_server_data(server_url: str = "ws://ap.rhelys.com:38281", passwo
     Returns:
         Optional[Dict[str, Any]]: Dictionary containing players and game_data, or None on failure
     """
+    # If no password provided, read from file
+    if password is None:
+        try:
+            password = get_server_password()
+        except Exception as e:
+            logger.error(f"Error reading server password: {e}")
+            return None
+
+    key = server_data_key(server_url, password)
+    cached = server_data_cache.get(key)
+    if cached and time.monotonic() - cached[0] < SERVER_DATA_TTL:
+        logger.debug(f"Using server data for {server_url} fetched {time.monotonic() - cached[0]:.1f}s ago")
+        result = cached[1]
+    else:
+        fetch = server_data_fetches.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(fetch_server_data_uncached(server_url, password))
+            server_data_fetches[key] = fetch
+            fetch.add_done_callback(partial(finish_server_data_fetch, key, server_data_generation))
+        else:
+            logger.debug(f"Joining server data fetch already in progress for {server_url}")
+        # Shielded so a caller giving up doesn't cancel the fetch for everyone else waiting on it
+        result = await asyncio.shield(fetch)
+
+    # Optionally save the datapackage locally
+    if result and save_datapackage:
+        try:
+            from helpers.data_helpers import save_datapackage_locally
+            
+            # Create a compatible connection_data structure
+            connection_data = {
+                server_url: {
+                    "slot_info": {str(player_id): player_info for player_id, player_info in result["players"].items()}
+                }
+            }
+            
+            save_datapackage_locally(result["game_data"], connection_data)
+            logger.info("Saved datapackage locally after fetch_server_data")
+        except Exception as save_error:
+            logger.error(f"Error saving datapackage: {save_error}")
+
+    return result
+
+async def fetch_server_data_uncached(server_url: str, password: str) -> Optional[Dict[str, Any]]:
+    """Connect to the server and collect its player list and DataPackage (one fetch, no sharing)."""
     try:
         logger.debug(f"Attempting to fetch server data from {server_url}")
         
-        # If no password provided, read from file
-        if password is None:
-            try:
-                password = get_server_password()
-            except Exception as e:
-                logger.error(f"Error reading server password: {e}")
-                return None
-        
         # Connect to the Archipelago websocket server
         websocket = await connect_to_server(server_url)
         
@@ -237,29 +316,10 @@ async def fetch_server_data(server_url: str = "ws://ap.rhelys.com:38281", passwo
                 
                 logger.info(f"Successfully fetched data for {len(all_players)} players and {len(game_data)} games")
                 
-                result = {
+                return {
                     "players": all_players,
                     "game_data": game_data
                 }
-                
-                # Optionally save the datapackage locally
-                if save_datapackage:
-                    try:
-                        from helpers.data_helpers import save_datapackage_locally
-                        
-                        # Create a compatible connection_data structure
-                        connection_data = {
-                            server_url: {
-                                "slot_info": {str(player_id): player_info for player_id, player_info in all_players.items()}
-                            }
-                        }
-                        
-                        save_datapackage_locally(game_data, connection_data)
-                        logger.info("Saved datapackage locally after fetch_server_data")
-                    except Exception as save_error:
-                        logger.error(f"Error saving datapackage: {save_error}")
-                
-                return result
             else:
                 logger.warning("Failed to get connection data from server")
                 return None
@@ -289,7 +349,8 @@ async def connect_and_save_datapackage(server_url: str = "ws://ap.rhelys.com:382
         Tuple[bool, str]: (success, message) - success flag and status message
     """
     try:
-        # Try to connect and fetch data
+        # Try to connect and fetch data, skipping any recently cached copy
+        clear_server_data_cache(server_url)
         server_data = await fetch_server_data(server_url, password)
         
         if not server_data:
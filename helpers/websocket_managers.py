@@ -5,9 +5,13 @@ Handles connection lifecycle, retry logic, and message processing.
 
 import asyncio
 import json
+import random
+import time
 import uuid
 import websockets
-from typing import Optional, Dict, Callable
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, List, Tuple, Callable, Hashable, Iterable, Any
 
 
 class WebSocketConnectionManager:
@@ -18,17 +22,16 @@ class WebSocketConnectionManager:
         self.base_delay = base_delay
         self.max_delay = max_delay
 
-    def calculate_backoff_delay(self, attempt: int) -> int:
-        """Calculate exponential backoff delay."""
-        return min(self.base_delay * (2 ** (attempt - 1)), self.max_delay)
+    def calculate_backoff_delay(self, attempt: int) -> float:
+        """Calculate a full-jitter exponential backoff delay (uniform between 0 and the capped exponential)."""
+        return random.uniform(0, min(self.base_delay * (2 ** (attempt - 1)), self.max_delay))
 
     async def create_connection(self, server_url: str, timeout: float = 15.0):
         """Create a WebSocket connection with proper configuration."""
         return await asyncio.wait_for(
             websockets.connect(
                 server_url,
-                ping_interval=20,  # Ping every 20 seconds
-                ping_timeout=10,   # Wait 10 seconds for pong
+                ping_interval=None,  # Keepalive is handled by ConnectionHeartbeat
                 close_timeout=10,  # Wait 10 seconds for close
                 max_size=None,     # No message size limit
                 compression="deflate"  # Enable compression as expected by Archipelago
@@ -71,6 +74,377 @@ class WebSocketConnectionManager:
         await websocket.send(json.dumps([get_data_msg]))
 
 
+class ReconnectScheduler:
+    """
+    Coordinates reconnects across every tracker, admin session and data fetch.
+
+    Caps how many websocket connection attempts run at once, so a MultiServer restart
+    doesn't get hit by every client in the same instant. It also folds reconnect status
+    into one edited message per Discord channel instead of a message per listener.
+    """
+
+    def __init__(self, max_concurrent_attempts: int = 2, status_interval: float = 2.0):
+        self.max_concurrent_attempts = max_concurrent_attempts
+        self.status_interval = status_interval
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._statuses: Dict[int, Dict[str, str]] = {}  # channel_id -> {server_url: status line}
+        self._failures: Dict[int, Dict[str, str]] = {}  # channel_id -> {server_url: why it gave up}
+        self._channels: Dict[int, Any] = {}
+        self._status_messages: Dict[int, Any] = {}  # channel_id -> Discord message being edited
+        self._pending_updates: Dict[int, asyncio.Task] = {}
+
+    @asynccontextmanager
+    async def connection_slot(self):
+        """Hold one of the global connection attempt slots while opening a websocket."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_attempts)
+        async with self._semaphore:
+            yield
+
+    def set_status(self, channel, server_url: str, text: str):
+        """Set the reconnect status line for a server in its channel's consolidated message."""
+        self._channels[channel.id] = channel
+        self._statuses.setdefault(channel.id, {})[server_url] = text
+        self._schedule_update(channel.id)
+
+    def clear_status(self, channel, server_url: str):
+        """Remove a server from its channel's status message once it has reconnected."""
+        statuses = self._statuses.get(channel.id)
+        failures = self._failures.get(channel.id)
+        cleared = statuses is not None and statuses.pop(server_url, None) is not None
+        if failures is not None and failures.pop(server_url, None) is not None:
+            cleared = True
+        if cleared:
+            self._schedule_update(channel.id)
+
+    def give_up(self, channel, server_url: str, text: str = "gave up reconnecting"):
+        """Mark a server that was still reconnecting as permanently lost, so it isn't reported as restored."""
+        statuses = self._statuses.get(channel.id)
+        if statuses and statuses.pop(server_url, None) is not None:
+            self._failures.setdefault(channel.id, {})[server_url] = text
+            self._schedule_update(channel.id)
+
+    def _schedule_update(self, channel_id: int):
+        """Coalesce status changes into one message edit per status interval."""
+        task = self._pending_updates.get(channel_id)
+        if task is None or task.done():
+            self._pending_updates[channel_id] = asyncio.create_task(self._update_status_message(channel_id))
+
+    async def _update_status_message(self, channel_id: int):
+        """Send or edit the consolidated status message for a channel."""
+        await asyncio.sleep(self.status_interval)
+        channel = self._channels.get(channel_id)
+        statuses = self._statuses.get(channel_id, {})
+        failures = self._failures.get(channel_id, {})
+        message = self._status_messages.get(channel_id)
+
+        failure_lines = [f"• {server_url}: ❌ {text}" for server_url, text in sorted(failures.items())]
+        if statuses:
+            content = "⚠️ **Reconnecting**\n" + "\n".join(
+                [f"• {server_url}: {text}" for server_url, text in sorted(statuses.items())] + failure_lines
+            )
+        elif failures:
+            content = "❌ **Connection lost**\n" + "\n".join(failure_lines)
+        elif message is not None:
+            content = "✅ All connections restored"
+        else:
+            return
+
+        try:
+            if message is not None:
+                await message.edit(content=content)
+            else:
+                self._status_messages[channel_id] = await channel.send(content)
+        except Exception as e:
+            print(f"Error updating reconnect status message: {e}")
+            # The message may have been deleted; post a fresh one next time
+            self._status_messages.pop(channel_id, None)
+
+        if not statuses:
+            # Every server is back or has given up, the next outage gets a new message
+            self._status_messages.pop(channel_id, None)
+            self._statuses.pop(channel_id, None)
+            self._failures.pop(channel_id, None)
+            self._channels.pop(channel_id, None)
+
+
+# Shared by every listener and connection helper in the process
+reconnect_scheduler = ReconnectScheduler()
+
+
+class ConnectionHeartbeat:
+    """
+    Per-connection keepalive that measures round-trip time continuously.
+
+    Keeps a smoothed RTT (EWMA) with its mean deviation, recent samples for percentiles,
+    and a pong timeout derived from them. A connection that misses max_missed pongs in a
+    row is aborted so the listener can reconnect straight away. One heartbeat is reused
+    across reconnects so its statistics cover the whole tracking session.
+    """
+
+    def __init__(self, interval: float = 15.0, min_timeout: float = 2.0, max_timeout: float = 20.0,
+                 max_missed: int = 2, alpha: float = 0.125, beta: float = 0.25, sample_size: int = 200):
+        self.interval = interval
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.max_missed = max_missed
+        self.alpha = alpha
+        self.beta = beta
+
+        self.samples: deque = deque(maxlen=sample_size)
+        self.smoothed_rtt: Optional[float] = None
+        self.rtt_deviation = 0.0
+        self.missed_pongs = 0
+        self.consecutive_missed = 0
+        self.last_pong: Optional[float] = None
+
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pong_timeout(self) -> float:
+        """Pong timeout adapted to the observed RTT (smoothed RTT plus four deviations)."""
+        if self.smoothed_rtt is None:
+            return self.max_timeout
+        return min(max(self.smoothed_rtt + 4 * self.rtt_deviation, self.min_timeout), self.max_timeout)
+
+    def record_rtt(self, rtt: float):
+        """Fold a new RTT sample into the smoothed estimates."""
+        self.samples.append(rtt)
+        if self.smoothed_rtt is None:
+            self.smoothed_rtt = rtt
+            self.rtt_deviation = rtt / 2
+        else:
+            self.rtt_deviation = (1 - self.beta) * self.rtt_deviation + self.beta * abs(self.smoothed_rtt - rtt)
+            self.smoothed_rtt = (1 - self.alpha) * self.smoothed_rtt + self.alpha * rtt
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Nearest-rank percentile of the recent RTT samples, in seconds."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+    async def ping_once(self, websocket) -> bool:
+        """Send one ping and wait for the pong. Returns True if it arrived in time."""
+        started = time.monotonic()
+        try:
+            pong_waiter = await websocket.ping()
+            await asyncio.wait_for(pong_waiter, timeout=self.pong_timeout)
+        except asyncio.TimeoutError:
+            self.missed_pongs += 1
+            self.consecutive_missed += 1
+            print(f"Pong not received within {self.pong_timeout:.1f}s ({self.consecutive_missed} missed in a row)")
+            return False
+
+        self.last_pong = time.monotonic()
+        self.record_rtt(self.last_pong - started)
+        self.consecutive_missed = 0
+        return True
+
+    def start(self, websocket):
+        """Start the heartbeat task for a newly opened websocket."""
+        self.stop()
+        self.consecutive_missed = 0
+        self._task = asyncio.create_task(self._run(websocket))
+
+    def stop(self):
+        """Stop the heartbeat task, e.g. when the websocket is closed."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _run(self, websocket):
+        """Ping on a fixed interval and abort the connection once too many pongs are missed."""
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                if await self.ping_once(websocket):
+                    continue
+                if self.consecutive_missed >= self.max_missed:
+                    print(f"Missed {self.consecutive_missed} pongs, dropping dead connection")
+                    transport = getattr(websocket, "transport", None)
+                    if transport is not None:
+                        transport.abort()
+                    else:
+                        await websocket.close()
+                    return
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of heartbeat statistics, with RTTs in milliseconds."""
+        def to_ms(value):
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "rtt_ms": to_ms(self.smoothed_rtt),
+            "p50_ms": to_ms(self.percentile(50)),
+            "p95_ms": to_ms(self.percentile(95)),
+            "p99_ms": to_ms(self.percentile(99)),
+            "pong_timeout": round(self.pong_timeout, 1),
+            "missed_pongs": self.missed_pongs,
+            "samples": len(self.samples)
+        }
+
+
+class AnnouncementDedupe:
+    """Bounded set of already-handled (sender, location) checks, evicting the oldest entries first."""
+
+    def __init__(self, max_size: int = 20000):
+        self.max_size = max_size
+        self._seen: OrderedDict = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add(self, key: Hashable) -> bool:
+        """Record a key. Returns True if it was new, False if it had already been seen."""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return False
+
+        self._seen[key] = None
+        if len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        return True
+
+    def update(self, keys: Iterable[Hashable]):
+        """Record several keys at once."""
+        for key in keys:
+            self.add(key)
+
+
+class ConnectionBroker:
+    """
+    Shared access to a tracked server's connection.
+
+    The tracker listener attaches its websocket once connected and passes every incoming
+    message through dispatch(), so slot info and DataPackage entries can be served from that
+    one authenticated connection instead of each feature opening (and handshaking) its own.
+    DataPackage entries are cached per game and only missing games are ever requested.
+
+    DataPackage replies carry nothing tying them to a request, but the server answers a
+    client's requests in order, so each expected reply is queued with its owner: the tracker's
+    own replies still go to the tracker, and only replies to brokered requests are consumed.
+    """
+
+    def __init__(self, server_url: str):
+        self.server_url = server_url
+        self.websocket = None
+        self.connected_msg: Optional[dict] = None
+        self.game_data: Dict[str, Any] = {}
+        self._waiters: List[Tuple[Callable[[dict], bool], asyncio.Future]] = []
+        self._datapackage_replies: deque = deque()  # owner per expected DataPackage: None for the tracker
+        self.served = 0  # requests answered without a separate connection
+
+    @property
+    def attached(self) -> bool:
+        return (self.websocket is not None and self.connected_msg is not None
+                and getattr(self.websocket, "close_code", None) is None)
+
+    def attach(self, websocket, connected_msg: dict, tracker_datapackage_pending: bool = False):
+        """Start serving from a connection; tracker_datapackage_pending if the tracker has asked for a DataPackage."""
+        self.websocket = websocket
+        self.connected_msg = connected_msg
+        self._datapackage_replies.clear()
+        if tracker_datapackage_pending:
+            self._datapackage_replies.append(None)
+
+    def detach(self):
+        self.websocket = None
+        futures = [future for _, future in self._waiters]
+        futures.extend(owner for owner in self._datapackage_replies if owner is not None)
+        for future in futures:
+            if not future.done():
+                future.set_exception(ConnectionError(f"Tracker connection to {self.server_url} closed"))
+        self._waiters.clear()
+        self._datapackage_replies.clear()
+
+    def dispatch(self, msg: dict) -> bool:
+        """
+        Offer an incoming tracker message to pending brokered requests.
+
+        Returns:
+            bool: True if it answered a brokered request and shouldn't be processed as a tracked event
+        """
+        if msg.get("cmd") == "DataPackage":
+            self.game_data.update(msg.get("data", {}).get("games", {}))
+            owner = self._datapackage_replies.popleft() if self._datapackage_replies else None
+            if owner is None:
+                return False  # The tracker's own request (or unsolicited)
+            if not owner.done():
+                owner.set_result(msg)
+            # Consumed even if the requester gave up, so a partial package never replaces the tracker's
+            return True
+        for matcher, future in self._waiters:
+            if not future.done() and matcher(msg):
+                future.set_result(msg)
+                self._waiters = [waiter for waiter in self._waiters if waiter[1] is not future]
+                return True
+        return False
+
+    async def request(self, message: dict, matcher: Callable[[dict], bool], timeout: float = 15.0) -> dict:
+        """Send a message over the tracker connection and wait for the reply the matcher accepts."""
+        if not self.attached:
+            raise ConnectionError(f"No tracker connection to {self.server_url}")
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((matcher, future))
+        try:
+            await self.websocket.send(json.dumps([message]))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._waiters = [waiter for waiter in self._waiters if waiter[1] is not future]
+
+    def players(self) -> Dict[int, Dict[str, str]]:
+        """{player_id: {"name": ..., "game": ...}} from the tracker's Connected message."""
+        slot_info = (self.connected_msg or {}).get("slot_info", {})
+        return {
+            int(slot_id): {
+                "name": player_info.get("name", f"Player {slot_id}"),
+                "game": player_info.get("game", "Unknown")
+            }
+            for slot_id, player_info in slot_info.items()
+        }
+
+    async def datapackage(self, games: Iterable[str], known: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        DataPackage entries for the given games, requesting only games that neither the
+        broker's cache nor the caller's known game data already has.
+        """
+        known = known or {}
+        games = [game for game in set(games) if game]
+        missing = [game for game in games if game not in self.game_data and game not in known]
+        if missing:
+            if not self.attached:
+                raise ConnectionError(f"No tracker connection to {self.server_url}")
+            print(f"Requesting DataPackage over the tracker connection for: {missing}")
+            future = asyncio.get_running_loop().create_future()
+            self._datapackage_replies.append(future)
+            await self.websocket.send(json.dumps([{"cmd": "GetDataPackage", "games": missing}]))
+            await asyncio.wait_for(future, 15.0)
+        self.served += 1
+        return {game: self.game_data[game] if game in self.game_data else known[game]
+                for game in games if game in self.game_data or game in known}
+
+
+# One broker per server URL, shared by the tracker listener and the commands that need server data
+connection_brokers: Dict[str, ConnectionBroker] = {}
+
+
+def get_connection_broker(server_url: str) -> ConnectionBroker:
+    broker = connection_brokers.get(server_url)
+    if broker is None:
+        broker = connection_brokers[server_url] = ConnectionBroker(server_url)
+    return broker
+
+
 class WebSocketMessageProcessor:
     """Handles WebSocket message processing and connection state."""
 
@@ -79,22 +453,36 @@ class WebSocketMessageProcessor:
         self.connection_stable = False
         self.stable_message_count = 0
 
-    async def process_connection_message(self, msg: dict, channel, connection_data: Dict, websocket):
-        """Process Connected message and handle initial setup."""
+    async def process_connection_message(self, msg: dict, channel, connection_data: Dict, websocket,
+                                         server_key: Optional[str] = None, resumed: bool = False,
+                                         request_data_package: bool = True):
+        """
+        Process Connected message and handle initial setup.
+
+        On a resumed connection the Discord announcement is skipped, and the DataPackage
+        request can be skipped when the caller already has current game data.
+        """
         if msg.get("cmd") == "Connected" and not self.connection_confirmed:
             self.connection_confirmed = True
             server_url = websocket.remote_address
-            await channel.send(f"🔗 Successfully connected to Archipelago server: {server_url}")
+            if resumed:
+                print(f"Resumed connection to Archipelago server: {server_url}")
+            else:
+                await channel.send(f"🔗 Successfully connected to Archipelago server: {server_url}")
 
-            # Store connection data for player lookups
-            server_key = f"connection_{len(connection_data)}"
+            # Store connection data for player lookups, replacing any data from a previous connection
+            if server_key is None:
+                server_key = f"connection_{len(connection_data)}"
             connection_data[server_key] = msg
             print(f"Stored connection data: {msg.get('slot_info', {})}")
 
             # Request DataPackage
-            slot_info = msg.get("slot_info", {})
-            manager = WebSocketConnectionManager()
-            await manager.request_data_package(websocket, slot_info)
+            if request_data_package:
+                slot_info = msg.get("slot_info", {})
+                manager = WebSocketConnectionManager()
+                await manager.request_data_package(websocket, slot_info)
+            else:
+                print("DataPackage checksums unchanged, skipping DataPackage request")
 
             return True
         return False
@@ -122,11 +510,19 @@ class WebSocketErrorHandler:
     """Handles WebSocket errors and retry logic."""
 
     @staticmethod
-    async def handle_timeout_error(connection_confirmed: bool, websocket) -> bool:
+    async def handle_timeout_error(connection_confirmed: bool, websocket,
+                                   heartbeat: Optional[ConnectionHeartbeat] = None) -> bool:
         """Handle timeout errors. Returns True if connection should continue."""
         if not connection_confirmed:
             print("Connection timeout during initial handshake")
             raise websockets.exceptions.ConnectionClosed(None, None)
+        elif heartbeat is not None:
+            print("No message received in 120 seconds, checking connection...")
+            # Use the heartbeat so the pong timeout follows the measured RTT
+            if await heartbeat.ping_once(websocket):
+                print("Connection is still alive")
+                return True
+            raise websockets.exceptions.ConnectionClosed(None, None)
         else:
             print("No message received in 120 seconds, checking connection...")
             # Send a ping to check if connection is still alive
@@ -171,7 +567,8 @@ class WebSocketErrorHandler:
 
 async def websocket_listener_main_loop(server_url: str, channel, password: Optional[str],
                                      active_connections: Dict, connection_data: Dict,
-                                     process_ap_message_func: Callable):
+                                     process_ap_message_func: Callable,
+                                     resume_func: Optional[Callable] = None):
     """
     Main WebSocket listener loop with connection management and retry logic.
 
@@ -182,12 +579,24 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
         active_connections: Dictionary to track active connections
         connection_data: Dictionary to store connection data
         process_ap_message_func: Function to process individual AP messages
+        resume_func: Optional coroutine called with the Connected message after a reconnect.
+                     It reconciles tracker state and returns True if the cached DataPackage is still current.
     """
     manager = WebSocketConnectionManager()
     error_handler = WebSocketErrorHandler()
 
     websocket = None
     reconnect_attempts = 0
+    # True once any connection attempt has been confirmed, or if the tracker was resumed after a restart
+    has_connected = active_connections.get(server_url, {}).get("resumed", False)
+
+    # Keepalive and RTT statistics, shared across reconnects and exposed via the connection entry
+    heartbeat = ConnectionHeartbeat()
+    if server_url in active_connections:
+        active_connections[server_url]["heartbeat"] = heartbeat
+
+    # Lets other commands use this connection for server data instead of opening their own
+    broker = get_connection_broker(server_url)
 
     while reconnect_attempts <= manager.max_reconnect_attempts:
         message_processor = WebSocketMessageProcessor()
@@ -196,19 +605,26 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
             if reconnect_attempts > 0:
                 # Calculate exponential backoff delay
                 delay = manager.calculate_backoff_delay(reconnect_attempts)
-                await channel.send(f"⚠️ Connection lost to {server_url}, reconnecting in {delay} seconds... (attempt {reconnect_attempts}/{manager.max_reconnect_attempts})")
-                print(f"Waiting {delay} seconds before reconnect attempt {reconnect_attempts}")
+                reconnect_scheduler.set_status(
+                    channel, server_url,
+                    f"connection lost, retrying (attempt {reconnect_attempts}/{manager.max_reconnect_attempts})"
+                )
+                print(f"Waiting {delay:.1f} seconds before reconnect attempt {reconnect_attempts}")
                 await asyncio.sleep(delay)
 
             print(f"Attempting to connect to {server_url} (attempt {reconnect_attempts + 1})")
 
-            # Create connection
-            websocket = await manager.create_connection(server_url)
+            # Create connection, sharing the global attempt cap with other clients
+            async with reconnect_scheduler.connection_slot():
+                websocket = await manager.create_connection(server_url)
             print(f"Successfully connected to {server_url}")
+            heartbeat.start(websocket)
 
-            # Update the connection tracking with the websocket
+            # Update the connection tracking with the websocket, flagging reconnects so
+            # the tracker can suppress repeat announcements
             if server_url in active_connections:
                 active_connections[server_url]["websocket"] = websocket
+                active_connections[server_url]["resumed"] = has_connected
 
             # Send initial handshake
             await manager.send_initial_handshake(websocket, password)
@@ -227,16 +643,36 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
 
                             # Process different message types
                             for msg in data:
+                                # Reconcile tracker state before confirming a resumed connection
+                                data_package_current = False
+                                if (has_connected and resume_func and msg.get("cmd") == "Connected"
+                                        and not message_processor.connection_confirmed):
+                                    try:
+                                        data_package_current = await resume_func(msg)
+                                    except Exception as resume_error:
+                                        print(f"Error reconciling state after reconnect: {resume_error}")
+
                                 # Handle connection confirmation
                                 if await message_processor.process_connection_message(
-                                    msg, channel, connection_data, websocket
+                                    msg, channel, connection_data, websocket, server_url,
+                                    resumed=has_connected, request_data_package=not data_package_current
                                 ):
+                                    has_connected = True
+                                    broker.attach(websocket, msg, tracker_datapackage_pending=not data_package_current)
+                                    reconnect_scheduler.clear_status(channel, server_url)
+                                    if server_url in active_connections:
+                                        connection = active_connections[server_url]
+                                        connection["connect_count"] = connection.get("connect_count", 0) + 1
                                     continue
 
                                 # Handle connection rejection
                                 if await message_processor.process_connection_refused(msg, channel):
                                     return
 
+                                # Replies to brokered requests aren't tracked events
+                                if broker.dispatch(msg):
+                                    continue
+
                                 # Process all messages
                                 try:
                                     is_complete = await process_ap_message_func(msg, channel)
@@ -249,6 +685,7 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
                                         # Close websocket gracefully
                                         if websocket:
                                             await websocket.close()
+                                        broker.detach()
 
                                         # Remove from active connections
                                         if server_url in active_connections:
@@ -271,7 +708,7 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
 
                     except asyncio.TimeoutError:
                         if await error_handler.handle_timeout_error(
-                            message_processor.connection_confirmed, websocket
+                            message_processor.connection_confirmed, websocket, heartbeat
                         ):
                             continue
 
@@ -288,6 +725,7 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
 
             except (websockets.exceptions.ConnectionClosed, Exception) as conn_error:
                 print(f"Connection error: {conn_error}")
+                broker.detach()
 
                 # Determine if we should retry
                 should_retry, new_attempts = error_handler.should_retry_connection(
@@ -327,10 +765,15 @@ async def websocket_listener_main_loop(server_url: str, channel, password: Optio
 
         finally:
             # Clean up websocket connection for this attempt
+            heartbeat.stop()
             await error_handler.cleanup_websocket(websocket)
             websocket = None
+            if server_url in active_connections:
+                active_connections[server_url]["websocket"] = None
 
-    # Final cleanup
+    # Final cleanup; a server still reconnecting at this point never made it back
+    heartbeat.stop()
+    reconnect_scheduler.give_up(channel, server_url, f"gave up after {manager.max_reconnect_attempts} attempts")
     print(f"Websocket listener for {server_url} is exiting")
     if server_url in active_connections:
         del active_connections[server_url]
\ No newline at end of file
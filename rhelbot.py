@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 import logging
 import os
+import asyncio
 
 # Setting up logs
 rhelbot_logs = logging.getLogger("discord")
@@ -18,7 +19,10 @@ intents.members = True
 rhelbot = commands.Bot(command_prefix="!rhel", intents=intents)
 
 # Store active Archipelago connections across cog reloads
-# Format: {server_url: {'task': asyncio.Task, 'channel_id': int, 'password': str, 'websocket': websocket}}
+# Format: {server_url: {'task': asyncio.Task, 'channel_id': int, 'password': str, 'password_ref': str,
+#                       'websocket': websocket, 'journal': EventJournal, 'announced': AnnouncementDedupe,
+#                       'resumed': bool, 'connect_count': int, 'heartbeat': ConnectionHeartbeat,
+#                       'room_info': dict, 'dashboard_message_id': int}}
 rhelbot.active_ap_connections = {}
 
 waltzServer = discord.Object(id=266039174333726725)
@@ -67,6 +71,19 @@ async def setup_hook():
     for guild in rhelbot.guilds:
         await rhelbot.tree.sync(guild=guild)
 
+    # Resume servers that were tracked before the last restart once the bot is ready
+    ap_cog = rhelbot.get_cog("ApCog")
+    if ap_cog:
+        # Keep a reference so the task isn't garbage collected before it finishes
+        rhelbot.resume_task = asyncio.create_task(ap_cog.resume_tracked_servers())
+        rhelbot.resume_task.add_done_callback(log_resume_failure)
+
+
+def log_resume_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Error resuming tracked servers: {task.exception()}")
+        rhelbot_logs.error("Error resuming tracked servers", exc_info=task.exception())
+
 
 @rhelbot.event
 async def on_ready():